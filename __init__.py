@@ -72,6 +72,7 @@ registerables = (
 )
 
 
+@lib.preferences.watch_preference_updates
 class NDPreferences(AddonPreferences):
     bl_idname = __name__
 
@@ -120,6 +121,11 @@ class NDPreferences(AddonPreferences):
         default=True,
     )
 
+    use_auto_booleans: BoolProperty(
+        name="Automatically choose the boolean solver (measures Fast vs. Exact per modifier)",
+        default=False,
+    )
+
     enable_sidebar: BoolProperty(
         name="Enable the sidebar / N-panel (requires Blender restart)",
         default=True,
@@ -145,6 +151,29 @@ class NDPreferences(AddonPreferences):
         default=True,
     )
 
+    enable_profiling: BoolProperty(
+        name="Enable Operator Profiling",
+        default=False,
+    )
+
+    profiling_trace_path: StringProperty(
+        name="Profiling Trace Directory",
+        subtype='DIR_PATH',
+    )
+
+    enable_draft_mode: BoolProperty(
+        name="Enable Draft Mode",
+        default=True,
+    )
+
+    draft_idle_timeout: FloatProperty(
+        name="Draft Mode Idle Timeout (seconds)",
+        default=0.5,
+        min=0.1,
+        max=10,
+        step=10,
+    )
+
     overlay_pin_x: IntProperty(
         name="Overlay Pin X Coordinate",
         default=0,
@@ -209,6 +238,11 @@ class NDPreferences(AddonPreferences):
         default="Utils",
     )
 
+    overlay_offscreen_rendering: BoolProperty(
+        name="Render Overlay Offscreen",
+        default=False,
+    )
+
     overlay_dpi: IntProperty(
         name="Overlay DPI",
         default=72,
@@ -455,6 +489,7 @@ class NDPreferences(AddonPreferences):
         general_prefs = [
             "utils_collection_name",
             "use_fast_booleans",
+            "use_auto_booleans",
             "recon_poly_solidify",
             "recon_poly_inscribed"]
 
@@ -468,7 +503,11 @@ class NDPreferences(AddonPreferences):
             ["Set a path for a custom screw heads .blend file", "custom_screw_heads_path", False],
             ["Automatically check if addon is up to date when Blender starts", "enable_update_check", False],
             ["Enable deprecated features for short term backwards compatibility", "enable_deprecated_features", False],
-            ["Enable experimental features. Use at your own risk!", "enable_experimental_features", False]]
+            ["Enable experimental features. Use at your own risk!", "enable_experimental_features", False],
+            ["Time each operator event and overlay redraw, and write a trace file (chrome://tracing / Perfetto) on completion", "enable_profiling", False],
+            ["Directory for profiling trace files (defaults to the system temp directory)", "profiling_trace_path", False],
+            ["Use cheaper modifier settings while adjusting values on heavy stacks, restoring full quality when idle or on confirm", "enable_draft_mode", False],
+            ["How long to wait after the last adjustment before restoring full quality", "draft_idle_timeout", False]]
 
         for label, prop, expanded in general_boxed_prefs:
             pref_box = box.box()
@@ -483,6 +522,7 @@ class NDPreferences(AddonPreferences):
     def draw_ui(self, box):
         ui_prefs = [
             ["overlay_dpi"],
+            ["overlay_offscreen_rendering"],
             ["enable_mouse_values"],
             ["mouse_value_scalar"],
             ["mouse_value_steps"],
@@ -592,13 +632,17 @@ def register():
     lib.reload()
 
     bpy.utils.register_class(NDPreferences)
+    lib.preferences.register_preferences_handlers()
+    lib.recall.register()
+    lib.dependencies.register_dependency_handlers()
+    lib.modifier_registry.register_registry_handlers()
 
     for registerable in registerables:
         registerable.reload()
         registerable.register()
 
     version = '.'.join([str(v) for v in bl_info['version']])
-    prefs = lib.preferences.get_preferences()
+    prefs = lib.preferences.get_addon_preferences()
 
     if prefs.enable_update_check:
         prefs.update_available = lib.updates.update_available(bl_info['version'])
@@ -629,4 +673,8 @@ def unregister():
     for registerable in registerables:
         registerable.unregister()
 
+    lib.modifier_registry.unregister_registry_handlers()
+    lib.dependencies.unregister_dependency_handlers()
+    lib.recall.unregister()
+    lib.preferences.unregister_preferences_handlers()
     bpy.utils.unregister_class(NDPreferences)
\ No newline at end of file
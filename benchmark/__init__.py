@@ -0,0 +1,210 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+# Headless benchmark suite for ND's modal operators.
+#
+# Builds synthetic scenes, replays scripted event sequences through each
+# operator's invoke / modal methods, and writes per-phase and per-event wall
+# times (including depsgraph evaluation after each operate call) to JSON.
+#
+# The benchmark wipes the current scene between runs, so only run it against
+# an empty / throwaway file, e.g.
+#
+#   blender -b --addons nd --python-expr "from nd import benchmark; benchmark.main()" -- --sizes 1000 100000 --output nd.json
+
+import bpy
+import sys
+import json
+import platform
+import argparse
+import traceback
+from time import perf_counter
+from datetime import datetime, timezone
+from mathutils import Vector
+from . harness import BenchmarkEvent, BenchmarkRegion, BenchmarkRegionView3D, BenchmarkContext, PhaseTimer, build_operator_harness, instrument, time_depsgraph
+from . scenes import reset_scene
+from . scenarios import EventScript, scenarios, project
+from .. lib import overlay, axis, points
+
+
+default_sizes = (1000, 10000, 100000, 1000000)
+instrumented_phases = ('do_invoke', 'do_modal', 'operate', 'recalculate_points', 'finish', 'revert')
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0
+
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+
+    return ordered[index]
+
+
+def summarise(values):
+    return {
+        'count': len(values),
+        'total': sum(values),
+        'mean': sum(values) / len(values) if values else 0,
+        'p50': percentile(values, 0.5),
+        'p99': percentile(values, 0.99),
+        'max': max(values) if values else 0,
+    }
+
+
+def create_view(target):
+    region = BenchmarkRegion(1920, 1080)
+    distance = max(max(target.dimensions), 1)
+    eye = target.location + Vector((1.5, -2, 1.5)) * distance
+
+    return region, BenchmarkRegionView3D(region, eye, target.location)
+
+
+def cleanup_handlers():
+    overlay.unregister_draw_handler()
+    axis.unregister_axis_handler()
+    points.unregister_points_handler()
+
+
+def run_scenario(scenario, vertex_count):
+    result = {
+        'operator': scenario.idname,
+        'requested_vertices': vertex_count,
+        'vertices': 0,
+        'phases': {},
+        'events': [],
+        'status': None,
+        'error': None,
+    }
+
+    timer = PhaseTimer()
+
+    try:
+        reset_scene()
+
+        start = perf_counter()
+        target = scenario.setup(vertex_count)
+        result['phases']['setup'] = perf_counter() - start
+        result['vertices'] = len(target.data.vertices)
+
+        region, region_3d = create_view(target)
+        context = BenchmarkContext(region, region_3d)
+
+        x, y = project(region, region_3d, target.location)
+        script = EventScript(x, y)
+        scenario.script(script, region, region_3d, target)
+
+        harness = build_operator_harness(scenario.operator)
+        instrument(harness, timer, instrumented_phases)
+
+        start = perf_counter()
+        status = harness.invoke(context, BenchmarkEvent('LEFTMOUSE', 'RELEASE', script.x, script.y))
+        result['phases']['invoke'] = {
+            'wall': perf_counter() - start,
+            'depsgraph': time_depsgraph(context),
+            **timer.timings,
+        }
+
+        modal_times = []
+        depsgraph_times = []
+
+        for step in script.steps:
+            if 'RUNNING_MODAL' not in status:
+                break
+
+            if not isinstance(step, BenchmarkEvent):
+                step()
+                continue
+
+            timer.reset()
+
+            start = perf_counter()
+            status = harness.modal(context, step)
+            elapsed = perf_counter() - start
+
+            depsgraph = time_depsgraph(context) if timer.operated else 0
+
+            result['events'].append({
+                **step.describe(),
+                'return': sorted(status),
+                'wall': elapsed,
+                'depsgraph': depsgraph,
+                **timer.timings,
+            })
+
+            if 'RUNNING_MODAL' in status:
+                modal_times.append(elapsed)
+                depsgraph_times.append(depsgraph)
+            else:
+                result['phases']['finish'] = {'wall': elapsed, 'depsgraph': depsgraph, **timer.timings}
+
+        result['phases']['modal'] = summarise(modal_times)
+        result['phases']['modal_depsgraph'] = summarise(depsgraph_times)
+        result['status'] = sorted(status)
+    except Exception:
+        result['error'] = traceback.format_exc()
+    finally:
+        cleanup_handlers()
+
+    return result
+
+
+def run(sizes=default_sizes, operators=None, output=None):
+    from .. import bl_info
+
+    selected = [s for s in scenarios if operators is None or s.idname in operators]
+
+    report = {
+        'nd_version': '.'.join(str(v) for v in bl_info['version']),
+        'blender_version': bpy.app.version_string,
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'results': [],
+    }
+
+    for vertex_count in sizes:
+        for scenario in selected:
+            result = run_scenario(scenario, vertex_count)
+            report['results'].append(result)
+
+            status = "error" if result['error'] else "ok"
+            print(f"ND benchmark — {scenario.idname} @ {vertex_count} verts: {status}")
+
+    reset_scene()
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return report
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="nd.benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(default_sizes))
+    parser.add_argument('--operators', nargs='+', default=None)
+    parser.add_argument('--output', default="nd_benchmark.json")
+
+    args = parser.parse_args(argv)
+
+    run(args.sizes, args.operators, args.output)
@@ -0,0 +1,216 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from time import perf_counter
+from math import tan, radians
+from mathutils import Matrix
+from .. lib.addons import get_registered_addon_name
+
+
+class BenchmarkEvent:
+    def __init__(self, type, value='NOTHING', mouse_x=0, mouse_y=0, shift=False, ctrl=False, alt=False):
+        self.type = type
+        self.value = value
+        self.shift = shift
+        self.ctrl = ctrl
+        self.alt = alt
+        self.oskey = False
+        self.mouse_x = mouse_x
+        self.mouse_y = mouse_y
+        self.mouse_region_x = mouse_x
+        self.mouse_region_y = mouse_y
+        self.mouse_prev_x = mouse_x
+        self.mouse_prev_y = mouse_y
+
+
+    def describe(self):
+        modifiers = [name for name, held in (('shift', self.shift), ('ctrl', self.ctrl), ('alt', self.alt)) if held]
+
+        return {
+            'type': self.type,
+            'value': self.value,
+            'modifiers': "+".join(modifiers),
+            'mouse': (self.mouse_x, self.mouse_y),
+        }
+
+
+class BenchmarkRegion:
+    type = 'WINDOW'
+
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+
+    def tag_redraw(self):
+        pass
+
+
+class BenchmarkRegionView3D:
+    is_perspective = True
+
+
+    def __init__(self, region, eye, target, fov=50, near=0.01, far=10000):
+        self.view_location = target.copy()
+        self.view_distance = (eye - target).length
+
+        camera = (target - eye).to_track_quat('-Z', 'Y').to_matrix().to_4x4()
+        camera.translation = eye
+
+        self.view_matrix = camera.inverted()
+        self.window_matrix = perspective_matrix(radians(fov), region.width / region.height, near, far)
+        self.perspective_matrix = self.window_matrix @ self.view_matrix
+
+
+class BenchmarkWindow:
+    def __init__(self):
+        self.cursor_warps = 0
+
+
+    def cursor_warp(self, x, y):
+        self.cursor_warps += 1
+
+
+    def cursor_modal_set(self, cursor):
+        pass
+
+
+    def cursor_modal_restore(self):
+        pass
+
+
+class BenchmarkWindowManager:
+    def __init__(self):
+        self.modal_handlers = []
+
+
+    def modal_handler_add(self, operator):
+        self.modal_handlers.append(operator)
+
+        return True
+
+
+    def event_timer_add(self, time_step, window=None):
+        return object()
+
+
+    def event_timer_remove(self, timer):
+        pass
+
+
+class BenchmarkContext:
+    def __init__(self, region, region_3d):
+        self.region = region
+        self.space_data = type("BenchmarkSpaceView3D", (), {'type': 'VIEW_3D', 'region_3d': region_3d})()
+        self.window = BenchmarkWindow()
+        self.window_manager = BenchmarkWindowManager()
+
+
+    def __getattr__(self, name):
+        return getattr(bpy.context, name)
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.reset()
+
+
+    def reset(self):
+        self.timings = {}
+        self.operated = False
+
+
+    def wrap(self, phase, func):
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(phase, perf_counter() - start)
+                if phase == 'operate':
+                    self.operated = True
+
+        return timed
+
+
+    def add(self, phase, elapsed):
+        self.timings[phase] = self.timings.get(phase, 0) + elapsed
+
+
+def perspective_matrix(fov, aspect, near, far):
+    f = 1 / tan(fov / 2)
+
+    return Matrix((
+        (f / aspect, 0, 0, 0),
+        (0, f, 0, 0),
+        (0, 0, (far + near) / (near - far), (2 * far * near) / (near - far)),
+        (0, 0, -1, 0),
+    ))
+
+
+def harness_report(self, type, message):
+    self.reports.append((sorted(type), message))
+
+
+def build_operator_harness(operator_class):
+    # Registered operators can only be instantiated by Blender itself, so the
+    # benchmark replays the class hierarchy (minus the bpy bases) onto a plain
+    # Python class and drives its invoke / modal methods directly.
+    addon = get_registered_addon_name()
+    namespace = {}
+
+    for base in reversed(operator_class.__mro__):
+        if not base.__module__.startswith(addon):
+            continue
+
+        for name, value in base.__dict__.items():
+            if name.startswith('__') or name == 'bl_rna':
+                continue
+
+            namespace[name] = value
+
+    namespace['report'] = harness_report
+
+    harness_class = type("Benchmark_" + operator_class.__name__, (), namespace)
+    harness = harness_class()
+    harness.reports = []
+
+    for base in reversed(operator_class.__mro__):
+        for name, prop in base.__dict__.get('__annotations__', {}).items():
+            keywords = getattr(prop, 'keywords', {})
+            setattr(harness, name, keywords.get('default'))
+
+    return harness
+
+
+def instrument(harness, timer, phases):
+    for phase in phases:
+        method = getattr(harness, phase, None)
+        if method is not None:
+            setattr(harness, phase, timer.wrap(phase, method))
+
+
+def time_depsgraph(context):
+    start = perf_counter()
+    context.evaluated_depsgraph_get()
+
+    return perf_counter() - start
@@ -0,0 +1,159 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+from bpy_extras.view3d_utils import location_3d_to_region_2d
+from mathutils import Vector
+from . harness import BenchmarkEvent
+from . scenes import single_object, target_and_cutter, reference_and_target, select_all_faces
+from .. bevels.bevel import ND_OT_bevel
+from .. booleans.boolean_inset import ND_OT_bool_inset
+from .. replicate.circular_array import ND_OT_circular_array
+from .. utils.snap_align import ND_OT_snap_align
+from .. sketch.panel import ND_OT_panel
+
+
+class EventScript:
+    def __init__(self, x, y):
+        self.x = int(x)
+        self.y = int(y)
+        self.steps = []
+
+
+    def event(self, type, value='NOTHING', **modifiers):
+        self.steps.append(BenchmarkEvent(type, value, self.x, self.y, **modifiers))
+
+
+    def move(self, dx=0, dy=0, **modifiers):
+        self.x += int(dx)
+        self.y += int(dy)
+        self.event('MOUSEMOVE', **modifiers)
+
+
+    def drag(self, dx, count, dy=0, **modifiers):
+        for _ in range(count):
+            self.move(dx, dy, **modifiers)
+
+
+    def tap(self, type, **modifiers):
+        self.event(type, 'PRESS', **modifiers)
+        self.event(type, 'RELEASE', **modifiers)
+
+
+    def wheel(self, type, count, **modifiers):
+        for _ in range(count):
+            self.event(type, 'PRESS', **modifiers)
+
+
+    def call(self, func):
+        self.steps.append(func)
+
+
+    def confirm(self):
+        self.tap('LEFTMOUSE')
+
+
+    def cancel(self):
+        self.tap('RIGHTMOUSE')
+
+
+class Scenario:
+    def __init__(self, operator, setup, script):
+        self.operator = operator
+        self.setup = setup
+        self.script = script
+
+
+    @property
+    def idname(self):
+        return self.operator.bl_idname
+
+
+def project(region, region_3d, co):
+    coords = location_3d_to_region_2d(region, region_3d, co)
+
+    return coords if coords is not None else Vector((region.width / 2, region.height / 2))
+
+
+def bevel_script(script, region, region_3d, target):
+    script.drag(4, 60)
+    script.drag(-2, 20, shift=True)
+    script.drag(4, 30, alt=True)
+    script.drag(2, 30, ctrl=True)
+    script.wheel('WHEELUPMOUSE', 5)
+    script.tap('H')
+    script.tap('A')
+    script.confirm()
+
+
+def boolean_inset_script(script, region, region_3d, target):
+    script.drag(2, 60)
+    script.drag(-1, 20, shift=True)
+    script.wheel('WHEELDOWNMOUSE', 5)
+    script.tap('M')
+    script.confirm()
+
+
+def circular_array_script(script, region, region_3d, target):
+    script.drag(4, 60)
+    script.drag(4, 30, alt=True)
+    script.drag(2, 30, ctrl=True)
+    script.wheel('WHEELUPMOUSE', 5)
+    script.tap('A')
+    script.tap('D')
+    script.confirm()
+
+
+def snap_align_script(script, region, region_3d, target):
+    extent = max(target.dimensions) * 0.45
+    corners = [target.matrix_world @ Vector((x, y, extent)) for x, y in ((-extent, -extent), (extent, extent), (extent, -extent))]
+    start, capture_a, capture_b = [project(region, region_3d, co) for co in corners]
+
+    script.x, script.y = int(start.x), int(start.y)
+    script.move()
+
+    for goal in (capture_a, capture_b):
+        steps = 40
+        dx = (goal.x - script.x) / steps
+        dy = (goal.y - script.y) / steps
+        script.drag(dx, steps, dy=dy)
+        script.tap('C')
+
+    script.confirm()
+
+
+def panel_script(script, region, region_3d, target):
+    script.call(select_all_faces)
+    script.tap('SPACE')
+    script.drag(1, 60)
+    script.tap('F')
+    script.drag(-1, 20, shift=True)
+
+    # Confirming hands over to nd.solidify via INVOKE_DEFAULT, which requires a
+    # real window; the panel scenario therefore measures up to cancellation.
+    script.cancel()
+
+
+scenarios = (
+    Scenario(ND_OT_bevel, single_object, bevel_script),
+    Scenario(ND_OT_bool_inset, target_and_cutter, boolean_inset_script),
+    Scenario(ND_OT_circular_array, single_object, circular_array_script),
+    Scenario(ND_OT_snap_align, reference_and_target, snap_align_script),
+    Scenario(ND_OT_panel, single_object, panel_script),
+)
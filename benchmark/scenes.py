@@ -0,0 +1,96 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+import bmesh
+from math import sqrt, radians
+
+
+def reset_scene():
+    if bpy.context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    for collection in list(bpy.data.collections):
+        bpy.data.collections.remove(collection)
+
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def create_box(name, vertex_count, size=2, location=(0, 0, 0)):
+    # A cube with n cuts per edge has roughly 6 * (n + 1)^2 vertices.
+    cuts = max(0, round(sqrt(vertex_count / 6)) - 1)
+
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=size)
+
+    if cuts > 0:
+        bmesh.ops.subdivide_edges(bm, edges=bm.edges[:], cuts=cuts, use_grid_fill=True)
+
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.scene.collection.objects.link(obj)
+
+    return obj
+
+
+def select_objects(objects, active):
+    for obj in bpy.context.view_layer.objects:
+        obj.select_set(obj in objects)
+
+    bpy.context.view_layer.objects.active = active
+
+
+def single_object(vertex_count):
+    target = create_box("ND Benchmark Target", vertex_count)
+    select_objects([target], target)
+
+    return target
+
+
+def target_and_cutter(vertex_count):
+    target = create_box("ND Benchmark Target", vertex_count)
+    cutter = create_box("ND Benchmark Cutter", max(8, vertex_count // 10), size=1, location=(0.5, 0.5, 0.5))
+    cutter.rotation_euler = (radians(15), radians(25), 0)
+
+    select_objects([target, cutter], target)
+
+    return target
+
+
+def reference_and_target(vertex_count):
+    target = create_box("ND Benchmark Target", vertex_count)
+    reference = create_box("ND Benchmark Reference", 8, size=0.5, location=(3, 0, 0))
+
+    select_objects([target, reference], target)
+
+    return target
+
+
+def select_all_faces():
+    bpy.ops.mesh.select_all(action='SELECT')
@@ -26,7 +26,8 @@ from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, tog
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_bevel = "Bevel — ND B"
@@ -136,7 +137,7 @@ CTRL — Remove existing modifiers"""
 
     def do_invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND B')
+            remove_nd_modifiers(context.selected_objects, 'nd.bevel')
             return {'FINISHED'}
 
         self.dirty = False
@@ -156,9 +157,8 @@ CTRL — Remove existing modifiers"""
 
         self.target_object = context.active_object
 
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if previous_op:
             self.summon_old_operator(context, mods)
@@ -230,6 +230,10 @@ CTRL — Remove existing modifiers"""
         self.weld = weld
 
 
+    def get_draft_modifiers(self):
+        return [self.bevel]
+
+
     def operate(self, context):
         self.bevel.width = self.width
         self.bevel.segments = self.segments
@@ -257,7 +261,7 @@ CTRL — Remove existing modifiers"""
         self.target_object.show_in_front = False
 
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.bevel.name)
+            remove_modifiers(context.active_object, [self.bevel])
 
         if self.summoned:
             self.bevel.width = self.width_prev
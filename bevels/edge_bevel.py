@@ -20,13 +20,17 @@
 
 import bpy
 import bmesh
+from itertools import repeat
 from math import radians
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers, move_modifier
+from .. lib.modifier_registry import get_nd_modifiers
+from .. lib.selection import has_selected_edges
+from .. lib.edit_mesh import get_selected_edges, get_bevel_weight_layer, queue_edit_mesh_update, flush_edit_mesh_updates
 
 
 mod_bevel = "Bevel — ND EB"
@@ -144,7 +148,7 @@ CTRL — Remove existing modifiers"""
 
     def do_invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND EB')
+            remove_nd_modifiers(context.selected_objects, 'nd.edge_bevel')
             for object in context.selected_objects:
                 bm = bmesh.from_edit_mesh(object.data)
                 bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
@@ -178,15 +182,15 @@ CTRL — Remove existing modifiers"""
 
         self.take_edges_snapshot(context)
 
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if previous_op:
             self.summon_old_operator(context, mods)
         else:
             self.prepare_new_operator(context)
 
+        self.capture_selected_edges(context)
         self.operate(context)
 
         capture_modifier_keys(self, None, event.mouse_x)
@@ -201,9 +205,7 @@ CTRL — Remove existing modifiers"""
 
     @classmethod
     def poll(cls, context):
-        if context.mode == 'EDIT_MESH':
-            mesh = bmesh.from_edit_mesh(context.active_object.data)
-            return len([edge for edge in mesh.edges if edge.select]) >= 1
+        return has_selected_edges(context)
 
 
     def prepare_new_operator(self, context):
@@ -241,14 +243,12 @@ CTRL — Remove existing modifiers"""
         self.bevel = bevel
 
         if self.early_apply:
-            while context.active_object.modifiers[0].name != self.bevel.name:
-                bpy.ops.object.modifier_move_up(modifier=self.bevel.name)
+            move_modifier(context.active_object, self.bevel.name, 0)
 
 
     def add_weld_modifier(self, context):
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if not previous_op:
             weld = new_modifier(context.active_object, mod_weld, 'WELD', rectify=True)
@@ -258,24 +258,39 @@ CTRL — Remove existing modifiers"""
             self.weld = weld
 
             if self.early_apply:
-                while context.active_object.modifiers[1].name != self.weld.name:
-                    bpy.ops.object.modifier_move_up(modifier=self.weld.name)
+                move_modifier(context.active_object, self.weld.name, 1)
 
 
     def take_edges_snapshot(self, context):
-        self.edges_snapshot = {}
-        self.edge_weight_average = 0
-        
-        data = context.active_object.data
-        bm = bmesh.from_edit_mesh(data)
-        bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
-    
-        selected_edges = [edge for edge in bm.edges if edge.select]
-        for edge in selected_edges:
-            self.edges_snapshot[edge.index] = edge[bevel_weight_layer]
-            self.edge_weight_average += edge[bevel_weight_layer]
+        bm = bmesh.from_edit_mesh(context.active_object.data)
+        bevel_weight_layer = get_bevel_weight_layer(bm)
+
+        selected_edges = get_selected_edges(bm)
+
+        self.selected_edge_indices = [edge.index for edge in selected_edges]
+        self.edges_snapshot = [edge[bevel_weight_layer] for edge in selected_edges]
+        self.edge_weight_average = sum(self.edges_snapshot) / len(self.edges_snapshot)
+
+
+    def capture_selected_edges(self, context):
+        # Mode switches (e.g. while adding smooth shading) invalidate BMesh
+        # element references, so the handles are (re)captured from the indices.
+        self.bm = bmesh.from_edit_mesh(context.active_object.data)
+        self.bm.edges.ensure_lookup_table()
 
-        self.edge_weight_average /= len(selected_edges)
+        self.bevel_weight_layer = get_bevel_weight_layer(self.bm)
+        self.selected_edges = [self.bm.edges[i] for i in self.selected_edge_indices]
+        self.written_weight = None
+
+
+    def write_edge_weights(self, context, weights):
+        if not self.bm.is_valid:
+            self.capture_selected_edges(context)
+
+        for edge, weight in zip(self.selected_edges, weights):
+            edge[self.bevel_weight_layer] = weight
+
+        queue_edit_mesh_update(context.active_object.data)
 
 
     def operate(self, context):
@@ -284,20 +299,16 @@ CTRL — Remove existing modifiers"""
         self.bevel.profile = self.profile
         self.bevel.harden_normals = self.harden_normals
 
-        data = context.active_object.data
-        bm = bmesh.from_edit_mesh(data)
-        bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
-    
-        selected_edges = [edge for edge in bm.edges if edge.select]
-        for edge in selected_edges:
-            edge[bevel_weight_layer] = self.weight
-    
-        bmesh.update_edit_mesh(data)
+        if self.weight != self.written_weight:
+            self.write_edge_weights(context, repeat(self.weight))
+            self.written_weight = self.weight
 
         self.dirty = False
 
 
     def finish(self, context):
+        flush_edit_mesh_updates()
+
         self.target_object.show_wire = False
         self.target_object.show_in_front = False
         self.add_weld_modifier(context)
@@ -309,22 +320,15 @@ CTRL — Remove existing modifiers"""
         self.target_object.show_in_front = False
 
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.bevel.name)
+            remove_modifiers(context.active_object, [self.bevel])
 
         if self.summoned:
             self.bevel.width = self.width_prev
             self.bevel.segments = self.segments_prev
             self.bevel.profile = self.profile_prev
 
-        data = context.active_object.data
-        bm = bmesh.from_edit_mesh(data)
-        bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
-    
-        selected_edges = [edge for edge in bm.edges if edge.select]
-        for edge in selected_edges:
-            edge[bevel_weight_layer] = self.edges_snapshot[edge.index]
-    
-        bmesh.update_edit_mesh(data)
+        self.write_edge_weights(context, self.edges_snapshot)
+        flush_edit_mesh_updates()
 
         unregister_draw_handler()
 
@@ -26,7 +26,10 @@ from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, tog
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers, move_modifier
+from .. lib.modifier_registry import get_nd_modifiers
+from .. lib.selection import has_selected_verts
+from .. lib.vertex_groups import get_selected_verts, get_vertex_group_membership, assign_vertex_group, unassign_vertex_groups
 
 
 mod_bevel = "Bevel — ND VB"
@@ -128,15 +131,14 @@ CTRL — Remove existing modifiers"""
             for object in context.selected_objects:
                 active_vgroup_names = [vgroup.name for vgroup in object.vertex_groups]
 
-                for mod in object.modifiers:
-                    if mod.type == 'BEVEL' and ' — ND VB' in mod.name and mod.vertex_group and mod.vertex_group in active_vgroup_names:
+                for mod in get_nd_modifiers(object, 'nd.vertex_bevel').values():
+                    if mod.type == 'BEVEL' and mod.vertex_group and mod.vertex_group in active_vgroup_names:
                         old_vgroup_names.append(mod.vertex_group)
 
                 for vgroup_name in old_vgroup_names:
                     object.vertex_groups.remove(object.vertex_groups[vgroup_name])
 
-            remove_modifiers_ending_with(context.selected_objects, ' — ND VB')
-            remove_modifiers_ending_with(context.selected_objects, ' — ND VB LA')
+            remove_nd_modifiers(context.selected_objects, 'nd.vertex_bevel')
 
             return {'FINISHED'}
 
@@ -157,27 +159,26 @@ CTRL — Remove existing modifiers"""
 
         previous_op = False
 
-        bm = bmesh.from_edit_mesh(context.active_object.data)
-        selected_vert_indices = [vert.index for vert in bm.verts if vert.select]
-
-        self.vgroup_match = None
-        for group in context.active_object.vertex_groups:
-            vgroup_vert_indices = [vert.index for vert in context.active_object.data.vertices if group.index in [i.group for i in vert.groups]]
-            if len(set(vgroup_vert_indices) & set(selected_vert_indices)) > 0:
-                if self.vgroup_match:
-                    self.report({'ERROR_INVALID_INPUT'}, "Multiple vertex groups selected, unable to continue operation.")
-                    return {'CANCELLED'}
-                self.vgroup_match = (group, vgroup_vert_indices)
-        
+        data = context.active_object.data
+        bm = bmesh.from_edit_mesh(data)
+        selected_verts = get_selected_verts(bm)
+        membership = get_vertex_group_membership(bm, selected_verts)
+
+        if len(membership) > 1:
+            self.report({'ERROR_INVALID_INPUT'}, "Multiple vertex groups selected, unable to continue operation.")
+            return {'CANCELLED'}
+
+        self.vgroup_match = bool(membership)
+
         if self.vgroup_match:
-            group, vgroup_vert_indices = self.vgroup_match
+            group_index, vgroup_vert_indices = membership.popitem()
 
-            self.group = group
-            self.vgroup_difference = [i for i in selected_vert_indices if i not in vgroup_vert_indices]
+            self.group = context.active_object.vertex_groups[group_index]
+            difference = [vert for vert in selected_verts if vert.index not in vgroup_vert_indices]
+            self.vgroup_difference = [vert.index for vert in difference]
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.group.add(self.vgroup_difference, 1.0, 'ADD')
-            bpy.ops.object.mode_set(mode='EDIT')
+            assign_vertex_group(bm, difference, group_index)
+            bmesh.update_edit_mesh(data, loop_triangles=False, destructive=False)
 
             bpy.ops.mesh.select_all(action='DESELECT')
             bpy.ops.object.vertex_group_set_active(group=self.group.name)
@@ -208,9 +209,7 @@ CTRL — Remove existing modifiers"""
 
     @classmethod
     def poll(cls, context):
-        if context.mode == 'EDIT_MESH':
-            mesh = bmesh.from_edit_mesh(context.active_object.data)
-            return len([vert for vert in mesh.verts if vert.select]) >= 1
+        return has_selected_verts(context)
 
 
     def summon_old_operator(self, context):
@@ -254,14 +253,12 @@ CTRL — Remove existing modifiers"""
         self.bevel = bevel
 
         if not self.late_apply:
-            while context.active_object.modifiers[0].name != self.bevel.name:
-                bpy.ops.object.modifier_move_up(modifier=self.bevel.name)
+            move_modifier(context.active_object, self.bevel.name, 0)
     
 
     def add_weld_modifier(self, context):
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if self.late_apply or not previous_op:
             weld = new_modifier(context.active_object, mod_weld_la if self.late_apply else mod_weld, 'WELD', rectify=False)
@@ -271,8 +268,7 @@ CTRL — Remove existing modifiers"""
             self.weld = weld
 
             if not self.late_apply:
-                while context.active_object.modifiers[1].name != self.weld.name:
-                    bpy.ops.object.modifier_move_up(modifier=self.weld.name)
+                move_modifier(context.active_object, self.weld.name, 1)
 
 
     def operate(self, context):
@@ -307,12 +303,15 @@ CTRL — Remove existing modifiers"""
             self.bevel.profile = self.profile_prev
 
             if self.vgroup_match:
-                bpy.ops.object.mode_set(mode='OBJECT')
-                self.group.remove(self.vgroup_difference)
-                bpy.ops.object.mode_set(mode='EDIT')
+                data = context.active_object.data
+                bm = bmesh.from_edit_mesh(data)
+                bm.verts.ensure_lookup_table()
+
+                unassign_vertex_groups(bm, [bm.verts[i] for i in self.vgroup_difference], [self.group.index])
+                bmesh.update_edit_mesh(data, loop_triangles=False, destructive=False)
 
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.bevel.name)
+            remove_modifiers(context.active_object, [self.bevel])
             context.active_object.vertex_groups.remove(self.vgroup)
 
         unregister_draw_handler()
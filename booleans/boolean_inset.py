@@ -27,7 +27,8 @@ from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.collections import move_to_utils_collection, isolate_in_utils_collection
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_problematic_bevels
+from .. lib.modifiers import new_modifier, remove_problematic_bevels, remove_modifiers
+from .. lib.booleans import get_boolean_solver, use_auto_solver, choose_boolean_solver
 
 
 class ND_OT_bool_inset(BaseOperator):
@@ -86,7 +87,7 @@ class ND_OT_bool_inset(BaseOperator):
 
         self.thickness_input_stream = new_stream()
 
-        solver = 'FAST' if get_preferences().use_fast_booleans else 'EXACT'
+        solver = get_boolean_solver()
 
         a, b = context.selected_objects
         self.reference_obj = a if a.name != context.active_object.name else b
@@ -158,6 +159,10 @@ class ND_OT_bool_inset(BaseOperator):
             return len(context.selected_objects) == 2 and all(obj.type == 'MESH' for obj in context.selected_objects)
 
     
+    def get_draft_modifiers(self):
+        return [self.boolean_diff, self.solidify, self.boolean_isect]
+
+
     def operate(self, context):
         self.solidify.thickness = self.thickness
         self.boolean_diff.operation = 'UNION' if self.outset else 'DIFFERENCE'
@@ -168,6 +173,10 @@ class ND_OT_bool_inset(BaseOperator):
     def finish(self, context):
         self.reference_obj.hide_set(False)
 
+        if use_auto_solver():
+            choose_boolean_solver(context, self.intersecting_obj, self.boolean_isect)
+            choose_boolean_solver(context, self.target_obj, self.boolean_diff)
+
         move_to_utils_collection(self.reference_obj)
         move_to_utils_collection(self.intersecting_obj)
 
@@ -182,7 +191,7 @@ class ND_OT_bool_inset(BaseOperator):
 
 
     def revert(self, context):
-        bpy.ops.object.modifier_remove(modifier=self.boolean_diff.name)
+        remove_modifiers(self.target_obj, [self.boolean_diff])
         bpy.data.meshes.remove(self.intersecting_obj.data, do_unlink=True)
 
         self.reference_obj.display_type = self.reference_obj_display_type_prev
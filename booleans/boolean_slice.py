@@ -20,8 +20,8 @@
 
 import bpy
 from .. lib.collections import move_to_utils_collection, isolate_in_utils_collection
-from .. lib.preferences import get_preferences
 from .. lib.modifiers import new_modifier, remove_problematic_bevels
+from .. lib.booleans import apply_boolean_solver
 
 
 class ND_OT_bool_slice(bpy.types.Operator):
@@ -39,8 +39,6 @@ ALT — Do not clean the reference object's mesh"""
 
 
     def execute(self, context):
-        solver = 'FAST' if get_preferences().use_fast_booleans else 'EXACT'
-
         a, b = context.selected_objects
         reference_obj = a if a.name != context.active_object.name else b
         
@@ -51,15 +49,13 @@ ALT — Do not clean the reference object's mesh"""
         intersecting_obj.animation_data_clear()
         context.collection.objects.link(intersecting_obj)
 
-        boolean_diff = new_modifier(difference_obj, "Difference — ND Bool", 'BOOLEAN', rectify=True)
+        boolean_diff = new_modifier(difference_obj, "Difference — ND Bool", 'BOOLEAN', rectify=True, tag=('nd.bool_slice', 'difference'))
         boolean_diff.operation = 'DIFFERENCE'
         boolean_diff.object = reference_obj
-        boolean_diff.solver = solver
 
-        boolean_isect = new_modifier(intersecting_obj, "Intersection — ND Bool", 'BOOLEAN', rectify=True)
+        boolean_isect = new_modifier(intersecting_obj, "Intersection — ND Bool", 'BOOLEAN', rectify=True, tag=('nd.bool_slice', 'intersection'))
         boolean_isect.operation = 'INTERSECT'
         boolean_isect.object = reference_obj
-        boolean_isect.solver = solver
         
         reference_obj.display_type = 'WIRE'
         reference_obj.hide_render = True
@@ -78,6 +74,9 @@ ALT — Do not clean the reference object's mesh"""
         move_to_utils_collection(reference_obj)
         isolate_in_utils_collection([reference_obj])
 
+        apply_boolean_solver(context, difference_obj, boolean_diff)
+        apply_boolean_solver(context, intersecting_obj, boolean_isect)
+
         bpy.ops.object.select_all(action='DESELECT')
         reference_obj.select_set(True)
         bpy.context.view_layer.objects.active = reference_obj
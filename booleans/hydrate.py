@@ -21,7 +21,7 @@
 import bpy
 import bmesh
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.preferences import get_preferences
 
 
@@ -35,10 +35,10 @@ class ND_OT_hydrate(bpy.types.Operator):
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -46,7 +46,7 @@ class ND_OT_hydrate(bpy.types.Operator):
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -65,12 +65,12 @@ class ND_OT_hydrate(bpy.types.Operator):
                 self.active_collection = (self.active_collection - 1) % (len(self.all_collections) + 1)
                 self.dirty = True
         
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if get_preferences().enable_mouse_values:
@@ -21,7 +21,9 @@
 import bpy
 import bmesh
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
+from .. lib.dependencies import get_boolean_targets
+from .. lib.booleans import choose_boolean_solver
 
 
 class ND_OT_swap_solver(bpy.types.Operator):
@@ -34,10 +36,10 @@ class ND_OT_swap_solver(bpy.types.Operator):
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -45,7 +47,7 @@ class ND_OT_swap_solver(bpy.types.Operator):
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -56,16 +58,18 @@ class ND_OT_swap_solver(bpy.types.Operator):
             elif self.solve_mode == 'FAST':
                 self.solve_mode = 'EXACT'
             elif self.solve_mode == 'EXACT':
+                self.solve_mode = 'AUTO'
+            elif self.solve_mode == 'AUTO':
                 self.solve_mode = 'FAST'
 
             self.dirty = True
 
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if self.dirty:
@@ -82,17 +86,12 @@ class ND_OT_swap_solver(bpy.types.Operator):
         self.solve_mode = None
         self.boolean_mods = []
 
-        all_scene_objects = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-        selected_object_names = [obj.name for obj in context.selected_objects]
         fast_solver_count = 0
         exact_solver_count = 0
 
-        for obj in all_scene_objects:
-            mods = [mod for mod in obj.modifiers if mod.type == 'BOOLEAN']
-            for mod in mods:
-                if mod.object and mod.object.name in selected_object_names:
-                    self.boolean_mods.append(mod)
-            
+        for obj in context.selected_objects:
+            self.boolean_mods.extend(mod for target, mod in get_boolean_targets(obj))
+
         for mod in self.boolean_mods:
             if mod.solver == 'FAST':
                 fast_solver_count += 1
@@ -122,7 +121,10 @@ class ND_OT_swap_solver(bpy.types.Operator):
     
     def operate(self, context):
         for mod in self.boolean_mods:
-            mod.solver = self.solve_mode
+            if self.solve_mode == 'AUTO':
+                choose_boolean_solver(context, mod.id_data, mod)
+            else:
+                mod.solver = self.solve_mode
 
         self.dirty = False
 
@@ -141,7 +143,7 @@ def draw_text_callback(self):
     draw_hint(
         self,
         "Solver [S]: {0}".format(self.solve_mode.capitalize() if self.solve_mode else "Mixed"),
-        "Select the solver mode (Fast, Exact)")
+        "Select the solver mode (Fast, Exact, Auto)")
 
 
 def register():
@@ -20,8 +20,8 @@
 
 import bpy
 from .. lib.collections import move_to_utils_collection, isolate_in_utils_collection
-from .. lib.preferences import get_preferences
 from .. lib.modifiers import new_modifier, remove_problematic_bevels
+from .. lib.booleans import apply_boolean_solver
 
 
 class ND_OT_bool_vanilla(bpy.types.Operator):
@@ -47,15 +47,12 @@ ALT — Do not clean the reference object's mesh"""
 
 
     def execute(self, context):
-        solver = 'FAST' if get_preferences().use_fast_booleans else 'EXACT'
-
         a, b = context.selected_objects
         reference_obj = a if a.name != context.active_object.name else b
         
         boolean = new_modifier(context.active_object, " — ".join([self.mode.capitalize(), "ND Bool"]), 'BOOLEAN', rectify=True)
         boolean.operation = self.mode
         boolean.object = reference_obj
-        boolean.solver = solver
 
         if not self.protect_reference_obj:
             reference_obj.display_type = 'WIRE'
@@ -73,6 +70,8 @@ ALT — Do not clean the reference object's mesh"""
             move_to_utils_collection(reference_obj)
             isolate_in_utils_collection([reference_obj])
 
+        apply_boolean_solver(context, context.active_object, boolean)
+
         bpy.ops.object.select_all(action='DESELECT')
         reference_obj.select_set(True)
         bpy.context.view_layer.objects.active = reference_obj
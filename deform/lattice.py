@@ -21,12 +21,14 @@
 import bpy
 import bmesh
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.preferences import get_preferences
 from .. lib.collections import move_to_utils_collection, isolate_in_utils_collection, hide_utils_collection
-from .. lib.math import generate_bounding_box, v3_average
+from .. lib.math import v3_average
+from .. lib.analysis import get_vertex_coords, get_bounding_box_corners
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_lattice = "Lattice — ND L"
@@ -44,10 +46,10 @@ CTRL — Remove existing modifiers"""
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -55,7 +57,7 @@ CTRL — Remove existing modifiers"""
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -156,12 +158,12 @@ CTRL — Remove existing modifiers"""
                     self.lattice_points_w = max(2, self.lattice_points_w - 1)
                     self.dirty = True
         
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if get_preferences().enable_mouse_values:
@@ -191,7 +193,7 @@ CTRL — Remove existing modifiers"""
 
     def invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND L')
+            remove_nd_modifiers(context.selected_objects, 'nd.lattice')
             return {'FINISHED'}
 
         self.dirty = False
@@ -212,9 +214,8 @@ CTRL — Remove existing modifiers"""
 
         self.reference_object = context.active_object
 
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if previous_op:
             self.summon_old_operator(context, mods)
@@ -222,7 +223,7 @@ CTRL — Remove existing modifiers"""
             self.prepare_new_operator(context)
 
         if self.lattice_obj is None:
-            bpy.ops.object.modifier_remove(modifier=self.lattice.name)
+            remove_modifiers(context.active_object, [self.lattice])
             self.prepare_new_operator(context)
         
         if self.summoned:
@@ -281,8 +282,7 @@ CTRL — Remove existing modifiers"""
 
         eval_obj = context.active_object
 
-        coords = [vert for vert in eval_obj.data.vertices]
-        box = generate_bounding_box(coords)
+        box = get_bounding_box_corners(get_vertex_coords(eval_obj.data))
         center = v3_average(box)
 
         bpy.ops.object.add(type='LATTICE', enter_editmode=False, align='WORLD', location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1))
@@ -355,7 +355,7 @@ CTRL — Remove existing modifiers"""
             hide_utils_collection(True)
 
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.lattice.name)
+            remove_modifiers(context.active_object, [self.lattice])
             bpy.data.lattices.remove(self.lattice_obj.data, do_unlink=True)
 
         unregister_draw_handler()
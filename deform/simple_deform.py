@@ -22,11 +22,12 @@ import bpy
 import bmesh
 from math import radians, degrees
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.preferences import get_preferences
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_deform = "Deform — ND SD"
@@ -47,10 +48,10 @@ CTRL — Remove existing modifiers"""
         factor_factor = 0.01 if self.key_shift else 0.1
         angle_factor = 1 if self.key_shift else 10
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -58,7 +59,7 @@ CTRL — Remove existing modifiers"""
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -111,12 +112,12 @@ CTRL — Remove existing modifiers"""
                 
                 self.dirty = True
         
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if get_preferences().enable_mouse_values:
@@ -138,7 +139,7 @@ CTRL — Remove existing modifiers"""
 
     def invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND SD')
+            remove_nd_modifiers(context.selected_objects, 'nd.simple_deform')
             return {'FINISHED'}
 
         self.dirty = False
@@ -150,9 +151,8 @@ CTRL — Remove existing modifiers"""
         self.factor_input_stream = new_stream()
 
         if len(context.selected_objects) == 1:
-            mods = context.active_object.modifiers
-            mod_names = list(map(lambda x: x.name, mods))
-            previous_op = all(m in mod_names for m in mod_summon_list)
+            mods = get_nd_modifiers(context.active_object)
+            previous_op = all(m in mods for m in mod_summon_list)
 
             if previous_op:
                 self.summon_old_operator(context, mods)
@@ -230,7 +230,7 @@ CTRL — Remove existing modifiers"""
 
     def revert(self, context):
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.deform.name)
+            remove_modifiers(context.active_object, [self.deform])
 
         if self.summoned:
             axis = ['X', 'Y', 'Z'][self.axis_prev]
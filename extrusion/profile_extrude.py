@@ -26,7 +26,8 @@ from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_screw = "Extrusion — ND PE"
@@ -110,7 +111,7 @@ CTRL — Remove existing modifiers"""
 
     def do_invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND PE')
+            remove_nd_modifiers(context.selected_objects, 'nd.profile_extrude')
             return {'FINISHED'}
 
         self.dirty = False
@@ -119,9 +120,8 @@ CTRL — Remove existing modifiers"""
         self.offset_input_stream = new_stream()
 
         if len(context.selected_objects) == 1:
-            mods = context.active_object.modifiers
-            mod_names = list(map(lambda x: x.name, mods))
-            previous_op = all(m in mod_names for m in mod_summon_list)
+            mods = get_nd_modifiers(context.active_object)
+            previous_op = all(m in mods for m in mod_summon_list)
 
             if previous_op:
                 self.summon_old_operator(context, mods)
@@ -244,8 +244,7 @@ CTRL — Remove existing modifiers"""
 
     def revert(self, context):
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.weighting_offset.name)
-            bpy.ops.object.modifier_remove(modifier=self.screw.name)
+            remove_modifiers(context.active_object, [self.weighting_offset, self.screw])
 
         if self.summoned:
             axis = ['X', 'Y', 'Z'][self.axis_prev]
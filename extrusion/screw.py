@@ -27,7 +27,8 @@ from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_displace = "Offset — ND SCR"
@@ -131,7 +132,7 @@ CTRL — Remove existing modifiers"""
 
     def do_invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND SCR')
+            remove_nd_modifiers(context.selected_objects, 'nd.screw')
             return {'FINISHED'}
 
         self.dirty = False
@@ -149,14 +150,13 @@ CTRL — Remove existing modifiers"""
         self.segments_input_stream = new_stream()
 
         if len(context.selected_objects) == 1:
-            mods = context.active_object.modifiers
-            mod_names = list(map(lambda x: x.name, mods))
+            mods = get_nd_modifiers(context.active_object)
             
             previous_op = False 
             if self.object_type == 'MESH':
-                previous_op = all(m in mod_names for m in mod_mesh_summon_list)
+                previous_op = all(m in mods for m in mod_mesh_summon_list)
             else:
-                previous_op = all(m in mod_names for m in mod_curve_summon_list)
+                previous_op = all(m in mods for m in mod_curve_summon_list)
 
             if previous_op:
                 self.summon_old_operator(context, mods)
@@ -239,6 +239,13 @@ CTRL — Remove existing modifiers"""
         self.screw = screw
     
 
+    def get_draft_modifiers(self):
+        if self.object_type == 'MESH':
+            return [self.displace, self.screw]
+
+        return [self.screw]
+
+
     def operate(self, context):
         if self.object_type == 'MESH':
             self.displace.strength = self.offset
@@ -260,10 +267,10 @@ CTRL — Remove existing modifiers"""
 
     def revert(self, context):
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.screw.name)
+            remove_modifiers(context.active_object, [self.screw])
 
             if self.object_type == 'MESH':
-                bpy.ops.object.modifier_remove(modifier=self.displace.name)
+                remove_modifiers(context.active_object, [self.displace])
 
         if self.summoned:
             if self.object_type == 'MESH':
@@ -26,7 +26,8 @@ from .. lib.overlay import init_overlay, register_draw_handler, unregister_draw_
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences, get_scene_unit_factor
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_displace = "Offset — ND SOL"
@@ -105,7 +106,7 @@ CTRL — Remove existing modifiers"""
 
     def do_invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND SOL')
+            remove_nd_modifiers(context.selected_objects, 'nd.solidify')
             return {'FINISHED'}
 
         self.dirty = False
@@ -114,9 +115,8 @@ CTRL — Remove existing modifiers"""
         self.thickness_input_stream = new_stream()
         self.offset_input_stream = new_stream()
 
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if previous_op:
             self.summon_old_operator(context, mods)
@@ -187,6 +187,10 @@ CTRL — Remove existing modifiers"""
         self.solidify = solidify
     
 
+    def get_draft_modifiers(self):
+        return [self.displace, self.solidify]
+
+
     def operate(self, context):
         self.solidify.thickness = self.thickness
         self.solidify.offset = self.weighting
@@ -202,8 +206,7 @@ CTRL — Remove existing modifiers"""
 
     def revert(self, context):
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.displace.name)
-            bpy.ops.object.modifier_remove(modifier=self.solidify.name)
+            remove_modifiers(context.active_object, [self.displace, self.solidify])
 
         if self.summoned:
             self.solidify.thickness = self.thickness_prev
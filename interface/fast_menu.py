@@ -19,11 +19,12 @@
 # ---
 
 import bpy
-import bmesh
 from .. import bl_info
-from .. lib.objects import is_planar
+from .. lib.selection import get_selection_summary
+from .. lib.predictions import get_geometry_prediction, register_prediction_handlers, unregister_prediction_handlers
 from . ops import build_icon_lookup_table
 from .. lib.addons import is_addon_enabled
+from .. lib.modifier_registry import get_nd_operators, boolean_operators
 
 
 SECTION_COUNT = 1
@@ -121,14 +122,14 @@ class ND_MT_fast_menu(bpy.types.Menu):
         layout.operator_context = 'INVOKE_DEFAULT'
 
         if context.mode == 'EDIT_MESH':
-            mesh = bmesh.from_edit_mesh(context.active_object.data)
+            selection = get_selection_summary(context.active_object)
 
-            verts_selected = len([vert for vert in mesh.verts if vert.select]) >= 1
-            edges_selected = len([edge for edge in mesh.edges if edge.select]) >= 1
+            verts_selected = selection.verts >= 1
+            edges_selected = selection.edges >= 1
 
-            has_verts = len(mesh.verts) >= 1
-            has_edges = len(mesh.edges) >= 1
-            has_faces = len(mesh.faces) >= 1
+            has_verts = selection.total_verts >= 1
+            has_edges = selection.total_edges >= 1
+            has_faces = selection.total_faces >= 1
 
             made_prediction = False
 
@@ -168,43 +169,24 @@ class ND_MT_fast_menu(bpy.types.Menu):
 
     
     def draw_single_object_mesh_predictions(self, context, layout):
-        depsgraph = context.evaluated_depsgraph_get()
-        object_eval = context.active_object.evaluated_get(depsgraph)
-
-        bm = bmesh.new()
-        bm.from_mesh(object_eval.data)
-
-        self.verts = [vert for vert in bm.verts]
-        self.edges = [edge for edge in bm.edges]
-        self.faces = [face for face in bm.faces]
-        self.sketch = len(self.faces) >= 1 and is_planar(bm)
-        self.profile = len(self.faces) == 0 and len(self.edges) > 0
-        self.has_faces = len(self.faces) >= 1
-        self.manifold = all([len(edge.link_faces) == 2 for edge in self.edges])
-        self.has_loose_edges = any([len(edge.link_faces) == 0 for edge in self.edges])
-
-        bm.free()
-
-        mod_names = [mod.name for mod in context.active_object.modifiers]
-
-        has_mod_profile_extrude = False
-        has_mod_solidify = False 
-        has_mod_boolean = False
-        has_mod_screw = False
-        has_mod_array_cubed = False
-        has_mod_circular_array = False
-        has_mod_circularize = False
-        has_mod_recon_poly = False
-
-        for name in mod_names:
-            has_mod_profile_extrude = has_mod_profile_extrude or bool("— ND PE" in name)
-            has_mod_solidify = has_mod_solidify or bool("— ND SOL" in name)
-            has_mod_boolean = has_mod_boolean or bool("— ND Bool" in name)
-            has_mod_screw = has_mod_screw or bool("— ND SCR" in name)
-            has_mod_array_cubed = has_mod_array_cubed or bool("Array³" in name)
-            has_mod_circular_array = has_mod_circular_array or bool("— ND CA" in name)
-            has_mod_recon_poly = has_mod_recon_poly or bool("— ND RCP" in name)
-            has_mod_circularize = has_mod_circularize or bool("— ND CIRC" in name)
+        prediction = get_geometry_prediction(context, context.active_object)
+
+        self.sketch = prediction.sketch
+        self.profile = prediction.profile
+        self.has_faces = prediction.has_faces
+        self.manifold = prediction.manifold
+        self.has_loose_edges = prediction.has_loose_edges
+
+        nd_operators = get_nd_operators(context.active_object)
+
+        has_mod_profile_extrude = 'nd.profile_extrude' in nd_operators
+        has_mod_solidify = 'nd.solidify' in nd_operators
+        has_mod_boolean = not boolean_operators.isdisjoint(nd_operators)
+        has_mod_screw = 'nd.screw' in nd_operators
+        has_mod_array_cubed = 'nd.array_cubed' in nd_operators
+        has_mod_circular_array = 'nd.circular_array' in nd_operators
+        has_mod_recon_poly = 'nd.recon_poly' in nd_operators
+        has_mod_circularize = 'nd.circularize' in nd_operators
 
         was_profile_extrude = has_mod_profile_extrude and not has_mod_solidify
 
@@ -316,6 +298,7 @@ class ND_MT_fast_menu(bpy.types.Menu):
 
 def register():
     bpy.utils.register_class(ND_MT_fast_menu)
+    register_prediction_handlers()
 
     for mapping in [('Mesh', 'EMPTY'), ('Object Mode', 'EMPTY')]:
         keymap = bpy.context.window_manager.keyconfigs.addon.keymaps.new(name=mapping[0], space_type=mapping[1])
@@ -330,4 +313,5 @@ def unregister():
 
     keys.clear()
 
+    unregister_prediction_handlers()
     bpy.utils.unregister_class(ND_MT_fast_menu)
@@ -25,6 +25,7 @@ from .. import lib
 from . import ops
 from . common import create_box, render_ops, web_link
 from .. lib.preferences import get_preferences
+from .. lib.stack_profiler import get_stack_profile, format_modifier_cost
 
 
 links = [
@@ -144,6 +145,29 @@ class ND_PT_main_ui_panel(bpy.types.Panel):
             if getattr(props, prop):
                 render_ops(collection, box)
 
+                if prop == "standalone":
+                    self.draw_stack_profile(context, box)
+
+
+    def draw_stack_profile(self, context, layout):
+        obj = context.active_object
+        costs = get_stack_profile(obj) if obj else None
+
+        if not costs:
+            return
+
+        slowest = max((cost.time for cost in costs if cost.time is not None), default=None)
+
+        column = layout.column(align=True)
+        column.separator()
+        column.label(text="Modifier Costs — {}".format(obj.name), icon='SORTTIME')
+
+        for cost in costs:
+            row = column.row(align=True)
+            row.alert = cost.time is not None and cost.time == slowest
+            row.label(text=cost.name)
+            row.label(text=format_modifier_cost(cost))
+
         
 def register():
     if get_preferences().enable_sidebar:
@@ -22,6 +22,7 @@
 
 standalone_ops = [
     ("nd.cycle", 'LONGDISPLAY', None, None, False),
+    ("nd.profile_modifiers", 'SORTTIME', None, None, False),
 ]
 
 sketch_ops = [
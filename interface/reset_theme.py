@@ -19,7 +19,7 @@
 # ---
 
 import bpy
-from .. lib.preferences import get_preferences
+from .. lib.preferences import get_addon_preferences
 
 
 class ND_OT_reset_theme(bpy.types.Operator):
@@ -36,23 +36,23 @@ class ND_OT_reset_theme(bpy.types.Operator):
 
     def execute(self, context):
         # Overlay
-        get_preferences().overlay_header_standard_color = (255/255, 135/255, 55/255)
-        get_preferences().overlay_header_recalled_color = (82/255, 224/255, 82/255)
-        get_preferences().overlay_header_paused_color = (238/255, 59/255, 43/255)
-        get_preferences().overlay_option_active_color = (55/255, 174/255, 255/255)
-        get_preferences().overlay_base_color = (255/255, 255/255, 255/255)
-        get_preferences().overlay_option_manual_override_color = (237/255, 185/255, 94/255)
+        get_addon_preferences().overlay_header_standard_color = (255/255, 135/255, 55/255)
+        get_addon_preferences().overlay_header_recalled_color = (82/255, 224/255, 82/255)
+        get_addon_preferences().overlay_header_paused_color = (238/255, 59/255, 43/255)
+        get_addon_preferences().overlay_option_active_color = (55/255, 174/255, 255/255)
+        get_addon_preferences().overlay_base_color = (255/255, 255/255, 255/255)
+        get_addon_preferences().overlay_option_manual_override_color = (237/255, 185/255, 94/255)
 
         # Points
-        get_preferences().points_primary_color = (82/255, 224/255, 82/255, 1.0)
-        get_preferences().points_secondary_color = (255/255, 135/255, 55/255, 1.0)
-        get_preferences().points_tertiary_color = (82/255, 224/255, 82/255, 1.0)
-        get_preferences().points_guide_line_color = (82/255, 224/255, 82/255, 0.5)
+        get_addon_preferences().points_primary_color = (82/255, 224/255, 82/255, 1.0)
+        get_addon_preferences().points_secondary_color = (255/255, 135/255, 55/255, 1.0)
+        get_addon_preferences().points_tertiary_color = (82/255, 224/255, 82/255, 1.0)
+        get_addon_preferences().points_guide_line_color = (82/255, 224/255, 82/255, 0.5)
 
         # Axis
-        get_preferences().axis_x_color = (226/255, 54/255, 54/255)
-        get_preferences().axis_y_color = (130/255, 221/255, 85/255)
-        get_preferences().axis_z_color = (74/255, 144/255, 226/255)
+        get_addon_preferences().axis_x_color = (226/255, 54/255, 54/255)
+        get_addon_preferences().axis_y_color = (130/255, 221/255, 85/255)
+        get_addon_preferences().axis_z_color = (74/255, 144/255, 226/255)
 
         return {'FINISHED'}
 
@@ -19,10 +19,18 @@
 # ---
 
 import importlib
+from . import redraw
 from . import events
 from . import math
+from . import analysis
+from . import predictions
+from . import selection
+from . import vertex_groups
+from . import edit_mesh
+from . import snapping
 from . import objects
 from . import overlay
+from . import shaders
 from . import axis
 from . import points
 from . import viewport
@@ -31,17 +39,32 @@ from . import updates
 from . import preferences
 from . import addons
 from . import collections
+from . import dependencies
+from . import modifier_registry
 from . import modifiers
+from . import booleans
+from . import recall
 from . import numeric_input
 from . import overlay_keys
+from . import profiler
+from . import stack_profiler
+from . import draft
 from . import base_operator
 
 
 registerables = (
+    redraw,
     events,
     math,
+    analysis,
+    predictions,
+    selection,
+    vertex_groups,
+    edit_mesh,
+    snapping,
     objects,
     overlay,
+    shaders,
     axis,
     points,
     viewport,
@@ -50,9 +73,16 @@ registerables = (
     preferences,
     addons,
     collections,
+    dependencies,
+    modifier_registry,
     modifiers,
+    booleans,
+    recall,
     numeric_input,
     overlay_keys,
+    profiler,
+    stack_profiler,
+    draft,
     base_operator,
 )
 
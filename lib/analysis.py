@@ -0,0 +1,135 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import numpy as np
+from mathutils import Vector
+
+
+def get_vertex_coords(mesh):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get('co', coords)
+
+    return coords.reshape(-1, 3)
+
+
+def get_vertex_normals(mesh):
+    normals = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get('normal', normals)
+
+    return normals.reshape(-1, 3)
+
+
+def get_edge_keys(mesh):
+    keys = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', keys)
+
+    return keys.reshape(-1, 2)
+
+
+def get_loop_data(mesh):
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    mesh.loops.foreach_get('edge_index', loop_edges)
+
+    return loop_verts, loop_edges
+
+
+def get_polygon_data(mesh):
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float64)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    mesh.polygons.foreach_get('normal', normals)
+
+    return loop_starts, loop_totals, normals.reshape(-1, 3)
+
+
+def get_loop_polygons(loop_totals):
+    return np.repeat(np.arange(len(loop_totals), dtype=np.int32), loop_totals)
+
+
+def get_edge_face_counts(mesh):
+    _, loop_edges = get_loop_data(mesh)
+
+    return np.bincount(loop_edges, minlength=len(mesh.edges))
+
+
+def classify_edges(mesh):
+    counts = get_edge_face_counts(mesh)
+
+    return {
+        'loose': counts == 0,
+        'boundary': counts == 1,
+        'manifold': counts == 2,
+        'non_manifold': counts > 2,
+    }
+
+
+def is_manifold(mesh):
+    return bool(np.all(get_edge_face_counts(mesh) == 2))
+
+
+def is_planar(mesh, tolerance=0.0001):
+    if len(mesh.polygons) < 1:
+        return True
+
+    if len(mesh.polygons) == 1 and mesh.polygons[0].loop_total == 3:
+        return True
+
+    coords = get_vertex_coords(mesh)
+    loop_verts, _ = get_loop_data(mesh)
+
+    # The plane is defined by the first three corners of the first face, and
+    # every vertex used by a face must sit on it.
+    first_loop = mesh.polygons[0].loop_start
+    a, b, c = coords[loop_verts[first_loop:first_loop + 3]]
+    norm = np.cross(b - a, c - a)
+    length = np.linalg.norm(norm)
+
+    if length == 0:
+        return True
+
+    distances = (coords[np.unique(loop_verts)] - a) @ (norm / length)
+
+    return bool(np.all(np.abs(distances) < tolerance))
+
+
+def get_bounding_box(coords):
+    if len(coords) == 0:
+        return np.zeros(3), np.zeros(3)
+
+    return coords.min(axis=0), coords.max(axis=0)
+
+
+def get_bounding_box_corners(coords):
+    (min_x, min_y, min_z), (max_x, max_y, max_z) = get_bounding_box(coords)
+
+    return [
+        Vector((min_x, min_y, min_z)),
+        Vector((min_x, min_y, max_z)),
+        Vector((min_x, max_y, max_z)),
+        Vector((min_x, max_y, min_z)),
+        Vector((max_x, min_y, min_z)),
+        Vector((max_x, min_y, max_z)),
+        Vector((max_x, max_y, max_z)),
+        Vector((max_x, max_y, min_z))
+    ]
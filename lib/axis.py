@@ -23,6 +23,11 @@ import gpu
 from mathutils import Vector, Matrix
 from gpu_extras.batch import batch_for_shader
 from . preferences import get_preferences
+from . redraw import add_redraw_source, remove_redraw_source, is_source_region, frame_drawn
+from . shaders import get_uniform_color_shader
+
+
+axis_batches = {}
 
 
 def register_axis_handler(cls):
@@ -39,7 +44,8 @@ def register_axis_handler(cls):
         dns = bpy.app.driver_namespace
         dns['nd.axis'] = handler
 
-        redraw_regions()
+        axis_batches.clear()
+        add_redraw_source('nd.axis', cls, axis_signature)
 
 
 def unregister_axis_handler():
@@ -49,15 +55,8 @@ def unregister_axis_handler():
         bpy.types.SpaceView3D.draw_handler_remove(handler, 'WINDOW')
         del bpy.app.driver_namespace['nd.axis']
 
-        redraw_regions()
-
-
-def redraw_regions():
-    for area in bpy.context.window.screen.areas:
-        if area.type == 'VIEW_3D':
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    region.tag_redraw()
+        axis_batches.clear()
+        remove_redraw_source('nd.axis')
 
 
 def init_axis(cls, axis_obj = None, axis = 0):
@@ -68,44 +67,65 @@ def init_axis(cls, axis_obj = None, axis = 0):
     cls.axis_inactive_opacity = get_preferences().axis_inactive_opacity
 
 
+def axis_signature(cls):
+    if cls.axis_obj is None:
+        return None
+
+    return (cls.axis, tuple(tuple(row) for row in cls.axis_obj.matrix_world))
+
+
+def get_axis_batches(mx):
+    matrix_key = tuple(tuple(row) for row in mx)
+    cached = axis_batches.get('axes')
+
+    if cached and cached[0] == matrix_key:
+        return cached[1]
+
+    shader = get_uniform_color_shader()
+    origin = mx.decompose()[0]
+    batches = []
+
+    for axis in (Vector((1, 0, 0)), Vector((0, 1, 0)), Vector((0, 0, 1))):
+        # Draw the axis through the origin point.
+        coords = [
+            origin + mx.to_3x3() @ axis * -10000,
+            origin + mx.to_3x3() @ axis * 10000,
+        ]
+
+        batches.append(batch_for_shader(shader, 'LINES', {"pos": coords}, indices=[(0, 1)]))
+
+    axis_batches['axes'] = (matrix_key, batches)
+
+    return batches
+
+
 def update_axis(cls):
+    if not is_source_region('nd.axis'):
+        return
+
+    frame_drawn()
+
     if cls.axis_obj is None:
         return
 
-    axes = [
-        (Vector((1, 0, 0)), get_preferences().axis_x_color),
-        (Vector((0, 1, 0)), get_preferences().axis_y_color),
-        (Vector((0, 0, 1)), get_preferences().axis_z_color),
+    colors = [
+        get_preferences().axis_x_color,
+        get_preferences().axis_y_color,
+        get_preferences().axis_z_color,
     ]
 
-    for counter, conf in enumerate(axes):
-        axis, color = conf
-        coords = []
-
-        mx = cls.axis_obj.matrix_world
-        origin = mx.decompose()[0]
+    shader = get_uniform_color_shader()
+    batches = get_axis_batches(cls.axis_obj.matrix_world)
 
-        # Draw the axis through the origin point.
-        coords.append(origin + mx.to_3x3() @ axis * -10000)
-        coords.append(origin + mx.to_3x3() @ axis * 10000)
+    gpu.state.depth_test_set('NONE')
+    gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+    for counter, (batch, color) in enumerate(zip(batches, colors)):
         shader.bind()
         shader.uniform_float("color", (*color, 1 if counter == cls.axis else cls.axis_inactive_opacity))
 
-        gpu.state.depth_test_set('NONE')
-        gpu.state.blend_set('ALPHA')
         gpu.state.line_width_set(
             cls.axis_active_thickness if counter == cls.axis else cls.axis_base_thickness
         )
 
-        batch = batch_for_shader(
-            shader,
-            'LINES',
-            {"pos": coords},
-            indices=[(i, i + 1) for i in range(0, len(coords), 2)]
-        )
-        
         batch.draw(shader)
-
-    redraw_regions()
@@ -21,7 +21,9 @@
 import bpy
 from . preferences import get_scene_unit_factor, get_scene_unit_suffix, get_scene_unit_scale, get_preferences
 from .. lib.overlay import update_overlay, toggle_pin_overlay, toggle_operator_passthrough
-from .. lib.events import capture_modifier_keys
+from .. lib.events import capture_modifier_keys, Action
+from .. lib.profiler import init_profiler, begin_profile_event, end_profile_event, profile_phase
+from .. lib.draft import init_draft, enter_draft, exit_draft, update_draft, end_draft
 
 
 class BaseOperator(bpy.types.Operator):
@@ -42,6 +44,10 @@ class BaseOperator(bpy.types.Operator):
     def operate(self, context):
         pass
 
+
+    def get_draft_modifiers(self):
+        return []
+
     
     def invoke(self, context, event):
         self.unit_factor = get_scene_unit_factor()
@@ -54,36 +60,77 @@ class BaseOperator(bpy.types.Operator):
         unit_increment_size = get_preferences().unit_increment_size
         self.unit_step_hint = self.generate_step_hint(f"{(self.unit_scale * unit_increment_size):.2f}{self.unit_suffix}", f"{(self.unit_scale * 0.1 * unit_increment_size):.2f}{self.unit_suffix}")
 
-        return self.do_invoke(context, event)
+        init_profiler(self)
+
+        result = self.do_invoke(context, event)
+
+        if 'RUNNING_MODAL' in result:
+            init_draft(self, context)
+
+        return result
 
 
     def modal(self, context, event):
-        capture_modifier_keys(self, event)
+        # Events don't say which timer fired, so while a draft timer exists
+        # every TIMER event in this window is treated as a draft tick and
+        # passed through untouched (including those from other operators).
+        if event.type == 'TIMER' and getattr(self, 'draft_timer', None) is not None:
+            update_draft(self)
+            return {'PASS_THROUGH'}
+
+        begin_profile_event(self, event)
+
+        result = self.handle_modal_event(context, event)
+
+        end_profile_event(self, result)
+
+        if 'FINISHED' in result or 'CANCELLED' in result:
+            end_draft(self, context)
+
+        return result
+
+
+    def handle_modal_event(self, context, event):
+        with profile_phase(self, 'capture_modifier_keys'):
+            capture_modifier_keys(self, event)
 
         self.step_size = ((0.1 if self.key_shift else 1) * self.unit_factor) * get_preferences().unit_increment_size
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        if self.key_toggle_pin_overlay:
+        if self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         if self.operator_passthrough:
-            update_overlay(self, context, event)
+            with profile_phase(self, 'update_overlay'):
+                update_overlay(self, context, event)
 
             return {'PASS_THROUGH'}
 
-        if self.key_cancel:
-            self.revert(context)
+        if self.key_actions & Action.CANCEL:
+            exit_draft(self)
+
+            with profile_phase(self, 'revert'):
+                self.revert(context)
 
             return {'CANCELLED'}
 
+        # Full quality must be back before the subclass finishes.
+        if self.key_actions & Action.CONFIRM:
+            exit_draft(self)
+
         # Subclass hook-in
-        override_return = self.do_modal(context, event)
+        with profile_phase(self, 'do_modal'):
+            override_return = self.do_modal(context, event)
 
         if self.dirty:
-            self.operate(context)
+            enter_draft(self)
 
-        update_overlay(self, context, event)
+            with profile_phase(self, 'operate'):
+                self.operate(context)
+
+        with profile_phase(self, 'update_overlay'):
+            update_overlay(self, context, event)
 
         return override_return if override_return else {'RUNNING_MODAL'}
@@ -0,0 +1,118 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+from time import perf_counter
+from . preferences import get_preferences
+from . analysis import is_manifold
+from . predictions import get_geometry_stamp
+
+
+solver_cache = {}
+
+
+def get_boolean_solver():
+    return 'FAST' if get_preferences().use_fast_booleans else 'EXACT'
+
+
+def use_auto_solver():
+    return get_preferences().use_auto_booleans
+
+
+def measure_boolean_solver(context, object, mod, solver):
+    mod.solver = solver
+
+    start = perf_counter()
+    depsgraph = context.evaluated_depsgraph_get()
+    elapsed = perf_counter() - start
+
+    mesh = object.evaluated_get(depsgraph).data
+
+    return (elapsed, len(mesh.polygons) > 0, is_manifold(mesh))
+
+
+def measure_boolean_solvers(context, object, mod):
+    # Hide everything below the boolean so that the evaluation stops at it;
+    # the modifiers above it cost the same for both solvers.
+    index = object.modifiers.find(mod.name)
+    hidden_mods = [m for m in object.modifiers[index + 1:] if m.show_viewport]
+    results = {'FAST': [], 'EXACT': []}
+
+    try:
+        for m in hidden_mods:
+            m.show_viewport = False
+
+        # Settle any work still pending from the operator (new objects,
+        # relation rebuilds, display changes) so that neither solver's timing
+        # absorbs it, then alternate the solvers to even out caching effects.
+        context.evaluated_depsgraph_get()
+
+        for solver in ('FAST', 'EXACT', 'EXACT', 'FAST'):
+            results[solver].append(measure_boolean_solver(context, object, mod, solver))
+    finally:
+        for m in hidden_mods:
+            m.show_viewport = True
+
+    fast_time = min(result[0] for result in results['FAST'])
+    exact_time = min(result[0] for result in results['EXACT'])
+    _, fast_has_faces, fast_manifold = results['FAST'][-1]
+    _, exact_has_faces, exact_manifold = results['EXACT'][-1]
+
+    # FAST is only trusted when it doesn't lose anything EXACT manages to
+    # produce, i.e. it keeps the result manifold and non-empty.
+    fast_valid = (fast_has_faces or not exact_has_faces) and (fast_manifold or not exact_manifold)
+
+    return 'FAST' if fast_valid and fast_time <= exact_time else 'EXACT'
+
+
+def choose_boolean_solver(context, object, mod):
+    key = (object.session_uid, mod.name)
+    cutter = mod.object if mod.operand_type == 'OBJECT' else None
+
+    cached = solver_cache.get(key)
+    if cached and cached[0] == get_cutter_stamp(cutter) and cached[1] == get_geometry_stamp(object):
+        # Writing the solver tags the target for an update (and bumps its stamp)
+        # even when the value doesn't change, so only write real changes.
+        if mod.solver != cached[2]:
+            mod.solver = cached[2]
+
+        return cached[2]
+
+    solver = measure_boolean_solvers(context, object, mod)
+    mod.solver = solver
+
+    # Setting the solver re-evaluates the target, so the stamps are only taken
+    # once the chosen solver has been evaluated.
+    context.evaluated_depsgraph_get()
+    solver_cache[key] = (get_cutter_stamp(cutter), get_geometry_stamp(object), solver)
+
+    return solver
+
+
+def get_cutter_stamp(cutter):
+    return get_geometry_stamp(cutter) if cutter else None
+
+
+def apply_boolean_solver(context, object, mod):
+    if use_auto_solver():
+        return choose_boolean_solver(context, object, mod)
+
+    mod.solver = get_boolean_solver()
+
+    return mod.solver
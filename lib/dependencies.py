@@ -0,0 +1,179 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from bpy.app.handlers import persistent
+
+
+# Reverse index of boolean relationships, keyed by session_uid so that it
+# survives renames. Each target's entries are refreshed whenever the depsgraph
+# reports an update for it, and the whole index is rebuilt lazily after file
+# loads, undo steps, or whenever a query finds an entry that no longer holds
+# or an object the index doesn't know about.
+
+cutter_targets = {}
+target_cutters = {}
+object_keys = {}
+index_state = {'dirty': True}
+
+
+def register_dependency_handlers():
+    if dependency_update_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(dependency_update_handler)
+
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if invalidate_dependency_index not in handlers:
+            handlers.append(invalidate_dependency_index)
+
+
+def unregister_dependency_handlers():
+    if dependency_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(dependency_update_handler)
+
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if invalidate_dependency_index in handlers:
+            handlers.remove(invalidate_dependency_index)
+
+    invalidate_dependency_index()
+
+
+@persistent
+def invalidate_dependency_index(*args):
+    cutter_targets.clear()
+    target_cutters.clear()
+    object_keys.clear()
+    index_state['dirty'] = True
+
+
+@persistent
+def dependency_update_handler(scene, depsgraph):
+    if index_state['dirty']:
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            index_object(update.id.original)
+
+
+def unindex_object(uid):
+    for cutter_uid, mod_name in target_cutters.pop(uid, ()):
+        entries = cutter_targets.get(cutter_uid)
+
+        if entries is None:
+            continue
+
+        entries[:] = [entry for entry in entries if entry[0] != uid]
+
+        if not entries:
+            del cutter_targets[cutter_uid]
+
+
+def index_object(object):
+    uid = object.session_uid
+
+    unindex_object(uid)
+    object_keys[uid] = get_object_key(object)
+
+    if object.type != 'MESH':
+        return
+
+    cutters = []
+
+    for mod in object.modifiers:
+        if mod.type == 'BOOLEAN' and mod.operand_type == 'OBJECT' and mod.object:
+            cutter_uid = mod.object.session_uid
+            object_keys[cutter_uid] = get_object_key(mod.object)
+
+            cutters.append((cutter_uid, mod.name))
+            cutter_targets.setdefault(cutter_uid, []).append((uid, mod.name))
+
+    if cutters:
+        target_cutters[uid] = cutters
+
+
+def rebuild_dependency_index():
+    invalidate_dependency_index()
+
+    for object in bpy.data.objects:
+        index_object(object)
+
+    index_state['dirty'] = False
+
+
+def get_object_key(object):
+    # Local and library objects can share a name, so lookups go through the
+    # (name, library path) key that bpy.data collections accept.
+    return (object.name, object.library.filepath if object.library else None)
+
+
+def resolve_object(uid):
+    key = object_keys.get(uid)
+    object = bpy.data.objects.get(key) if key else None
+
+    if object is None or object.session_uid != uid:
+        return None
+
+    return object
+
+
+def resolve_entries(object, entries, other_is_cutter):
+    resolved = []
+
+    for other_uid, mod_name in entries:
+        other = resolve_object(other_uid)
+
+        if other is None:
+            return None
+
+        target = object if other_is_cutter else other
+        cutter = other if other_is_cutter else object
+        mod = target.modifiers.get(mod_name)
+
+        if mod is None or mod.type != 'BOOLEAN' or mod.object != cutter:
+            return None
+
+        resolved.append((other, mod))
+
+    return resolved
+
+
+def query_dependency_index(object, index, other_is_cutter):
+    # Objects the index has never seen were added or linked without a
+    # depsgraph update reaching us, so their relationships are unknown too.
+    if index_state['dirty'] or object.session_uid not in object_keys:
+        rebuild_dependency_index()
+
+    resolved = resolve_entries(object, index.get(object.session_uid, ()), other_is_cutter)
+
+    # A stale entry means something changed without the depsgraph telling us
+    # (e.g. a rename or an object outside of the view layer), so start over.
+    if resolved is None:
+        rebuild_dependency_index()
+        resolved = resolve_entries(object, index.get(object.session_uid, ()), other_is_cutter) or []
+
+    return resolved
+
+
+def get_boolean_targets(cutter):
+    return query_dependency_index(cutter, cutter_targets, False)
+
+
+def get_boolean_cutters(target):
+    return query_dependency_index(target, target_cutters, True)
@@ -0,0 +1,114 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+from time import perf_counter
+from . preferences import get_preferences
+
+
+draft_timer_interval = 0.1
+draft_disabled_types = {'WEIGHTED_NORMAL', 'WELD', 'SUBSURF'}
+
+
+def init_draft(cls, context):
+    cls.draft_snapshot = None
+    cls.draft_changed_at = None
+    cls.draft_timer = None
+
+    if not get_preferences().enable_draft_mode or not cls.get_draft_modifiers():
+        return
+
+    cls.draft_timer = context.window_manager.event_timer_add(draft_timer_interval, window=context.window)
+
+
+def create_draft_snapshot(edited_mods):
+    snapshot = []
+    edited_names = {}
+
+    for mod in edited_mods:
+        edited_names.setdefault(mod.id_data, set()).add(mod.name)
+
+    for object, names in edited_names.items():
+        first_edited = min(object.modifiers.find(name) for name in names)
+
+        for index, mod in enumerate(object.modifiers):
+            # The solver isn't driven by any operator, so even the edited
+            # booleans can safely drop to FAST while dragging.
+            if mod.type == 'BOOLEAN' and mod.solver == 'EXACT':
+                snapshot.append((mod, 'solver', 'EXACT'))
+
+            if mod.name in names:
+                continue
+
+            if mod.type == 'BEVEL' and mod.segments > 1:
+                snapshot.append((mod, 'segments', mod.segments))
+
+            if mod.type in draft_disabled_types and mod.show_viewport and index > first_edited:
+                snapshot.append((mod, 'show_viewport', True))
+
+    return snapshot
+
+
+def enter_draft(cls):
+    if getattr(cls, 'draft_timer', None) is None:
+        return
+
+    cls.draft_changed_at = perf_counter()
+
+    if cls.draft_snapshot is not None:
+        return
+
+    cls.draft_snapshot = create_draft_snapshot(cls.get_draft_modifiers())
+
+    for mod, attribute, value in cls.draft_snapshot:
+        if attribute == 'solver':
+            mod.solver = 'FAST'
+        elif attribute == 'segments':
+            mod.segments = 1
+        elif attribute == 'show_viewport':
+            mod.show_viewport = False
+
+
+def exit_draft(cls):
+    if getattr(cls, 'draft_snapshot', None) is None:
+        return
+
+    for mod, attribute, value in cls.draft_snapshot:
+        try:
+            setattr(mod, attribute, value)
+        except ReferenceError:
+            pass
+
+    cls.draft_snapshot = None
+
+
+def update_draft(cls):
+    if cls.draft_snapshot is None:
+        return
+
+    if perf_counter() - cls.draft_changed_at >= get_preferences().draft_idle_timeout:
+        exit_draft(cls)
+
+
+def end_draft(cls, context):
+    exit_draft(cls)
+
+    if getattr(cls, 'draft_timer', None) is not None:
+        context.window_manager.event_timer_remove(cls.draft_timer)
+        cls.draft_timer = None
@@ -0,0 +1,56 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+import bmesh
+
+
+# Edit mesh updates are expensive (they push the whole mesh through the
+# depsgraph and re-evaluate the modifier stack), so operators that write
+# element data on every event queue them instead. Queued meshes are flushed
+# once the event loop goes idle, coalescing a burst of events into a single
+# update.
+pending_edit_mesh_updates = {}
+
+
+def queue_edit_mesh_update(data):
+    if not bpy.app.timers.is_registered(flush_edit_mesh_updates):
+        bpy.app.timers.register(flush_edit_mesh_updates, first_interval=0)
+
+    pending_edit_mesh_updates[data.name_full] = data
+
+
+def flush_edit_mesh_updates():
+    for data in pending_edit_mesh_updates.values():
+        try:
+            if data.is_editmode:
+                bmesh.update_edit_mesh(data, loop_triangles=False, destructive=False)
+        except ReferenceError:
+            pass
+
+    pending_edit_mesh_updates.clear()
+
+
+def get_selected_edges(bm):
+    return [edge for edge in bm.edges if edge.select]
+
+
+def get_bevel_weight_layer(bm):
+    return bm.edges.layers.bevel_weight.verify()
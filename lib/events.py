@@ -19,6 +19,7 @@
 # ---
 
 from math import copysign
+from enum import IntFlag
 from . preferences import get_preferences
 
 
@@ -28,43 +29,206 @@ def clicked(event, types): return has(event) and event.type in types and event.v
 def detected(event, types): return has(event) and event.type in types
 
 
+class Action(IntFlag):
+    NONE = 0
+    UNDO = 1 << 0
+    REDO = 1 << 1
+    ONE = 1 << 2
+    TWO = 1 << 3
+    THREE = 1 << 4
+    NUMERIC_INPUT = 1 << 5
+    RESET = 1 << 6
+    TOGGLE_PIN_OVERLAY = 1 << 7
+    TOGGLE_OPERATOR_PASSTHROUGH = 1 << 8
+    STEP_UP = 1 << 9
+    STEP_DOWN = 1 << 10
+    CONFIRM = 1 << 11
+    LEFT_CLICK = 1 << 12
+    CONFIRM_ALTERNATIVE = 1 << 13
+    CANCEL = 1 << 14
+    MOVEMENT_PASSTHROUGH = 1 << 15
+
+
+action_attributes = (
+    (Action.UNDO, 'key_undo'),
+    (Action.REDO, 'key_redo'),
+    (Action.ONE, 'key_one'),
+    (Action.TWO, 'key_two'),
+    (Action.THREE, 'key_three'),
+    (Action.NUMERIC_INPUT, 'key_numeric_input'),
+    (Action.RESET, 'key_reset'),
+    (Action.TOGGLE_PIN_OVERLAY, 'key_toggle_pin_overlay'),
+    (Action.TOGGLE_OPERATOR_PASSTHROUGH, 'key_toggle_operator_passthrough'),
+    (Action.STEP_UP, 'key_step_up'),
+    (Action.STEP_DOWN, 'key_step_down'),
+    (Action.CONFIRM, 'key_confirm'),
+    (Action.LEFT_CLICK, 'key_left_click'),
+    (Action.CONFIRM_ALTERNATIVE, 'key_confirm_alternative'),
+    (Action.CANCEL, 'key_cancel'),
+    (Action.MOVEMENT_PASSTHROUGH, 'key_movement_passthrough'),
+)
+
+modifier_attributes = (
+    'key_no_modifiers',
+    'key_ctrl',
+    'key_shift_ctrl',
+    'key_alt',
+    'key_shift_alt',
+    'key_ctrl_alt',
+    'key_shift_ctrl_alt',
+    'key_shift',
+    'key_shift_no_modifiers',
+)
+
+numeric_input_keys = ('ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT', 'NINE', 'ZERO', 'PERIOD', 'MINUS', 'NUMPAD_0', 'NUMPAD_1', 'NUMPAD_2', 'NUMPAD_3', 'NUMPAD_4', 'NUMPAD_5', 'NUMPAD_6', 'NUMPAD_7', 'NUMPAD_8', 'NUMPAD_9', 'NUMPAD_PERIOD', 'NUMPAD_MINUS', 'BACK_SPACE')
+
+
+def decode_modifiers(shift, ctrl, alt):
+    key_no_modifiers = not ctrl and not alt
+    key_ctrl = ctrl and not alt
+    key_alt = not ctrl and alt
+    key_ctrl_alt = ctrl and alt
+
+    return (
+        key_no_modifiers,
+        key_ctrl,
+        shift and key_ctrl,
+        key_alt,
+        shift and key_alt,
+        key_ctrl_alt,
+        shift and key_ctrl_alt,
+        shift,
+        shift and key_no_modifiers,
+    )
+
+
+# Every combination of (shift, ctrl, alt) mapped to the modifier attributes.
+modifier_table = {
+    (shift, ctrl, alt): decode_modifiers(shift, ctrl, alt)
+    for shift in (False, True) for ctrl in (False, True) for alt in (False, True)
+}
+
+no_modifiers = (False, ) * len(modifier_attributes)
+
+
+class EventDecoder:
+    def __init__(self, prefs):
+        self.prefs = prefs
+
+        # Actions triggered by an event type regardless of its value.
+        self.any_value = {
+            'WHEELUPMOUSE': Action.STEP_UP,
+            'WHEELDOWNMOUSE': Action.STEP_DOWN,
+            'LEFTMOUSE': Action.LEFT_CLICK,
+            'MIDDLEMOUSE': Action.MOVEMENT_PASSTHROUGH,
+        }
+
+        self.press = {}
+        self.release = {
+            'LEFTMOUSE': Action.CONFIRM,
+            'RIGHTMOUSE': Action.CANCEL,
+        }
+
+        press_actions = [
+            (numeric_input_keys, Action.NUMERIC_INPUT),
+            (('ONE', ), Action.ONE),
+            (('TWO', ), Action.TWO),
+            (('THREE', ), Action.THREE),
+            ((prefs.overlay_reset_key, ), Action.RESET),
+            ((prefs.overlay_pin_key, ), Action.TOGGLE_PIN_OVERLAY),
+            ((prefs.overlay_pause_key, ), Action.TOGGLE_OPERATOR_PASSTHROUGH),
+            (('UP_ARROW', 'RIGHT_ARROW'), Action.STEP_UP),
+            (('DOWN_ARROW', 'LEFT_ARROW'), Action.STEP_DOWN),
+            (('SPACE', 'RET', 'NUMPAD_ENTER'), Action.CONFIRM | Action.CONFIRM_ALTERNATIVE),
+            (('ESC', ), Action.CANCEL),
+        ]
+
+        for keys, action in press_actions:
+            for key in keys:
+                self.press[key] = self.press.get(key, Action.NONE) | action
+
+
+    def decode(self, event):
+        type = event.type
+
+        actions = self.any_value.get(type, Action.NONE)
+
+        if event.value == 'PRESS':
+            actions |= self.press.get(type, Action.NONE)
+
+            if type == 'Z' and event.ctrl and not event.alt:
+                actions |= Action.REDO | Action.UNDO if event.shift else Action.UNDO
+        elif event.value == 'RELEASE':
+            actions |= self.release.get(type, Action.NONE)
+
+        if event.alt and type in {'LEFTMOUSE', 'RIGHTMOUSE'}:
+            actions |= Action.MOVEMENT_PASSTHROUGH
+        elif type.startswith('NDOF'):
+            actions |= Action.MOVEMENT_PASSTHROUGH
+
+        return actions
+
+
+event_decoder = None
+
+
+def get_event_decoder():
+    global event_decoder
+
+    # The decoder's tables depend on the overlay key preferences, so rebuild
+    # them whenever the preferences snapshot is replaced.
+    prefs = get_preferences()
+    if event_decoder is None or event_decoder.prefs is not prefs:
+        event_decoder = EventDecoder(prefs)
+
+    return event_decoder
+
+
+def set_actions(cls, actions):
+    if getattr(cls, 'key_actions', None) == actions:
+        return
+
+    cls.key_actions = actions
+
+    for action, attribute in action_attributes:
+        setattr(cls, attribute, bool(actions & action))
+
+
+def set_modifiers(cls, modifiers):
+    if getattr(cls, 'key_modifier_state', None) is modifiers:
+        return
+
+    cls.key_modifier_state = modifiers
+
+    for attribute, value in zip(modifier_attributes, modifiers):
+        setattr(cls, attribute, value)
+
+
 def capture_modifier_keys(cls, event=None, mouse_x=0):
-    cls.key_no_modifiers = has(event) and not event.ctrl and not event.alt
-    cls.key_ctrl = has(event) and event.ctrl and not event.alt
-    cls.key_shift_ctrl = has(event) and event.shift and cls.key_ctrl
-    cls.key_alt = has(event) and not event.ctrl and event.alt
-    cls.key_shift_alt = has(event) and event.shift and cls.key_alt
-    cls.key_ctrl_alt = has(event) and event.ctrl and event.alt
-    cls.key_shift_ctrl_alt = has(event) and event.shift and cls.key_ctrl_alt
-    cls.key_shift = has(event) and event.shift
-    cls.key_shift_no_modifiers = has(event) and event.shift and cls.key_no_modifiers
-
-    cls.key_undo = cls.key_ctrl and pressed(event, {'Z'})
-    cls.key_redo = cls.key_ctrl and cls.key_shift and pressed(event, {'Z'})
-    
-    cls.key_one = pressed(event, {'ONE'})
-    cls.key_two = pressed(event, {'TWO'})
-    cls.key_three = pressed(event, {'THREE'})
+    # Every event may change what the overlay displays.
+    cls.overlay_revision = getattr(cls, 'overlay_revision', 0) + 1
+
+    if event is None:
+        set_modifiers(cls, no_modifiers)
+        set_actions(cls, Action.NONE)
+    else:
+        set_modifiers(cls, modifier_table[(event.shift, event.ctrl, event.alt)])
+
+        # Mouse movement never triggers a key action, so skip decoding.
+        if event.type == 'MOUSEMOVE':
+            set_actions(cls, Action.NONE)
+        else:
+            set_actions(cls, get_event_decoder().decode(event))
+
+    capture_mouse_values(cls, event, mouse_x)
 
-    cls.key_numeric_input = pressed(event, {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT', 'NINE', 'ZERO', 'PERIOD', 'MINUS', 'NUMPAD_0', 'NUMPAD_1', 'NUMPAD_2', 'NUMPAD_3', 'NUMPAD_4', 'NUMPAD_5', 'NUMPAD_6', 'NUMPAD_7', 'NUMPAD_8', 'NUMPAD_9', 'NUMPAD_PERIOD', 'NUMPAD_MINUS', 'BACK_SPACE'})
-    cls.key_reset = pressed(event, {get_preferences().overlay_reset_key})
-    
-    cls.key_toggle_pin_overlay = pressed(event, {get_preferences().overlay_pin_key})
-    cls.key_toggle_operator_passthrough = pressed(event, {get_preferences().overlay_pause_key})
-    
-    cls.key_step_up = detected(event, {'WHEELUPMOUSE'}) or pressed(event, {'UP_ARROW'}) or pressed(event, {'RIGHT_ARROW'})
-    cls.key_step_down = detected(event, {'WHEELDOWNMOUSE'}) or pressed(event, {'DOWN_ARROW'}) or pressed(event, {'LEFT_ARROW'})
-    
-    cls.key_confirm = clicked(event, {'LEFTMOUSE'}) or pressed(event, {'SPACE', 'RET', 'NUMPAD_ENTER'})
-    cls.key_left_click = detected(event, {'LEFTMOUSE'})
-    cls.key_confirm_alternative = pressed(event, {'SPACE', 'RET', 'NUMPAD_ENTER'})
-    cls.key_cancel = clicked(event, {'RIGHTMOUSE'}) or pressed(event, {'ESC'})
 
-    cls.key_movement_passthrough = detected(event, {'MIDDLEMOUSE'}) or (has(event) and event.alt and event.type in {'LEFTMOUSE', 'RIGHTMOUSE'}) or (has(event) and event.type.startswith('NDOF'))
+def capture_mouse_values(cls, event, mouse_x):
+    prefs = get_preferences()
 
     raw_mouse_delta = 0 if event == None else (event.mouse_x - cls.prev_mouse_x)
 
-    cls.mouse_delta = raw_mouse_delta * get_preferences().mouse_value_scalar
+    cls.mouse_delta = raw_mouse_delta * prefs.mouse_value_scalar
     cls.mouse_value = cls.mouse_delta * (0.1 if cls.key_shift else 1)
     cls.prev_mouse_x = mouse_x if event == None else event.mouse_x
     
@@ -76,8 +240,8 @@ def capture_modifier_keys(cls, event=None, mouse_x=0):
         cls.mouse_travel = 0
 
     cls.prev_mouse_travel_div = 0 if event == None else cls.mouse_travel_div
-    cls.mouse_travel_div = cls.mouse_travel // get_preferences().mouse_value_steps
-    if cls.prev_mouse_travel_div != cls.mouse_travel_div and abs(cls.mouse_travel) >= get_preferences().mouse_value_steps:
+    cls.mouse_travel_div = cls.mouse_travel // prefs.mouse_value_steps
+    if cls.prev_mouse_travel_div != cls.mouse_travel_div and abs(cls.mouse_travel) >= prefs.mouse_value_steps:
         cls.mouse_step = int(1 * copysign(1, cls.mouse_travel))
     else:
         cls.mouse_step = 0
@@ -87,4 +251,4 @@ def capture_modifier_keys(cls, event=None, mouse_x=0):
         cls.mouse_value = 0
         cls.mouse_warped = False
 
-    cls.mouse_value_mag = cls.mouse_value * 100
\ No newline at end of file
+    cls.mouse_value_mag = cls.mouse_value * 100
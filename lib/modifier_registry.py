@@ -0,0 +1,270 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from bpy.app.handlers import persistent
+from collections import namedtuple
+
+
+ModifierTag = namedtuple('ModifierTag', ['operator', 'role', 'name', 'version'])
+
+
+registry_key = 'nd_modifiers'
+registry_version = 1
+
+boolean_operators = {'nd.bool_vanilla', 'nd.bool_inset', 'nd.bool_slice'}
+
+nd_modifier_names = {
+    "Bevel — ND B": ('nd.bevel', 'bevel'),
+    "Weld — ND B": ('nd.bevel', 'weld'),
+    "Bevel — ND EB": ('nd.edge_bevel', 'bevel'),
+    "Weld — ND EB": ('nd.edge_bevel', 'weld'),
+    "Bevel — ND VB": ('nd.vertex_bevel', 'bevel'),
+    "Weld — ND VB": ('nd.vertex_bevel', 'weld'),
+    "Weld — ND VB LA": ('nd.vertex_bevel', 'late_weld'),
+    "Bevel — ND WNB": ('nd.weighted_normal_bevel', 'bevel'),
+    "Weighted Normal — ND WNB": ('nd.weighted_normal_bevel', 'weighted_normal'),
+    "Difference — ND Bool": ('nd.bool_vanilla', 'difference'),
+    "Union — ND Bool": ('nd.bool_vanilla', 'union'),
+    "Intersect — ND Bool": ('nd.bool_vanilla', 'intersect'),
+    "Inset/Outset — ND Bool": ('nd.bool_inset', 'boolean'),
+    "Thickness — ND Bool": ('nd.bool_inset', 'thickness'),
+    "Intersection — ND Bool": ('nd.bool_inset', 'intersection'),
+    "Offset — ND SOL": ('nd.solidify', 'offset'),
+    "Thickness — ND SOL": ('nd.solidify', 'thickness'),
+    "Offset — ND SCR": ('nd.screw', 'offset'),
+    "Screw — ND SCR": ('nd.screw', 'screw'),
+    "Extrusion — ND PE": ('nd.profile_extrude', 'extrusion'),
+    "Weighting — ND PE": ('nd.profile_extrude', 'weighting'),
+    "Offset — ND PE": ('nd.profile_extrude', 'offset'),
+    "Mirror — ND": ('nd.mirror', 'mirror'),
+    "Array³ X — ND": ('nd.array_cubed', 'array_x'),
+    "Array³ Y — ND": ('nd.array_cubed', 'array_y'),
+    "Array³ Z — ND": ('nd.array_cubed', 'array_z'),
+    "Displace — ND CA": ('nd.circular_array', 'displace'),
+    "Circular Array — ND CA": ('nd.circular_array', 'array'),
+    "Translate X — ND FO": ('nd.set_origin', 'translate_x'),
+    "Translate Y — ND FO": ('nd.set_origin', 'translate_y'),
+    "Translate Z — ND FO": ('nd.set_origin', 'translate_z'),
+    "Lattice — ND L": ('nd.lattice', 'lattice'),
+    "Deform — ND SD": ('nd.simple_deform', 'deform'),
+    "Decimate — ND SD": ('nd.decimate', 'decimate'),
+    "Weld — ND SW": ('nd.weld', 'weld'),
+    "Weighted Normal — ND WN": ('nd.wn', 'weighted_normal'),
+    "Triangulate — ND": ('nd.triangulate', 'triangulate'),
+    "Bevel — ND CIRC": ('nd.circularize', 'bevel'),
+    "Weld — ND CIRC": ('nd.circularize', 'weld'),
+    "Decimate — ND CIRC": ('nd.circularize', 'decimate'),
+    "Radius — ND RCP": ('nd.recon_poly', 'radius'),
+    "Width — ND RCP": ('nd.recon_poly', 'width'),
+    "Segments — ND RCP": ('nd.recon_poly', 'segments'),
+    "Decimate — ND RCP": ('nd.recon_poly', 'decimate'),
+    "Offset — ND SH": ('nd.screw_head', 'offset'),
+}
+
+# Parsed tags per object, keyed by session_uid. An object's entry is dropped
+# whenever the depsgraph reports an update for it, a modifier is renamed, or
+# tag_modifier/untag_modifier write its records, and file loads and undo steps
+# clear the whole cache since they can rewrite the stored records.
+modifier_tag_cache = {}
+modifier_rename_owner = object()
+
+
+def register_registry_handlers():
+    if registry_update_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(registry_update_handler)
+
+    if registry_load_handler not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(registry_load_handler)
+
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if clear_modifier_tag_cache not in handlers:
+            handlers.append(clear_modifier_tag_cache)
+
+    subscribe_modifier_renames()
+
+
+def unregister_registry_handlers():
+    if registry_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(registry_update_handler)
+
+    if registry_load_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(registry_load_handler)
+
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if clear_modifier_tag_cache in handlers:
+            handlers.remove(clear_modifier_tag_cache)
+
+    bpy.msgbus.clear_by_owner(modifier_rename_owner)
+    clear_modifier_tag_cache()
+
+
+def subscribe_modifier_renames():
+    # Message bus subscriptions don't survive a file load, so this runs again
+    # from registry_load_handler.
+    bpy.msgbus.clear_by_owner(modifier_rename_owner)
+    bpy.msgbus.subscribe_rna(key=(bpy.types.Modifier, 'name'), owner=modifier_rename_owner, args=(), notify=clear_modifier_tag_cache)
+
+
+@persistent
+def registry_update_handler(scene, depsgraph):
+    if not modifier_tag_cache:
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            modifier_tag_cache.pop(update.id.original.session_uid, None)
+
+
+@persistent
+def registry_load_handler(*args):
+    clear_modifier_tag_cache()
+    subscribe_modifier_renames()
+
+
+@persistent
+def clear_modifier_tag_cache(*args):
+    modifier_tag_cache.clear()
+
+
+def get_canonical_tag(mod_name):
+    entry = nd_modifier_names.get(mod_name)
+
+    # Blender de-duplicates names with a ".001" style suffix.
+    if entry is None and mod_name[-4:-3] == '.' and mod_name[-3:].isdigit():
+        mod_name = mod_name[:-4]
+        entry = nd_modifier_names.get(mod_name)
+
+    if entry is None:
+        return None
+
+    # Modifiers created before the registry existed are recognised by name and
+    # reported with version 0 until they are written back to the object.
+    return ModifierTag(entry[0], entry[1], mod_name, 0)
+
+
+def create_tag(record):
+    return ModifierTag(record['operator'], record['role'], record['name'], record['version'])
+
+
+def create_record(mod, tag):
+    return {
+        'operator': tag.operator,
+        'role': tag.role,
+        'name': tag.name,
+        'type': mod.type,
+        'version': registry_version,
+    }
+
+
+def get_modifier_tags(object):
+    # The returned mapping is shared with the cache and must not be modified.
+    uid = object.original.session_uid
+    tags = modifier_tag_cache.get(uid)
+
+    if tags is None:
+        tags = modifier_tag_cache[uid] = read_modifier_tags(object)
+
+    return tags
+
+
+def read_modifier_tags(object):
+    records = object.get(registry_key)
+    tags = {}
+    untagged = []
+    claimed = set()
+
+    for mod in object.modifiers:
+        record = records.get(mod.name) if records else None
+
+        if record is not None and record['type'] == mod.type:
+            tags[mod.name] = create_tag(record)
+            claimed.add(mod.name)
+            continue
+
+        tag = get_canonical_tag(mod.name)
+        if tag is not None:
+            tags[mod.name] = tag
+        else:
+            untagged.append(mod)
+
+    if records and untagged and len(claimed) < len(records):
+        reconcile_renamed_modifiers(records, claimed, untagged, tags)
+
+    return tags
+
+
+def reconcile_renamed_modifiers(records, claimed, untagged, tags):
+    orphans = {name: record for name, record in records.items() if name not in claimed}
+
+    # A renamed modifier is only matched back to its record when it is the
+    # sole unclaimed modifier of that type; anything ambiguous stays untagged.
+    for name, record in orphans.items():
+        candidates = [mod for mod in untagged if mod.name not in tags and mod.type == record['type']]
+        if len(candidates) == 1:
+            tags[candidates[0].name] = create_tag(record)
+
+
+def get_modifier_tag(object, mod):
+    return get_modifier_tags(object).get(mod.name)
+
+
+def get_nd_modifiers(object, operator=None):
+    tags = get_modifier_tags(object)
+    mods = {}
+
+    for mod in object.modifiers:
+        tag = tags.get(mod.name)
+        if tag is None or (operator is not None and tag.operator != operator):
+            continue
+
+        # Prefer the modifier that still carries the canonical name when the
+        # same role exists more than once (e.g. "Bevel — ND B.001").
+        if tag.name not in mods or mod.name == tag.name:
+            mods[tag.name] = mod
+
+    return mods
+
+
+def get_nd_operators(object):
+    return {tag.operator for tag in get_modifier_tags(object).values()}
+
+
+def tag_modifier(object, mod, tag):
+    tags = dict(get_modifier_tags(object))
+    tags[mod.name] = tag
+
+    records = {}
+    for current in object.modifiers:
+        current_tag = tags.get(current.name)
+        if current_tag is not None:
+            records[current.name] = create_record(current, current_tag)
+
+    object[registry_key] = records
+    modifier_tag_cache.pop(object.original.session_uid, None)
+
+
+def untag_modifier(object, mod_name):
+    records = object.get(registry_key)
+
+    if records and mod_name in records:
+        del records[mod_name]
+
+    modifier_tag_cache.pop(object.original.session_uid, None)
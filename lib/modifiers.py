@@ -19,12 +19,29 @@
 # ---
 
 import bpy
-import re
+from . modifier_registry import ModifierTag, registry_version, get_canonical_tag, get_modifier_tags, tag_modifier, untag_modifier
 
 
-def new_modifier(object, mod_name, mod_type, rectify=True):
+late_modifier_tags = {
+    ('nd.weighted_normal_bevel', 'bevel'),
+    ('nd.weighted_normal_bevel', 'weighted_normal'),
+    ('nd.weld', 'weld'),
+    ('nd.bevel', 'weld'),
+    ('nd.decimate', 'decimate'),
+}
+
+
+def new_modifier(object, mod_name, mod_type, rectify=True, tag=None):
     mod = object.modifiers.new(mod_name, mod_type)
 
+    if tag:
+        tag = ModifierTag(*tag, mod_name, registry_version)
+    else:
+        tag = get_canonical_tag(mod_name)
+
+    if tag:
+        tag_modifier(object, mod, tag)
+
     mod.show_viewport = True
     mod.show_in_editmode = True
     mod.show_expanded = False
@@ -45,24 +62,15 @@ def rectify_mod_order(object, mod_name):
     if len(mods) < 2:
         return
 
+    tags = get_modifier_tags(object)
+
     matching_mod_index = None
     for index, mod in enumerate(mods):
-        if "— ND WNB" in mod.name:
+        tag = tags.get(mod.name)
+        if tag and (tag.operator, tag.role) in late_modifier_tags:
             matching_mod_index = index
             break
 
-        if "Weld — ND SW" in mod.name:
-            matching_mod_index = index
-            break
-        
-        if "Weld — ND B" in mod.name:
-            matching_mod_index = index
-            break
-        
-        if "Decimate — ND SD" in mod.name:
-            matching_mod_index = index
-            break
-        
         if mod.type == 'BEVEL' and mod.affect == 'EDGES' and mod.limit_method == 'ANGLE':
             if mod.segments > 1 or (mod.segments == 1 and mod.harden_normals):
                 matching_mod_index = index
@@ -71,15 +79,18 @@ def rectify_mod_order(object, mod_name):
     if matching_mod_index is None:
         return
 
-    bpy.ops.object.modifier_move_to_index({'object': object}, modifier=mod_name, index=matching_mod_index)
+    move_modifier(object, mod_name, matching_mod_index)
 
 
 def remove_problematic_bevels(object):
     mods = [mod for mod in object.modifiers]
     remove_mods = []
 
+    tags = get_modifier_tags(object)
+
     for mod in mods:
-        if "— ND WNB" in mod.name:
+        tag = tags.get(mod.name)
+        if tag and tag.operator == 'nd.weighted_normal_bevel':
             remove_mods.append(mod)
             continue
         elif mod.type == 'BEVEL' and mod.affect == 'EDGES' and mod.limit_method == 'ANGLE':
@@ -91,21 +102,93 @@ def remove_problematic_bevels(object):
         object.modifiers.remove(mod)
 
 
-def remove_modifiers_ending_with(objects, suffix):
-    for object in objects:
-        mods = object.modifiers
-        mod_names = [mod.name for mod in mods]
-        for mod_name in mod_names:
-            base_name = re.sub(r"(.+?)(\.[0-9]{3})$", r"\1", mod_name)
-            if base_name.endswith(suffix):
-                bpy.ops.object.modifier_remove({'object': object}, modifier=mod_name)
+def move_modifier(object, mod_name, index):
+    mods = object.modifiers
+    current_index = mods.find(mod_name)
 
+    if current_index == -1 or current_index == index:
+        return
 
-def remove_modifiers_starting_with(objects, suffix):
+    # ObjectModifiers.move is only exposed from Blender 3.5 onwards.
+    if hasattr(mods, 'move'):
+        mods.move(current_index, index)
+    else:
+        bpy.ops.object.modifier_move_to_index({'object': object}, modifier=mod_name, index=index)
+
+
+def remove_modifiers(object, mods):
+    for mod in list(mods):
+        untag_modifier(object, mod.name)
+        object.modifiers.remove(mod)
+
+
+def remove_nd_modifiers(objects, operator):
     for object in objects:
-        mods = object.modifiers
-        mod_names = [mod.name for mod in mods]
-        for mod_name in mod_names:
-            base_name = re.sub(r"(.+?)(\.[0-9]{3})$", r"\1", mod_name)
-            if base_name.startswith(suffix):
-                bpy.ops.object.modifier_remove({'object': object}, modifier=mod_name)
\ No newline at end of file
+        tags = get_modifier_tags(object)
+        remove_modifiers(object, [mod for mod in object.modifiers if mod.name in tags and tags[mod.name].operator == operator])
+
+
+def replace_object_mesh(object, mesh):
+    previous_mesh = object.data
+    object.data = mesh
+
+    if previous_mesh.users == 0:
+        mesh_name = previous_mesh.name
+        bpy.data.meshes.remove(previous_mesh)
+        mesh.name = mesh_name
+
+
+def apply_modifiers(context, stacks):
+    # Applying a subset of a stack one modifier at a time evaluates each of them
+    # against the base mesh in stack order, which is the same as evaluating the
+    # stack once with every other modifier hidden from the viewport.
+    hidden_mods = []
+    evaluated_stacks = []
+
+    # Objects used by another object's modifiers (e.g. boolean cutters) must
+    # keep their whole stack visible while the batch is evaluated.
+    referenced_objects = set()
+    for object, mods_to_apply, mods_to_remove in stacks:
+        for mod_name in mods_to_apply:
+            reference = getattr(object.modifiers[mod_name], 'object', None)
+            if reference is not None:
+                referenced_objects.add(reference.name)
+
+    for object, mods_to_apply, mods_to_remove in stacks:
+        if not mods_to_apply:
+            continue
+
+        if object.type != 'MESH' or object.data.shape_keys or object.data.users > 1 or object.name in referenced_objects:
+            for mod_name in mods_to_apply:
+                try:
+                    bpy.ops.object.modifier_apply({'object': object}, modifier=mod_name)
+                except:
+                    # If the modifier is disabled, just remove it.
+                    bpy.ops.object.modifier_remove({'object': object}, modifier=mod_name)
+            continue
+
+        for mod in object.modifiers:
+            if mod.name not in mods_to_apply and mod.show_viewport:
+                mod.show_viewport = False
+                hidden_mods.append(mod)
+
+        evaluated_stacks.append(object)
+
+    if evaluated_stacks:
+        depsgraph = context.evaluated_depsgraph_get()
+
+        for object in evaluated_stacks:
+            object_eval = object.evaluated_get(depsgraph)
+            replace_object_mesh(object, bpy.data.meshes.new_from_object(object_eval, preserve_all_data_layers=True, depsgraph=depsgraph))
+
+    for mod in hidden_mods:
+        mod.show_viewport = True
+
+    for object, mods_to_apply, mods_to_remove in stacks:
+        names = set(mods_to_remove)
+        if object in evaluated_stacks:
+            names.update(mods_to_apply)
+
+        remove_modifiers(object, [mod for mod in object.modifiers if mod.name in names])
+
+    context.view_layer.update()
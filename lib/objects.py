@@ -20,9 +20,11 @@
 
 import bpy 
 import bmesh
+import numpy as np
 from math import radians
-from mathutils.geometry import distance_point_to_plane, normal
 from . preferences import get_preferences
+from . modifier_registry import get_modifier_tags
+from . modifiers import remove_modifiers, replace_object_mesh
 
 
 def add_single_vertex_object(cls, context, name):
@@ -76,43 +78,39 @@ def create_duplicate_liftable_geometry(context, mode, object_name, ignore_comple
 
     if ignore_complex_geo:
         mods = [(mod.name, mod) for mod in context.active_object.modifiers]
+        tags = get_modifier_tags(context.active_object)
+        remove_mods = []
+
         for name, mod in mods:
             if not mod:
                 continue
 
             if mod.type == 'SUBSURF':
-                bpy.ops.object.modifier_remove(modifier=name)
+                remove_mods.append(mod)
                 continue
             
             if mod.type == 'BEVEL' and mod.affect == 'EDGES' and mod.limit_method == 'ANGLE':
                 if mod.segments > 1 or (mod.segments == 1 and mod.harden_normals):
-                    bpy.ops.object.modifier_remove(modifier=name)
+                    remove_mods.append(mod)
                     continue
             
-            if "— ND WNB" in mod.name:
-                bpy.ops.object.modifier_remove(modifier=name)
+            if name in tags and tags[name].operator == 'nd.weighted_normal_bevel':
+                remove_mods.append(mod)
                 continue
 
+        remove_modifiers(context.active_object, remove_mods)
+
     depsgraph = context.evaluated_depsgraph_get()
     object_eval = context.active_object.evaluated_get(depsgraph)
+    mesh = bpy.data.meshes.new_from_object(object_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
 
     context.active_object.modifiers.clear()
 
-    vertex_groups = context.active_object.vertex_groups.values()
-    for vg in vertex_groups:
-        context.active_object.vertex_groups.remove(vg)
-
-    bm = bmesh.new()
-    bm.from_mesh(object_eval.data)
-
-    bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
-
-    selected_edges = list(bm.edges)
-    for edge in selected_edges:
-        edge[bevel_weight_layer] = 0
-
-    bm.to_mesh(context.active_object.data)
-    bm.free()
+    # Vertex group names live on the mesh, so they are cleared once the new
+    # mesh is in place.
+    replace_object_mesh(context.active_object, mesh)
+    context.active_object.vertex_groups.clear()
+    clear_edge_bevel_weights(mesh)
 
     bpy.ops.object.mode_set_with_submode(mode='EDIT', mesh_select_mode=mode)
     bpy.ops.mesh.select_all(action='DESELECT')
@@ -123,25 +121,12 @@ def create_duplicate_liftable_geometry(context, mode, object_name, ignore_comple
     bpy.ops.mesh.customdata_custom_splitnormals_clear()
 
 
-def is_planar(bm, tolerance=0.0001):
-    faces = list(bm.faces)
-
-    if len(faces) < 1:
-        return True
-    
-    head = faces[0]
-
-    if len(faces) == 1 and len(head.verts) == 3:
-        return True
-
-    co = head.verts[0].co
-    norm = normal([v.co for v in head.verts[:3]])
-
-    tail = faces[1:]
-    for f in tail:
-        verts = [v.co for v in f.verts]
-        for v in verts:
-            if not abs(distance_point_to_plane(v, co, norm)) < tolerance:
-                return False
+def clear_edge_bevel_weights(mesh):
+    # Blender 4.0 moved bevel weights into a generic attribute which can simply
+    # be dropped; older versions expose them per edge.
+    attribute = mesh.attributes.get('bevel_weight_edge')
 
-    return True
\ No newline at end of file
+    if attribute is not None:
+        mesh.attributes.remove(attribute)
+    elif bpy.app.version < (4, 0, 0) and len(mesh.edges) > 0:
+        mesh.edges.foreach_set('bevel_weight', np.zeros(len(mesh.edges), dtype=np.float32))
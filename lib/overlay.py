@@ -20,18 +20,26 @@
 
 import bpy
 import blf
-from . preferences import get_preferences
+import gpu
+from math import inf, floor, ceil
+from mathutils import Matrix
+from gpu_extras.presets import draw_texture_2d
+from . preferences import get_preferences, get_addon_preferences
+from . profiler import profiled_draw_callback, get_profile_summary
+from . redraw import add_redraw_source, remove_redraw_source, is_source_region, refresh_redraw_sources, frame_drawn
 
 
 def register_draw_handler(cls, callback):
     handler = bpy.app.driver_namespace.get('nd.overlay')
 
     if not handler:
-        handler = bpy.types.SpaceView3D.draw_handler_add(callback, (cls, ), 'WINDOW', 'POST_PIXEL')
+        cls.overlay_callback = callback
+
+        handler = bpy.types.SpaceView3D.draw_handler_add(profiled_draw_callback(draw_retained_overlay), (cls, ), 'WINDOW', 'POST_PIXEL')
         dns = bpy.app.driver_namespace
         dns['nd.overlay'] = handler
 
-        redraw_regions()
+        add_redraw_source('nd.overlay', cls, overlay_signature)
 
 
 def unregister_draw_handler():
@@ -41,15 +49,8 @@ def unregister_draw_handler():
         bpy.types.SpaceView3D.draw_handler_remove(handler, 'WINDOW')
         del bpy.app.driver_namespace['nd.overlay']
 
-        redraw_regions()
-
-
-def redraw_regions():
-    for area in bpy.context.window.screen.areas:
-        if area.type == 'VIEW_3D':
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    region.tag_redraw()
+        free_overlay_offscreen()
+        remove_redraw_source('nd.overlay')
 
 
 def toggle_pin_overlay(cls, event):
@@ -59,9 +60,9 @@ def toggle_pin_overlay(cls, event):
     cls.pin_overlay = not cls.pin_overlay
 
     if get_preferences().lock_overlay_pinning:
-        get_preferences().overlay_pinned = cls.pin_overlay
-        get_preferences().overlay_pin_x = cls.overlay_x
-        get_preferences().overlay_pin_y = cls.overlay_y
+        get_addon_preferences().overlay_pinned = cls.pin_overlay
+        get_addon_preferences().overlay_pin_x = cls.overlay_x
+        get_addon_preferences().overlay_pin_y = cls.overlay_y
 
 
 def toggle_operator_passthrough(cls):
@@ -87,6 +88,13 @@ def init_overlay(cls, event):
     cls.operator_passthrough = False
     cls.mouse_warped = False
 
+    cls.overlay_revision = 0
+    cls.overlay_draw_list = []
+    cls.overlay_cache_revision = None
+    cls.overlay_cache_draw_list = ()
+
+    free_overlay_offscreen()
+
     if get_preferences().lock_overlay_pinning:
         cls.pin_overlay = get_preferences().overlay_pinned
         cls.overlay_x = get_preferences().overlay_pin_x
@@ -94,6 +102,8 @@ def init_overlay(cls, event):
 
 
 def update_overlay(cls, context, event):
+    cls.overlay_revision += 1
+
     if not cls.pin_overlay:
         cls.overlay_x = event.mouse_x - cls.region_offset_x + cls.overlay_offset_x
         cls.overlay_y = event.mouse_y - cls.region_offset_y + cls.overlay_offset_y
@@ -101,7 +111,7 @@ def update_overlay(cls, context, event):
     if not cls.operator_passthrough and get_preferences().enable_mouse_values:
         wrap_cursor(cls, context, event)
 
-    redraw_regions()
+    refresh_redraw_sources()
 
 
 def wrap_cursor(cls, context, event):
@@ -124,23 +134,166 @@ def wrap_cursor(cls, context, event):
         context.window.cursor_warp(event.mouse_x, mouse_y)
 
 
+# The overlay is drawn in retained mode. The operator's draw callback only
+# runs when the overlay revision has changed (i.e. after an event), and the
+# draw_* helpers below emit (size, color, x, y, text) commands relative to the
+# overlay origin rather than drawing directly. When the resulting draw list is
+# unchanged, the cached list (or offscreen texture) is simply re-rendered at
+# the current overlay position.
+
+overlay_offscreen = None
+overlay_offscreen_draw_list = None
+overlay_offscreen_bounds = None
+
+
+def build_overlay_layout(cls):
+    if cls.overlay_cache_revision == cls.overlay_revision:
+        return
+
+    cls.overlay_draw_list = []
+    cls.overlay_callback(cls)
+
+    draw_list = tuple(cls.overlay_draw_list)
+    if draw_list != cls.overlay_cache_draw_list:
+        cls.overlay_cache_draw_list = draw_list
+
+    cls.overlay_cache_revision = cls.overlay_revision
+
+
+def overlay_signature(cls):
+    build_overlay_layout(cls)
+
+    return (cls.overlay_x, cls.overlay_y, cls.overlay_cache_draw_list)
+
+
+def draw_retained_overlay(cls):
+    if not is_source_region('nd.overlay'):
+        return
+
+    frame_drawn()
+    build_overlay_layout(cls)
+
+    if get_preferences().overlay_offscreen_rendering and draw_offscreen_overlay(cls):
+        return
+
+    render_draw_list(cls.overlay_cache_draw_list, cls.dpi, cls.overlay_x, cls.overlay_y)
+
+
+def emit(cls, size, color, x, y, text):
+    cls.overlay_draw_list.append((size, color, x, y, text))
+
+
+def render_draw_list(draw_list, dpi, origin_x, origin_y):
+    current_size = None
+    current_color = None
+
+    for size, color, x, y, text in draw_list:
+        if size != current_size:
+            blf.size(0, size, dpi)
+            current_size = size
+
+        if color != current_color:
+            blf.color(0, *color)
+            current_color = color
+
+        blf.position(0, origin_x + x, origin_y + y, 0)
+        blf.draw(0, text)
+
+
+def measure_draw_list(draw_list, dpi):
+    min_x, min_y, max_x, max_y = inf, inf, -inf, -inf
+
+    for size, color, x, y, text in draw_list:
+        blf.size(0, size, dpi)
+        width, height = blf.dimensions(0, text)
+
+        min_x = min(min_x, x)
+        min_y = min(min_y, y - height * 0.5)
+        max_x = max(max_x, x + width)
+        max_y = max(max_y, y + height)
+
+    padding = 4
+
+    return floor(min_x) - padding, floor(min_y) - padding, ceil(max_x) + padding, ceil(max_y) + padding
+
+
+def free_overlay_offscreen():
+    global overlay_offscreen, overlay_offscreen_draw_list, overlay_offscreen_bounds
+
+    if overlay_offscreen is not None:
+        overlay_offscreen.free()
+
+    overlay_offscreen = None
+    overlay_offscreen_draw_list = None
+    overlay_offscreen_bounds = None
+
+
+def render_overlay_offscreen(draw_list, dpi):
+    global overlay_offscreen, overlay_offscreen_draw_list, overlay_offscreen_bounds
+
+    free_overlay_offscreen()
+
+    min_x, min_y, max_x, max_y = measure_draw_list(draw_list, dpi)
+    width, height = max_x - min_x, max_y - min_y
+
+    offscreen = gpu.types.GPUOffScreen(width, height)
+
+    with offscreen.bind():
+        framebuffer = gpu.state.active_framebuffer_get()
+        framebuffer.clear(color=(0.0, 0.0, 0.0, 0.0))
+
+        with gpu.matrix.push_pop(), gpu.matrix.push_pop_projection():
+            gpu.matrix.load_matrix(Matrix.Identity(4))
+            gpu.matrix.load_projection_matrix(Matrix((
+                (2 / width, 0, 0, -1),
+                (0, 2 / height, 0, -1),
+                (0, 0, 1, 0),
+                (0, 0, 0, 1),
+            )))
+
+            gpu.state.blend_set('ALPHA')
+            render_draw_list(draw_list, dpi, -min_x, -min_y)
+            gpu.state.blend_set('NONE')
+
+    overlay_offscreen = offscreen
+    overlay_offscreen_draw_list = draw_list
+    overlay_offscreen_bounds = (min_x, min_y, width, height)
+
+
+def draw_offscreen_overlay(cls):
+    if not cls.overlay_cache_draw_list:
+        return True
+
+    if overlay_offscreen_draw_list != cls.overlay_cache_draw_list:
+        try:
+            render_overlay_offscreen(cls.overlay_cache_draw_list, cls.dpi)
+        except Exception:
+            free_overlay_offscreen()
+            return False
+
+    min_x, min_y, width, height = overlay_offscreen_bounds
+
+    gpu.state.blend_set('ALPHA_PREMULT')
+    draw_texture_2d(overlay_offscreen.texture_color, (cls.overlay_x + min_x, cls.overlay_y + min_y), width, height)
+    gpu.state.blend_set('NONE')
+
+    return True
+
+
 def draw_header(cls):
     is_summoned = getattr(cls, "summoned", False)
+    profile_summary = get_profile_summary(cls)
 
     if cls.operator_passthrough:
         r, g, b = get_preferences().overlay_header_paused_color
-        blf.color(0, r, g, b, 1.0)
     elif is_summoned and not cls.operator_passthrough:
         r, g, b = get_preferences().overlay_header_recalled_color
-        blf.color(0, r, g, b, 1.0)
     else:
         r, g, b = get_preferences().overlay_header_standard_color
-        blf.color(0, r, g, b, 1.0)
 
-    if cls.operator_passthrough or is_summoned or cls.pin_overlay:
-        blf.size(0, 11, cls.dpi)
-        blf.position(0, cls.overlay_x + (1 * cls.dpi_scalar), cls.overlay_y + (26 * cls.dpi_scalar), 0)
+    color = (r, g, b, 1.0)
 
+    if cls.operator_passthrough or is_summoned or cls.pin_overlay or profile_summary:
         states = []
         if cls.operator_passthrough:
             states.append("PAUSED")
@@ -148,107 +301,72 @@ def draw_header(cls):
             states.append("RECALL")
         if cls.pin_overlay:
             states.append("PINNED")
+        if profile_summary:
+            states.append(profile_summary)
 
-        blf.draw(0, " // ".join(states))
+        emit(cls, 11, color, 1 * cls.dpi_scalar, 26 * cls.dpi_scalar, " // ".join(states))
 
-    blf.size(0, 24, cls.dpi) 
-    blf.position(0, cls.overlay_x, cls.overlay_y, 0)
-    blf.draw(0, "ND — " + cls.bl_label)
+    emit(cls, 24, color, 0, 0, "ND — " + cls.bl_label)
 
     cls.line_step = 0
 
 
 def draw_property(cls, property_content, metadata_content, active=False, alt_mode=False, mouse_value=False, input_stream=None):
-    blf.size(0, 28, cls.dpi)
-
     is_ok, is_value, is_raw = input_stream or (False, None, None)
     base_r, base_g, base_b = get_preferences().overlay_base_color
-    
+    line_offset = cls.line_spacer * cls.line_step
+
     if cls.operator_passthrough:
-        blf.color(0, base_r, base_g, base_b, 0.2)
+        bullet_color = (base_r, base_g, base_b, 0.2)
     elif is_value is not None and active:
-        r, g, b = get_preferences().overlay_option_manual_override_color
-        blf.color(0, r, g, b, 1.0)
+        bullet_color = (*get_preferences().overlay_option_manual_override_color, 1.0)
     elif active:
-        r, g, b = get_preferences().overlay_option_active_color
-        blf.color(0, r, g, b, 1.0)
+        bullet_color = (*get_preferences().overlay_option_active_color, 1.0)
     else:
-        blf.color(0, base_r, base_g, base_b, 0.1)
-    
-    blf.position(0, cls.overlay_x, cls.overlay_y - ((38 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
-    
-    if bpy.app.version >= (3, 4, 0):
-        blf.size(0, 14, cls.dpi)
-        blf.position(0, cls.overlay_x, cls.overlay_y - ((31 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
+        bullet_color = (base_r, base_g, base_b, 0.1)
+
+    bullet = "◑" if not cls.operator_passthrough and alt_mode else "●"
 
-    if not cls.operator_passthrough and alt_mode:
-        blf.draw(0, "◑")
+    if bpy.app.version >= (3, 4, 0):
+        emit(cls, 14, bullet_color, 0, -((31 * cls.dpi_scalar) + line_offset), bullet)
     else:
-        blf.draw(0, "●")
+        emit(cls, 28, bullet_color, 0, -((38 * cls.dpi_scalar) + line_offset), bullet)
 
     if get_preferences().enable_mouse_values and mouse_value:
-        blf.size(0, 22, cls.dpi)
-        blf.position(0, cls.overlay_x - (15 * cls.dpi_scalar), cls.overlay_y - ((34 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
-        blf.draw(0, "»")
-
-    blf.size(0, 16, cls.dpi)
-
-    if cls.operator_passthrough:
-        blf.color(0, base_r, base_g, base_b, 0.2)
-    else:
-        blf.color(0, base_r, base_g, base_b, 1.0)
+        emit(cls, 22, bullet_color, -(15 * cls.dpi_scalar), -((34 * cls.dpi_scalar) + line_offset), "»")
 
-    blf.position(0, cls.overlay_x + (25 * cls.dpi_scalar), cls.overlay_y - ((25 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
-    blf.draw(0, property_content)
-    
-    blf.size(0, 11, cls.dpi)
-    
     if cls.operator_passthrough:
-        blf.color(0, base_r, base_g, base_b, 0.2)
+        content_color = (base_r, base_g, base_b, 0.2)
+        metadata_color = (base_r, base_g, base_b, 0.2)
     else:
-        blf.color(0, base_r, base_g, base_b, 0.3)
+        content_color = (base_r, base_g, base_b, 1.0)
+        metadata_color = (base_r, base_g, base_b, 0.3)
 
-    blf.position(0, cls.overlay_x + (25 * cls.dpi_scalar), cls.overlay_y - ((40 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
+    emit(cls, 16, content_color, 25 * cls.dpi_scalar, -((25 * cls.dpi_scalar) + line_offset), property_content)
 
     if is_value is not None:
-        blf.draw(0, "Manual Override — [{}] to reset.".format(get_preferences().overlay_reset_key))
-    else:
-        blf.draw(0, metadata_content)
+        metadata_content = "Manual Override — [{}] to reset.".format(get_preferences().overlay_reset_key)
+
+    emit(cls, 11, metadata_color, 25 * cls.dpi_scalar, -((40 * cls.dpi_scalar) + line_offset), metadata_content)
 
     cls.line_step += 1
 
 
 def draw_hint(cls, hint_content, metadata_content):
-    blf.size(0, 22, cls.dpi)
-
     base_r, base_g, base_b = get_preferences().overlay_base_color
-    
-    if cls.operator_passthrough:
-        blf.color(0, base_r, base_g, base_b, 0.2)
-    else:
-        blf.color(0, base_r, base_g, base_b, 0.5)
-
-    blf.position(0, cls.overlay_x - (3 * cls.dpi_scalar), cls.overlay_y - ((36 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
-    blf.draw(0, "◈")
-
-    blf.size(0, 16, cls.dpi)
+    line_offset = cls.line_spacer * cls.line_step
 
     if cls.operator_passthrough:
-        blf.color(0, base_r, base_g, base_b, 0.2)
-    else:
-        blf.color(0, base_r, base_g, base_b, 1.0)
-
-    blf.position(0, cls.overlay_x + (25 * cls.dpi_scalar), cls.overlay_y - ((25 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
-    blf.draw(0, hint_content)
-    
-    blf.size(0, 11, cls.dpi)
-    
-    if cls.operator_passthrough:
-        blf.color(0, base_r, base_g, base_b, 0.2)
+        bullet_color = (base_r, base_g, base_b, 0.2)
+        content_color = (base_r, base_g, base_b, 0.2)
+        metadata_color = (base_r, base_g, base_b, 0.2)
     else:
-        blf.color(0, base_r, base_g, base_b, 0.3)
+        bullet_color = (base_r, base_g, base_b, 0.5)
+        content_color = (base_r, base_g, base_b, 1.0)
+        metadata_color = (base_r, base_g, base_b, 0.3)
 
-    blf.position(0, cls.overlay_x + (25 * cls.dpi_scalar), cls.overlay_y - ((40 * cls.dpi_scalar) + (cls.line_spacer * cls.line_step)), 0)
-    blf.draw(0, metadata_content)
+    emit(cls, 22, bullet_color, -(3 * cls.dpi_scalar), -((36 * cls.dpi_scalar) + line_offset), "◈")
+    emit(cls, 16, content_color, 25 * cls.dpi_scalar, -((25 * cls.dpi_scalar) + line_offset), hint_content)
+    emit(cls, 11, metadata_color, 25 * cls.dpi_scalar, -((40 * cls.dpi_scalar) + line_offset), metadata_content)
 
     cls.line_step += 1
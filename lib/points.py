@@ -21,9 +21,17 @@
 import bpy
 import gpu
 import bgl
+from itertools import count
 from mathutils import Vector, Matrix
 from gpu_extras.batch import batch_for_shader
 from . preferences import get_preferences
+from . redraw import add_redraw_source, remove_redraw_source, is_source_region, frame_drawn
+from . shaders import get_uniform_color_shader
+
+
+point_sets = ('primary_points', 'secondary_points', 'tertiary_points', 'guide_line')
+point_batches = {}
+point_revision_counter = count(1)
 
 
 def register_points_handler(cls):
@@ -34,7 +42,8 @@ def register_points_handler(cls):
         dns = bpy.app.driver_namespace
         dns['nd.points'] = handler
 
-        redraw_regions()
+        point_batches.clear()
+        add_redraw_source('nd.points', cls, points_signature)
 
 
 def unregister_points_handler():
@@ -44,48 +53,74 @@ def unregister_points_handler():
         bpy.types.SpaceView3D.draw_handler_remove(handler, 'WINDOW')
         del bpy.app.driver_namespace['nd.points']
 
-        redraw_regions()
+        point_batches.clear()
+        remove_redraw_source('nd.points')
 
 
-def redraw_regions():
-    for area in bpy.context.window.screen.areas:
-        if area.type == 'VIEW_3D':
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    region.tag_redraw()
+def init_points(cls):
+    cls.point_revisions = {}
 
+    set_points(cls, 'primary_points', [])
+    set_points(cls, 'secondary_points', [])
+    set_points(cls, 'tertiary_points', [])
+    set_points(cls, 'guide_line', ())
+
+
+def set_points(cls, name, points):
+    # Give the set a new revision whenever its contents change so that the
+    # redraw scheduler and the batch cache can detect changes without
+    # inspecting the points. Revisions are drawn from a shared counter, so a
+    # cached batch can never be mistaken for one belonging to a different
+    # operator.
+    if name in cls.point_revisions and points == getattr(cls, name):
+        return
+
+    setattr(cls, name, points)
+    cls.point_revisions[name] = next(point_revision_counter)
 
-def init_points(cls):
-    cls.primary_points = []
-    cls.secondary_points = []
-    cls.tertiary_points = []
-    cls.guide_line = ()
 
+def points_signature(cls):
+    return tuple(cls.point_revisions.get(name, 0) for name in point_sets)
 
-def draw_points(shader, points, size, color):
+
+def get_points_batch(cls, name, primitive):
+    revision = cls.point_revisions[name]
+    cached = point_batches.get(name)
+
+    if cached and cached[0] == revision:
+        return cached[1]
+
+    batch = batch_for_shader(get_uniform_color_shader(), primitive, {"pos": getattr(cls, name)})
+    point_batches[name] = (revision, batch)
+
+    return batch
+
+
+def draw_points(shader, batch, size, color):
     gpu.state.point_size_set(size)
-    batch = batch_for_shader(shader, 'POINTS', {"pos": points})
     shader.bind()
     shader.uniform_float("color", color)
     batch.draw(shader)
 
 
-def draw_guideline(shader, line, size, color):
+def draw_guideline(shader, batch, size, color):
     gpu.state.depth_test_set('NONE')
     gpu.state.blend_set('ALPHA')
     gpu.state.line_width_set(size)
-    batch = batch_for_shader(shader, 'LINES', {"pos": line})
     shader.bind()
     shader.uniform_float("color", color)
     batch.draw(shader)
 
 
 def update_points(cls):
-    shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+    if not is_source_region('nd.points'):
+        return
+
+    frame_drawn()
 
-    draw_points(shader, cls.primary_points, 10, get_preferences().points_primary_color)
-    draw_points(shader, cls.secondary_points, 6, get_preferences().points_secondary_color)
-    draw_points(shader, cls.tertiary_points, 12, get_preferences().points_tertiary_color)
-    draw_guideline(shader, cls.guide_line, 2, get_preferences().points_guide_line_color)
+    shader = get_uniform_color_shader()
 
-    redraw_regions()
+    draw_points(shader, get_points_batch(cls, 'primary_points', 'POINTS'), 10, get_preferences().points_primary_color)
+    draw_points(shader, get_points_batch(cls, 'secondary_points', 'POINTS'), 6, get_preferences().points_secondary_color)
+    draw_points(shader, get_points_batch(cls, 'tertiary_points', 'POINTS'), 12, get_preferences().points_tertiary_color)
+    draw_guideline(shader, get_points_batch(cls, 'guide_line', 'LINES'), 2, get_preferences().points_guide_line_color)
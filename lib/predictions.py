@@ -0,0 +1,106 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from collections import namedtuple
+from bpy.app.handlers import persistent
+from . analysis import is_planar, classify_edges
+
+
+GeometryPrediction = namedtuple('GeometryPrediction', ['sketch', 'profile', 'has_faces', 'manifold', 'has_loose_edges'])
+
+
+geometry_stamps = {}
+geometry_stamp_state = {'generation': 0}
+prediction_cache = {}
+
+
+def register_prediction_handlers():
+    if geometry_update_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(geometry_update_handler)
+
+    # Animated, driven or constrained geometry can change on a frame change
+    # without a depsgraph update, and undo steps restore geometry wholesale,
+    # so every cached prediction is dropped in both cases.
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.frame_change_post):
+        if clear_prediction_cache not in handlers:
+            handlers.append(clear_prediction_cache)
+
+
+def unregister_prediction_handlers():
+    if geometry_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(geometry_update_handler)
+
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.frame_change_post):
+        if clear_prediction_cache in handlers:
+            handlers.remove(clear_prediction_cache)
+
+    clear_prediction_cache()
+
+
+@persistent
+def geometry_update_handler(scene, depsgraph):
+    # Only bump the stamp here; the analysis itself runs lazily on the next
+    # menu draw so that modal operators don't pay for it every frame.
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            uid = update.id.original.session_uid
+            geometry_stamps[uid] = geometry_stamps.get(uid, 0) + 1
+
+
+@persistent
+def clear_prediction_cache(*args):
+    geometry_stamps.clear()
+    geometry_stamp_state['generation'] += 1
+    prediction_cache.clear()
+
+
+def get_geometry_stamp(object):
+    # Session uids are reused across file loads, so the stamp carries the
+    # generation of the stamp table it came from.
+    return (geometry_stamp_state['generation'], geometry_stamps.get(object.session_uid, 0))
+
+
+def create_geometry_prediction(mesh):
+    edges = classify_edges(mesh)
+    has_faces = len(mesh.polygons) >= 1
+
+    return GeometryPrediction(
+        sketch=has_faces and is_planar(mesh),
+        profile=not has_faces and len(mesh.edges) > 0,
+        has_faces=has_faces,
+        manifold=bool(edges['manifold'].all()),
+        has_loose_edges=bool(edges['loose'].any()))
+
+
+def get_geometry_prediction(context, object):
+    uid = object.session_uid
+    stamp = get_geometry_stamp(object)
+    cached = prediction_cache.get(uid)
+
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    depsgraph = context.evaluated_depsgraph_get()
+    object_eval = object.evaluated_get(depsgraph)
+    prediction = create_geometry_prediction(object_eval.data)
+    prediction_cache[uid] = (stamp, prediction)
+
+    return prediction
@@ -19,13 +19,90 @@
 # ---
 
 import bpy
+from typing import NamedTuple, Tuple
+from bpy.app.handlers import persistent
 from . addons import get_registered_addon_name
 
 
-def get_preferences():
+preferences_snapshot = None
+
+property_types = {
+    'BOOLEAN': bool,
+    'INT': int,
+    'FLOAT': float,
+    'STRING': str,
+    'ENUM': str,
+}
+
+
+def get_addon_preferences():
     return bpy.context.preferences.addons[get_registered_addon_name()].preferences
 
 
+def get_preferences():
+    global preferences_snapshot
+
+    if preferences_snapshot is None:
+        preferences_snapshot = create_preferences_snapshot(get_addon_preferences())
+
+    return preferences_snapshot
+
+
+@persistent
+def invalidate_preferences_snapshot(*args):
+    global preferences_snapshot
+
+    preferences_snapshot = None
+
+
+def watch_preference_updates(cls):
+    # Every preference shares the same update callback, so it is attached here
+    # rather than on each property declaration.
+    for prop in cls.__annotations__.values():
+        keywords = getattr(prop, 'keywords', None)
+        if keywords is not None:
+            keywords.setdefault('update', invalidate_preferences_snapshot)
+
+    return cls
+
+
+def register_preferences_handlers():
+    invalidate_preferences_snapshot()
+
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.load_factory_preferences_post):
+        if invalidate_preferences_snapshot not in handlers:
+            handlers.append(invalidate_preferences_snapshot)
+
+
+def unregister_preferences_handlers():
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.load_factory_preferences_post):
+        if invalidate_preferences_snapshot in handlers:
+            handlers.remove(invalidate_preferences_snapshot)
+
+    invalidate_preferences_snapshot()
+
+
+def create_preferences_snapshot(prefs):
+    fields = []
+    values = []
+
+    for prop in prefs.bl_rna.properties:
+        if prop.identifier in {'rna_type', 'bl_idname'} or prop.type not in property_types:
+            continue
+
+        value = getattr(prefs, prop.identifier)
+        value_type = property_types[prop.type]
+
+        if getattr(prop, 'is_array', False):
+            value = tuple(value)
+            value_type = Tuple[(value_type, ...)]
+
+        fields.append((prop.identifier, value_type))
+        values.append(value)
+
+    return NamedTuple('PreferencesSnapshot', fields)(*values)
+
+
 def get_scene_unit_scale():
     if bpy.context.scene.unit_settings.system == 'NONE':
         return 1.0
@@ -0,0 +1,174 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+import os
+import json
+import tempfile
+from time import perf_counter
+from datetime import datetime
+from collections import deque
+from contextlib import nullcontext
+from . preferences import get_preferences
+
+
+ring_buffer_size = 256
+profile_epoch = perf_counter()
+profile_buffers = {}
+null_phase = nullcontext()
+
+
+class ProfilePhase:
+    def __init__(self, frame, name):
+        self.frame = frame
+        self.name = name
+
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+
+    def __exit__(self, *args):
+        self.frame['phases'].append((self.name, self.start, perf_counter() - self.start))
+
+
+def init_profiler(cls):
+    cls.profiling = get_preferences().enable_profiling
+    cls.profile_frame = None
+    cls.profile_event_end = None
+
+    # Each invocation gets a fresh buffer so that summaries and traces only
+    # cover the current run.
+    if cls.profiling:
+        cls.profile_buffer = profile_buffers[cls.bl_idname] = deque(maxlen=ring_buffer_size)
+
+
+def begin_profile_event(cls, event):
+    if not getattr(cls, 'profiling', False):
+        return
+
+    cls.profile_frame = {'name': event.type, 'kind': 'event', 'start': perf_counter(), 'phases': []}
+
+
+def profile_phase(cls, name):
+    if not getattr(cls, 'profiling', False) or cls.profile_frame is None:
+        return null_phase
+
+    return ProfilePhase(cls.profile_frame, name)
+
+
+def end_profile_event(cls, result):
+    if not getattr(cls, 'profiling', False) or cls.profile_frame is None:
+        return
+
+    frame = cls.profile_frame
+    frame['duration'] = perf_counter() - frame['start']
+
+    cls.profile_buffer.append(frame)
+    cls.profile_frame = None
+    cls.profile_event_end = frame['start'] + frame['duration']
+
+    if 'FINISHED' in result or 'CANCELLED' in result:
+        dump_trace(cls.bl_idname)
+
+
+def profiled_draw_callback(callback):
+    def draw(cls):
+        if not getattr(cls, 'profiling', False):
+            callback(cls)
+            return
+
+        start = perf_counter()
+        callback(cls)
+        duration = perf_counter() - start
+
+        # Everything between the end of the last event and the first overlay
+        # draw is Blender evaluating the depsgraph and drawing the viewport.
+        if cls.profile_event_end is not None:
+            cls.profile_buffer.append({'name': 'viewport_update', 'kind': 'viewport', 'start': cls.profile_event_end, 'duration': start - cls.profile_event_end, 'phases': []})
+            cls.profile_event_end = None
+
+        cls.profile_buffer.append({'name': 'draw_text_callback', 'kind': 'draw', 'start': start, 'duration': duration, 'phases': []})
+
+    return draw
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def get_profile_summary(cls):
+    if not getattr(cls, 'profiling', False):
+        return None
+
+    durations = [frame['duration'] for frame in cls.profile_buffer if frame['kind'] == 'event']
+    if not durations:
+        return "PROFILING"
+
+    return "p50 {0:.1f}ms / p99 {1:.1f}ms".format(percentile(durations, 0.5) * 1000, percentile(durations, 0.99) * 1000)
+
+
+def trace_events(idname, frames):
+    to_us = lambda seconds: round(seconds * 1e6, 3)
+    pid = os.getpid()
+
+    for frame in frames:
+        yield {
+            'name': frame['name'],
+            'cat': frame['kind'],
+            'ph': 'X',
+            'ts': to_us(frame['start'] - profile_epoch),
+            'dur': to_us(frame['duration']),
+            'pid': pid,
+            'tid': 1,
+            'args': {'operator': idname},
+        }
+
+        for name, start, duration in frame['phases']:
+            yield {
+                'name': name,
+                'cat': 'phase',
+                'ph': 'X',
+                'ts': to_us(start - profile_epoch),
+                'dur': to_us(duration),
+                'pid': pid,
+                'tid': 1,
+                'args': {'operator': idname},
+            }
+
+
+def dump_trace(idname):
+    frames = profile_buffers.get(idname)
+    if not frames:
+        return None
+
+    trace_path = get_preferences().profiling_trace_path
+    directory = bpy.path.abspath(trace_path) if trace_path else tempfile.gettempdir()
+    path = os.path.join(directory, "nd_trace_{}_{}.json".format(idname.replace('.', '_'), datetime.now().strftime("%Y%m%d-%H%M%S-%f")[:-3]))
+
+    try:
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': list(trace_events(idname, frames)), 'displayTimeUnit': 'ms'}, f)
+    except OSError:
+        return None
+
+    return path
@@ -0,0 +1,105 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from bpy.props import BoolProperty, FloatProperty, FloatVectorProperty, IntProperty, PointerProperty
+
+
+legacy_recall_prefixes = {
+    'circular_array': "NDCA_",
+    'recon_poly': "NDRCP_",
+}
+
+
+class NDCircularArrayRecall(bpy.types.PropertyGroup):
+    stored: BoolProperty(default=False)
+    angle: FloatProperty(default=360)
+    axis: IntProperty(default=2)
+    single_obj_mode: BoolProperty(default=False)
+    rotator_obj_rotation_snapshot: FloatVectorProperty(size=3, subtype='EULER')
+
+
+class NDReconPolyRecall(bpy.types.PropertyGroup):
+    stored: BoolProperty(default=False)
+    width: FloatProperty(default=0)
+    inner_radius: FloatProperty(default=0)
+    natural_rotation: BoolProperty(default=False)
+    inscribed: BoolProperty(default=False)
+
+
+class NDRecallState(bpy.types.PropertyGroup):
+    circular_array: PointerProperty(type=NDCircularArrayRecall)
+    recon_poly: PointerProperty(type=NDReconPolyRecall)
+
+
+def get_recall_state(object, operator, **defaults):
+    recall = getattr(object.nd_recall, operator)
+
+    if not recall.stored:
+        migrate_legacy_recall_state(object, operator, defaults)
+
+    return recall if recall.stored else None
+
+
+def set_recall_state(object, operator, **values):
+    recall = getattr(object.nd_recall, operator)
+
+    for name, value in values.items():
+        setattr(recall, name, value)
+
+    recall.stored = True
+
+
+def migrate_legacy_recall_state(object, operator, defaults):
+    prefix = legacy_recall_prefixes[operator]
+    recall = getattr(object.nd_recall, operator)
+    values = {}
+
+    for name in recall.bl_rna.properties.keys():
+        key = prefix + name
+        if key in object:
+            values[name] = object[key]
+            del object[key]
+
+    # Older files may predate some of the legacy keys; those fields fall back
+    # to the operator's own defaults rather than the PropertyGroup's.
+    if values:
+        set_recall_state(object, operator, **{**defaults, **values})
+
+
+classes = (
+    NDCircularArrayRecall,
+    NDReconPolyRecall,
+    NDRecallState,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+    bpy.types.Object.nd_recall = PointerProperty(type=NDRecallState)
+
+
+def unregister():
+    del bpy.types.Object.nd_recall
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,113 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from time import perf_counter
+
+
+# Central redraw scheduler for ND's viewport draw handlers.
+#
+# Each draw handler registers a redraw source: a function returning a
+# signature of what it currently draws, along with the region that owns it.
+# Handlers only draw in their owning region (see is_source_region), so
+# operators call refresh_redraw_sources() once per event and only that region
+# is tagged when its signature has changed. Tag requests are coalesced until
+# the next frame is drawn, and draw handlers never tag regions themselves.
+
+redraw_sources = {}
+redraw_signatures = {}
+redraw_requested_at = None
+redraw_request_timeout = 0.1
+
+
+def add_redraw_source(key, cls, signature):
+    region = bpy.context.region
+    redraw_sources[key] = (cls, signature, region)
+    redraw_signatures.pop(key, None)
+
+    request_redraw([region], force=True)
+
+
+def remove_redraw_source(key):
+    redraw_signatures.pop(key, None)
+    source = redraw_sources.pop(key, None)
+
+    if source is not None:
+        request_redraw([source[2]], force=True)
+
+
+def is_source_region(key):
+    source = redraw_sources.get(key)
+
+    if source is None or source[2] is None:
+        return True
+
+    return bpy.context.region == source[2]
+
+
+def refresh_redraw_sources():
+    regions = []
+
+    for key, (cls, signature, region) in redraw_sources.items():
+        current = signature(cls)
+
+        if key not in redraw_signatures or redraw_signatures[key] != current:
+            redraw_signatures[key] = current
+            regions.append(region)
+
+    if regions:
+        request_redraw(regions)
+
+
+def get_view3d_regions():
+    if bpy.context.window is None:
+        return []
+
+    return [region for area in bpy.context.window.screen.areas if area.type == 'VIEW_3D' for region in area.regions if region.type == 'WINDOW']
+
+
+def request_redraw(regions, force=False):
+    global redraw_requested_at
+
+    now = perf_counter()
+
+    # A redraw is already queued; any state changed since then will be picked
+    # up when it happens. The timeout guards against regions that never draw.
+    if not force and redraw_requested_at is not None and now - redraw_requested_at < redraw_request_timeout:
+        return
+
+    # Sources registered outside of a region (e.g. from a menu) have no owner,
+    # so fall back to every 3D viewport in the window.
+    if None in regions:
+        regions = get_view3d_regions()
+
+    for region in regions:
+        try:
+            region.tag_redraw()
+        except ReferenceError:
+            pass
+
+    redraw_requested_at = now
+
+
+def frame_drawn():
+    global redraw_requested_at
+
+    redraw_requested_at = None
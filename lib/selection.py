@@ -0,0 +1,63 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bmesh
+from collections import namedtuple
+
+
+SelectionSummary = namedtuple('SelectionSummary', ['verts', 'edges', 'faces', 'total_verts', 'total_edges', 'total_faces'])
+
+empty_selection = SelectionSummary(0, 0, 0, 0, 0, 0)
+
+
+def get_selection_summary(object):
+    if object is None or object.type != 'MESH':
+        return empty_selection
+
+    data = object.data
+
+    if data.is_editmode:
+        # The edit mesh keeps running selection totals, so there's no need to
+        # walk its elements; wrapping it in a BMesh is equally cheap.
+        bm = bmesh.from_edit_mesh(data)
+
+        return SelectionSummary(
+            data.total_vert_sel,
+            data.total_edge_sel,
+            data.total_face_sel,
+            len(bm.verts),
+            len(bm.edges),
+            len(bm.faces))
+
+    verts, edges, faces = data.count_selected_items()
+
+    return SelectionSummary(verts, edges, faces, len(data.vertices), len(data.edges), len(data.polygons))
+
+
+def has_selected_verts(context):
+    return context.mode == 'EDIT_MESH' and get_selection_summary(context.active_object).verts >= 1
+
+
+def has_selected_edges(context):
+    return context.mode == 'EDIT_MESH' and get_selection_summary(context.active_object).edges >= 1
+
+
+def has_selected_faces(context):
+    return context.mode == 'EDIT_MESH' and get_selection_summary(context.active_object).faces >= 1
@@ -0,0 +1,33 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import gpu
+
+
+uniform_color_shader = None
+
+
+def get_uniform_color_shader():
+    global uniform_color_shader
+
+    if uniform_color_shader is None:
+        uniform_color_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+
+    return uniform_color_shader
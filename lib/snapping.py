@@ -0,0 +1,366 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import numpy as np
+from mathutils import Vector, Matrix
+from mathutils.kdtree import KDTree
+from mathutils.bvhtree import BVHTree
+from . analysis import get_vertex_coords, get_vertex_normals, get_edge_keys, get_loop_data, get_polygon_data, get_loop_polygons
+
+
+def normalize(vectors):
+    lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > 0)
+
+
+def get_object_up(rotation, directions):
+    up = normalize(rotation @ np.array((0.0, 0.0, 1.0)))
+    side = normalize(rotation @ np.array((1.0, 0.0, 0.0)))
+
+    aligned = np.abs(np.round(normalize(directions) @ up, 6)) == 1
+
+    return np.where(aligned[:, None], side, up)
+
+
+def create_frames(tangent, binormal, normal):
+    # Equivalent to create_transposed_rotation_matrix: the frame vectors are
+    # the columns of the rotation matrix.
+    return np.stack((tangent, binormal, normal), axis=-1)
+
+
+def gather_adjacency(adjacency, elements):
+    # Returns the adjacent items of each element along with the row of the
+    # element they belong to, from a (starts, counts, items) table.
+    starts, counts, items = adjacency
+    element_counts = counts[elements]
+    total = element_counts.sum()
+
+    rows = np.repeat(np.arange(len(elements)), element_counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(element_counts) - element_counts, element_counts)
+
+    return rows, items[np.repeat(starts[elements], element_counts) + offsets]
+
+
+def create_adjacency(keys, items, count):
+    order = np.argsort(keys, kind='stable')
+    counts = np.bincount(keys, minlength=count)
+
+    return (np.cumsum(counts) - counts, counts, items[order])
+
+
+def create_vertex_frames(geometry, vertices):
+    rotation, coords, vertex_normals, edge_keys = geometry['rotation'], geometry['coords'], geometry['vertex_normals'], geometry['edge_keys']
+
+    normal = normalize(vertex_normals[vertices] @ rotation.T)
+    binormal = np.zeros_like(normal)
+    has_edges = np.zeros(len(vertices), dtype=bool)
+
+    rows, edge_ids = gather_adjacency(geometry['vertex_edges'], vertices)
+
+    if len(edge_ids):
+        verts = vertices[rows]
+        keys = edge_keys[edge_ids]
+        others = np.where(keys[:, 0] == verts, keys[:, 1], keys[:, 0])
+        lengths = np.linalg.norm(coords[others] - coords[verts], axis=1)
+
+        # Sort by vertex, longest edge first, and keep the first entry per
+        # vertex. Ties go to the lowest edge index, which is the order of
+        # BMVert.link_edges on a mesh converted to bmesh.
+        order = np.lexsort((edge_ids, -lengths, rows))
+        rows, verts, others = rows[order], verts[order], others[order]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = rows[1:] != rows[:-1]
+        rows, verts, others = rows[first], verts[first], others[first]
+
+        binormal[rows] = normalize((coords[others] - coords[verts]) @ rotation.T)
+        has_edges[rows] = True
+
+    tangent = normalize(np.cross(binormal, normal))
+    binormal = normalize(np.cross(normal, tangent))
+
+    loose = ~has_edges
+    if loose.any():
+        up = get_object_up(rotation, normal[loose])
+        tangent[loose] = normalize(np.cross(normal[loose], up))
+        binormal[loose] = normalize(np.cross(normal[loose], tangent[loose]))
+
+    return create_frames(tangent, binormal, normal)
+
+
+def create_edge_frames(geometry, edges):
+    rotation, coords, edge_keys = geometry['rotation'], geometry['coords'], geometry['edge_keys']
+    loop_polygons, face_normals = geometry['loop_polygons'], geometry['face_normals']
+
+    keys = edge_keys[edges]
+    binormal = normalize((coords[keys[:, 1]] - coords[keys[:, 0]]) @ rotation.T)
+
+    rows, loops = gather_adjacency(geometry['edge_loops'], edges)
+    linked_normals = face_normals[loop_polygons[loops]]
+
+    normal_sums = np.empty((len(edges), 3))
+    for axis in range(3):
+        normal_sums[:, axis] = np.bincount(rows, weights=linked_normals[:, axis], minlength=len(edges))
+
+    normal = normalize(normalize(normal_sums) @ rotation.T)
+    tangent = normalize(np.cross(binormal, normal))
+    normal = normalize(np.cross(tangent, binormal))
+
+    loose = np.bincount(rows, minlength=len(edges)) == 0
+    if loose.any():
+        up = get_object_up(rotation, binormal[loose])
+        tangent[loose] = normalize(np.cross(binormal[loose], up))
+        normal[loose] = np.cross(tangent[loose], binormal[loose])
+
+    return create_frames(tangent, binormal, normal)
+
+
+def get_face_loops(loop_starts, loop_totals):
+    offsets = np.cumsum(loop_totals) - loop_totals
+    loops = np.repeat(loop_starts - offsets, loop_totals) + np.arange(loop_totals.sum())
+
+    return loops, offsets
+
+
+def get_face_tangents(coords, loop_verts, loop_starts, loop_totals):
+    # A port of BMFace.calc_tangent_edge_pair, applied per face size.
+    loop_count = len(loop_verts)
+    loop_ends = loop_starts + loop_totals - 1
+
+    next_loops = np.arange(1, loop_count + 1)
+    next_loops[loop_ends] = loop_starts
+    edge_vectors = coords[loop_verts[next_loops]] - coords[loop_verts]
+    edge_lengths = np.einsum('ij,ij->i', edge_vectors, edge_vectors)
+
+    tangents = np.zeros((len(loop_starts), 3))
+
+    tris = np.flatnonzero(loop_totals == 3)
+    if len(tris):
+        tangents[tris] = get_tri_tangents(coords[loop_verts[loop_starts[tris, None] + np.arange(3)]])
+
+    quads = np.flatnonzero(loop_totals == 4)
+    if len(quads):
+        tangents[quads] = get_quad_tangents(coords[loop_verts[loop_starts[quads, None] + np.arange(4)]])
+
+    ngons = np.flatnonzero(loop_totals > 4)
+    if len(ngons):
+        tangents[ngons] = get_ngon_tangents(edge_vectors, edge_lengths, loop_starts, loop_totals)[ngons]
+
+    return tangents
+
+
+def get_tri_tangents(verts):
+    # Tris use the edge whose other two edges are the most similar in length
+    # (BM_vert_tri_find_unique_edge), pointing from the opposite vertex to the
+    # middle of that edge. The branches mirror axis_sort_v3 so ties resolve the
+    # same way.
+    lengths = np.linalg.norm(verts[:, [1, 2, 0]] - verts, axis=-1)
+    difs = np.abs(lengths[:, [1, 2, 0]] - lengths[:, [2, 0, 1]])
+    d0, d1, d2 = difs.T
+
+    index = np.where(d0 < d1, np.where(d2 < d0, 2, 0), np.where(d1 < d2, 1, 2))
+    rows = np.arange(len(verts))
+
+    middle = (verts[rows, index] + verts[rows, (index + 1) % 3]) / 2
+
+    return middle - verts[rows, (index + 2) % 3]
+
+
+def get_quad_tangents(verts):
+    # Quads use the longest pair of opposite edges.
+    v0, v1, v2, v3 = verts.transpose(1, 0, 2)
+    pair_a = (v3 - v2) + (v0 - v1)
+    pair_b = (v0 - v3) + (v1 - v2)
+    use_b = np.einsum('ij,ij->i', pair_a, pair_a) < np.einsum('ij,ij->i', pair_b, pair_b)
+
+    return np.where(use_b[:, None], pair_b, pair_a)
+
+
+def get_ngon_tangents(edge_vectors, edge_lengths, loop_starts, loop_totals):
+    # Ngons use the longest edge (the last one on ties, as in
+    # BM_face_find_longest_loop) plus the longest edge that shares no vertex
+    # with it. The second search walks backwards from two loops behind the
+    # longest, so on ties the candidate furthest back wins.
+    loop_count = len(edge_lengths)
+    starts = np.repeat(loop_starts, loop_totals)
+    totals = np.repeat(loop_totals, loop_totals)
+    positions = np.arange(loop_count) - starts
+
+    longest_lengths = np.repeat(np.maximum.reduceat(edge_lengths, loop_starts), loop_totals)
+    longest = np.maximum.reduceat(np.where(edge_lengths == longest_lengths, positions, -1), loop_starts)
+
+    offsets = (np.repeat(longest, loop_totals) - positions) % totals
+    disconnected = (offsets >= 2) & (offsets <= totals - 2)
+
+    other_lengths = np.where(disconnected, edge_lengths, -np.inf)
+    other_longest = np.repeat(np.maximum.reduceat(other_lengths, loop_starts), loop_totals)
+    other_offsets = np.maximum.reduceat(np.where(disconnected & (other_lengths == other_longest), offsets, -1), loop_starts)
+
+    vec_a = edge_vectors[loop_starts + longest]
+    vec_b = -edge_vectors[loop_starts + (longest - other_offsets) % loop_totals]
+    tangents = vec_a + vec_b
+
+    # The two edges may cancel out when they aren't on opposite sides of the
+    # face, in which case the longest edge is used on its own.
+    cancelled = ~np.any(tangents, axis=1)
+    tangents[cancelled] = vec_a[cancelled]
+
+    return tangents
+
+
+def create_face_frames(geometry, faces):
+    rotation, coords, loop_verts = geometry['rotation'], geometry['coords'], geometry['loop_verts']
+
+    loop_totals = geometry['loop_totals'][faces]
+    loops, loop_starts = get_face_loops(geometry['loop_starts'][faces], loop_totals)
+
+    normal = normalize(geometry['face_normals'][faces] @ rotation.T)
+    tangent = normalize(get_face_tangents(coords, loop_verts[loops], loop_starts, loop_totals) @ rotation.T)
+    binormal = np.cross(normal, tangent)
+
+    return create_frames(tangent, binormal, normal)
+
+
+def init_snap_points(cls, mesh, world_matrix):
+    matrix = np.array(world_matrix, dtype=np.float64)
+    rotation = matrix[:3, :3]
+
+    coords = get_vertex_coords(mesh)
+    world_coords = coords @ rotation.T + matrix[:3, 3]
+    edge_keys = get_edge_keys(mesh)
+    loop_verts, loop_edges = get_loop_data(mesh)
+    loop_starts, loop_totals, face_normals = get_polygon_data(mesh)
+
+    cls.snap_geometry = {
+        'rotation': rotation,
+        'coords': coords,
+        'vertex_normals': get_vertex_normals(mesh),
+        'edge_keys': edge_keys,
+        'loop_verts': loop_verts,
+        'vertex_edges': create_adjacency(edge_keys.T.ravel(), np.tile(np.arange(len(edge_keys)), 2), len(coords)),
+        'edge_loops': create_adjacency(loop_edges, np.arange(len(loop_edges)), len(edge_keys)),
+        'loop_polygons': get_loop_polygons(loop_totals),
+        'loop_starts': loop_starts,
+        'loop_totals': loop_totals,
+        'face_normals': face_normals,
+    }
+
+    # Positions are cheap and needed for every query, so they are computed up
+    # front; tangent frames are only built for points that are snapped to.
+    positions = [world_coords]
+    average_edge_length = 0
+
+    if len(edge_keys):
+        edge_starts = world_coords[edge_keys[:, 0]]
+        edge_ends = world_coords[edge_keys[:, 1]]
+        positions.append((edge_starts + edge_ends) / 2)
+        average_edge_length = float(np.linalg.norm(edge_ends - edge_starts, axis=1).mean())
+
+    if len(loop_starts):
+        positions.append(np.add.reduceat(world_coords[loop_verts], loop_starts) / loop_totals[:, None])
+
+    cls.snap_positions = np.concatenate(positions).astype(np.float32)
+    cls.snap_ranges = (len(coords), len(coords) + len(edge_keys))
+    cls.snap_frames = {}
+    cls.snap_tree = build_snap_tree(cls.snap_positions)
+    cls.snap_view = None
+    cls.snap_distance_factor = average_edge_length / 2.0
+
+
+def build_snap_tree(positions):
+    # The tree covers every snap point and is built once; view culling is
+    # applied to query results instead, so navigating never rebuilds it.
+    tree = KDTree(len(positions))
+
+    for index, position in enumerate(positions.tolist()):
+        tree.insert(position, index)
+
+    tree.balance()
+
+    return tree
+
+
+def get_visible_snap_indices(positions, perspective_matrix):
+    matrix = perspective_matrix.astype(np.float32)
+    clip = positions @ matrix[:, :3].T + matrix[:, 3]
+    w = clip[:, 3]
+
+    visible = (w > 0) & (np.abs(clip[:, 0]) <= w) & (np.abs(clip[:, 1]) <= w)
+
+    return np.flatnonzero(visible)
+
+
+def update_snap_view(cls, region_data):
+    cls.snap_view = np.array(region_data.perspective_matrix)
+
+
+def find_snap_points(cls, location, radius):
+    points = cls.snap_tree.find_range(location, radius)
+
+    if not points or cls.snap_view is None:
+        return points
+
+    indices = np.array([index for co, index, distance in points])
+    visible = set(indices[get_visible_snap_indices(cls.snap_positions[indices], cls.snap_view)].tolist())
+
+    return [point for point in points if point[1] in visible]
+
+
+def get_snap_frame(cls, index):
+    frame = cls.snap_frames.get(index)
+
+    if frame is not None:
+        return frame
+
+    vertex_count, edge_end = cls.snap_ranges
+    element = np.array([index])
+
+    if index < vertex_count:
+        frames = create_vertex_frames(cls.snap_geometry, element)
+    elif index < edge_end:
+        frames = create_edge_frames(cls.snap_geometry, element - vertex_count)
+    else:
+        frames = create_face_frames(cls.snap_geometry, element - edge_end)
+
+    frame = Matrix(frames[0].tolist())
+    cls.snap_frames[index] = frame
+
+    return frame
+
+
+def get_snap_point(cls, index):
+    return (Vector(cls.snap_positions[index].tolist()), get_snap_frame(cls, index))
+
+
+def build_snap_bvh(object, depsgraph):
+    # The tree is built in object space; rays are moved into that space per
+    # query, which is cheaper than transforming every vertex up front.
+    return (BVHTree.FromObject(object, depsgraph), object.matrix_world.copy(), object.matrix_world.inverted_safe())
+
+
+def ray_cast_snap_bvh(snap_bvh, origin, direction):
+    tree, world_matrix, world_matrix_inverse = snap_bvh
+
+    location, normal, index, distance = tree.ray_cast(world_matrix_inverse @ origin, world_matrix_inverse.to_3x3() @ direction)
+
+    if location is None:
+        return None
+
+    return world_matrix @ location
@@ -0,0 +1,96 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+from collections import namedtuple
+from time import perf_counter
+from . predictions import get_geometry_stamp
+
+
+ModifierCost = namedtuple('ModifierCost', ['name', 'time', 'verts', 'faces'])
+
+
+stack_profiles = {}
+
+
+def evaluate_stack(context, object):
+    start = perf_counter()
+    depsgraph = context.evaluated_depsgraph_get()
+    elapsed = perf_counter() - start
+
+    mesh = object.evaluated_get(depsgraph).data
+
+    return (elapsed, len(mesh.vertices), len(mesh.polygons))
+
+
+def profile_modifier_stack(context, object):
+    # Reveal the stack one modifier at a time; each evaluation re-runs the
+    # stack from the base mesh, so a modifier's own cost is the difference to
+    # the evaluation before it.
+    mods = list(object.modifiers)
+    snapshot = [mod.show_viewport for mod in mods]
+    costs = []
+
+    for mod in mods:
+        mod.show_viewport = False
+
+    previous_time, _, _ = evaluate_stack(context, object)
+
+    for mod, visible in zip(mods, snapshot):
+        if not visible:
+            costs.append(ModifierCost(mod.name, None, None, None))
+            continue
+
+        mod.show_viewport = True
+        elapsed, verts, faces = evaluate_stack(context, object)
+        costs.append(ModifierCost(mod.name, max(0, elapsed - previous_time), verts, faces))
+        previous_time = elapsed
+
+    for mod, visible in zip(mods, snapshot):
+        mod.show_viewport = visible
+
+    context.evaluated_depsgraph_get()
+    stack_profiles[object.session_uid] = (get_geometry_stamp(object), costs)
+
+    return costs
+
+
+def restamp_stack_profile(context, object):
+    # For callers that put the stack back exactly as it was profiled.
+    cached = stack_profiles.get(object.session_uid)
+
+    if cached is not None:
+        context.evaluated_depsgraph_get()
+        stack_profiles[object.session_uid] = (get_geometry_stamp(object), cached[1])
+
+
+def get_stack_profile(object):
+    cached = stack_profiles.get(object.session_uid)
+
+    if cached is None or cached[0] != get_geometry_stamp(object):
+        return None
+
+    return cached[1]
+
+
+def format_modifier_cost(cost):
+    if cost.time is None:
+        return "Disabled"
+
+    return "{0:.1f}ms  /  {1:,}v  /  {2:,}f".format(cost.time * 1000, cost.verts, cost.faces)
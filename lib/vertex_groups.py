@@ -0,0 +1,64 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+
+def get_selected_verts(bm):
+    return [vert for vert in bm.verts if vert.select]
+
+
+def get_vertex_group_membership(bm, verts):
+    deform = bm.verts.layers.deform.active
+    membership = {}
+
+    if deform is None:
+        return membership
+
+    # Only the given vertices are visited, and each one only reports the groups
+    # it actually belongs to, so the cost doesn't grow with the group count.
+    for vert in verts:
+        for group_index in vert[deform].keys():
+            membership.setdefault(group_index, set()).add(vert.index)
+
+    return membership
+
+
+def assign_vertex_group(bm, verts, group_index, weight=1.0):
+    deform = bm.verts.layers.deform.verify()
+
+    for vert in verts:
+        vert[deform][group_index] = weight
+
+
+def unassign_vertex_groups(bm, verts, group_indices=None):
+    deform = bm.verts.layers.deform.active
+
+    if deform is None:
+        return
+
+    for vert in verts:
+        weights = vert[deform]
+
+        if group_indices is None:
+            weights.clear()
+            continue
+
+        for group_index in group_indices:
+            if group_index in weights:
+                del weights[group_index]
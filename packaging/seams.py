@@ -22,7 +22,7 @@ import bpy
 import bmesh
 from math import radians, degrees
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
 
@@ -40,10 +40,10 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
 
         angle_factor = 1 if self.key_shift else self.base_angle_factor
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -51,7 +51,7 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -82,12 +82,12 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
                 self.angle = max(0, self.angle - angle_factor)
                 self.dirty = True
         
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if get_preferences().enable_mouse_values:
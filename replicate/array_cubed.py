@@ -26,7 +26,8 @@ from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_starting_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_array_x = "Array³ X — ND"
@@ -141,7 +142,7 @@ CTRL — Remove existing modifiers"""
 
     def do_invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_starting_with(context.selected_objects, 'Array³')
+            remove_nd_modifiers(context.selected_objects, 'nd.array_cubed')
             return {'FINISHED'}
 
         self.dirty = False
@@ -152,9 +153,8 @@ CTRL — Remove existing modifiers"""
         self.count_streams = [new_stream(), new_stream(), new_stream()]
         self.offset_streams = [new_stream(), new_stream(), new_stream()]
 
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if previous_op:
             self.summon_old_operator(context, mods)
@@ -234,8 +234,7 @@ CTRL — Remove existing modifiers"""
 
     def revert(self, context):
         if not self.summoned:
-            for mod in mod_summon_list:
-                bpy.ops.object.modifier_remove(modifier=mod)
+            remove_modifiers(context.active_object, [context.active_object.modifiers[mod] for mod in mod_summon_list])
 
         if self.summoned:
             for axis, conf in enumerate(self.axes_prev):
@@ -30,7 +30,9 @@ from .. lib.collections import move_to_utils_collection, hide_utils_collection
 from .. lib.preferences import get_preferences
 from .. lib.objects import set_origin
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
+from .. lib.recall import get_recall_state, set_recall_state
 
 
 mod_displace = 'Displace — ND CA'
@@ -130,7 +132,7 @@ CTRL — Remove existing modifiers"""
 
     def do_invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND CA')
+            remove_nd_modifiers(context.selected_objects, 'nd.circular_array')
             return {'FINISHED'}
 
         self.dirty = False
@@ -149,9 +151,8 @@ CTRL — Remove existing modifiers"""
         self.angle_input_stream = new_stream()
         self.offset_input_stream = new_stream()
 
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
         
         if previous_op:
             self.summon_old_operator(context, mods)
@@ -197,7 +198,7 @@ CTRL — Remove existing modifiers"""
         else:
             self.reference_obj = context.active_object
 
-        bpy.data.objects[self.reference_obj.name]["NDCA_single_obj_mode"] = self.single_obj_mode
+        set_recall_state(self.reference_obj, 'circular_array', single_obj_mode=self.single_obj_mode)
 
         if not self.single_obj_mode:
             self.reference_obj_prev_location = self.reference_obj.location.copy()
@@ -219,7 +220,7 @@ CTRL — Remove existing modifiers"""
 
         self.rotator_obj.rotation_euler = self.reference_obj.rotation_euler.copy()
         self.rotator_obj_rotation_snapshot = self.reference_obj.rotation_euler.copy()
-        bpy.data.objects[self.reference_obj.name]["NDCA_rotator_obj_rotation_snapshot"] = self.rotator_obj_rotation_snapshot
+        set_recall_state(self.reference_obj, 'circular_array', rotator_obj_rotation_snapshot=self.rotator_obj_rotation_snapshot)
 
         self.rotator_obj.scale = (1, 1, 1)
 
@@ -250,13 +251,20 @@ CTRL — Remove existing modifiers"""
         if self.rotator_obj is None:
             return
 
-        self.angle = self.angle_prev = bpy.data.objects[self.reference_obj.name]["NDCA_angle"]
-        self.axis = self.axis_prev = bpy.data.objects[self.reference_obj.name]["NDCA_axis"]
-        self.single_obj_mode = bpy.data.objects[self.reference_obj.name]["NDCA_single_obj_mode"]
+        recall = get_recall_state(self.reference_obj, 'circular_array')
+        if recall is not None:
+            self.angle = recall.angle
+            self.axis = recall.axis
+            self.single_obj_mode = recall.single_obj_mode
+            self.rotator_obj_rotation_snapshot = recall.rotator_obj_rotation_snapshot.copy()
+        else:
+            self.rotator_obj_rotation_snapshot = self.reference_obj.rotation_euler.copy()
+
+        self.angle_prev = self.angle
+        self.axis_prev = self.axis
         self.displace_axis = self.displace_axis_prev = ['X', 'Y', 'Z'].index(self.displace.direction)
         self.count = self.count_prev = self.array.count
         self.offset = self.offset_prev = self.displace.strength
-        self.rotator_obj_rotation_snapshot = bpy.data.objects[self.reference_obj.name]["NDCA_rotator_obj_rotation_snapshot"]
 
 
     def add_array_modifier(self):
@@ -294,6 +302,10 @@ CTRL — Remove existing modifiers"""
         self.displace = displace
     
 
+    def get_draft_modifiers(self):
+        return [self.displace, self.array]
+
+
     def operate(self, context):
         altered_count = self.count if abs(self.angle) == 360 else self.count - 1
         rotation = radians(self.angle / altered_count)
@@ -312,8 +324,7 @@ CTRL — Remove existing modifiers"""
         self.displace.strength = self.offset
         self.displace.direction = ['X', 'Y', 'Z'][self.displace_axis]
 
-        bpy.data.objects[self.reference_obj.name]["NDCA_angle"] = self.angle
-        bpy.data.objects[self.reference_obj.name]["NDCA_axis"] = self.axis
+        set_recall_state(self.reference_obj, 'circular_array', angle=self.angle, axis=self.axis)
 
         self.dirty = False
 
@@ -22,12 +22,13 @@ import bpy
 import bmesh
 from math import radians
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.viewport import set_3d_cursor
 from .. lib.math import v3_average, create_rotation_matrix_from_vertex, create_rotation_matrix_from_edge, create_rotation_matrix_from_face, v3_center
 from .. lib.collections import move_to_utils_collection, isolate_in_utils_collection
-from .. lib.modifiers import new_modifier, remove_modifiers_starting_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, move_modifier
+from .. lib.selection import get_selection_summary
 
 
 class ND_OT_mirror(bpy.types.Operator):
@@ -43,10 +44,10 @@ CTRL — Remove existing modifiers"""
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -54,7 +55,7 @@ CTRL — Remove existing modifiers"""
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -86,14 +87,14 @@ CTRL — Remove existing modifiers"""
             self.geometry_selection_type = (self.geometry_selection_type + 1) % 3
             self.set_selection_mode(context)
 
-        elif self.key_confirm_alternative:
+        elif self.key_actions & Action.CONFIRM_ALTERNATIVE:
             if self.geometry_mode and not self.geometry_ready:
                 return self.complete_geometry_mode(context)
 
         elif self.key_left_click and self.geometry_mode and not self.geometry_ready:
             return {'PASS_THROUGH'}
 
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             if self.geometry_mode and not self.geometry_ready:
                 return {'PASS_THROUGH'}
             elif not self.geometry_mode or (self.geometry_mode and self.geometry_ready):
@@ -101,7 +102,7 @@ CTRL — Remove existing modifiers"""
 
                 return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if self.dirty:
@@ -114,7 +115,7 @@ CTRL — Remove existing modifiers"""
 
     def invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_starting_with(context.selected_objects, 'Mirror —')
+            remove_nd_modifiers(context.selected_objects, 'nd.mirror')
             return {'FINISHED'}
 
         self.geometry_mode = event.alt
@@ -234,7 +235,7 @@ CTRL — Remove existing modifiers"""
         world_matrix = context.active_object.matrix_world
 
         if self.geometry_selection_type == 0:
-            selected_vertices = len([v for v in mesh.verts if v.select])
+            selected_vertices = get_selection_summary(context.active_object).verts
             if selected_vertices == 3:
                 bpy.ops.mesh.edge_face_add()
                 context.tool_settings.mesh_select_mode = (False, False, True)
@@ -249,11 +250,7 @@ CTRL — Remove existing modifiers"""
 
 
     def has_invalid_selection(self, context):
-        mesh = bmesh.from_edit_mesh(context.active_object.data)
-
-        selected_vertices = len([v for v in mesh.verts if v.select])
-        selected_edges = len([e for e in mesh.edges if e.select])
-        selected_faces = len([f for f in mesh.faces if f.select])
+        selected_vertices, selected_edges, selected_faces = get_selection_summary(context.active_object)[:3]
 
         if self.geometry_selection_type == 0:
             return selected_vertices != 1 and selected_vertices != 3
@@ -333,8 +330,7 @@ CTRL — Remove existing modifiers"""
             self.mirrors.append(mirror)
 
             if self.early_apply:
-                while obj.modifiers[0].name != mirror.name:
-                    bpy.ops.object.modifier_move_up({'object': obj}, modifier=mirror.name)
+                move_modifier(obj, mirror.name, 0)
     
 
     def operate(self, context):
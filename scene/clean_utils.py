@@ -20,12 +20,31 @@
 
 import bpy
 from .. lib.collections import get_all_util_objects
+from .. lib.modifiers import remove_modifiers
+
+
+util_references = {
+    'BOOLEAN': ('object', ),
+    'ARRAY': ('offset_object', 'start_cap', 'end_cap'),
+    'MIRROR': ('mirror_object', ),
+    'LATTICE': ('object', ),
+    'DISPLACE': ('texture_coords_object', ),
+    'SIMPLE_DEFORM': ('origin', ),
+    'SCREW': ('object', ),
+}
+
+
+util_data = {
+    'MESH': 'meshes',
+    'LATTICE': 'lattices',
+}
 
 
 class ND_OT_clean_utils(bpy.types.Operator):
     bl_idname = "nd.clean_utils"
     bl_label = "Clean Utils"
-    bl_description = "Removes unused boolean modifiers and utility objects"
+    bl_description = """Removes unused boolean modifiers and utility objects
+SHIFT — Report what would be removed without removing anything"""
 
 
     @classmethod
@@ -34,62 +53,109 @@ class ND_OT_clean_utils(bpy.types.Operator):
 
 
     def invoke(self, context, event):
-        while self.remove_utils() > 0:
-            continue
+        util_objects = [obj for obj in get_all_util_objects() if obj]
+        reachable, dead_mods = find_reachable_objects(util_objects)
+        unreachable = [obj for obj in util_objects if obj.name not in reachable]
+
+        freed_bytes = sum(estimate_data_size(obj.data) for obj in unreachable if obj.data and obj.data.users == 1)
+
+        if event.shift:
+            self.report({'INFO'}, "Clean Utils would remove {0} utilities and {1} modifiers, freeing ~{2}".format(len(unreachable), len(dead_mods), format_bytes(freed_bytes)))
+            return {'FINISHED'}
+
+        for obj, mod in dead_mods:
+            remove_modifiers(obj, [mod])
+
+        remove_util_objects(unreachable)
+
+        self.report({'INFO'}, "Clean Utils removed {0} utilities and {1} modifiers, freeing ~{2}".format(len(unreachable), len(dead_mods), format_bytes(freed_bytes)))
 
         return {'FINISHED'}
 
 
-    def remove_utils(self):
-        removal_count = 0
-
-        active_util_object_names = set()
-        all_scene_objects = [obj for obj in bpy.context.view_layer.objects if obj.type == 'MESH']
-        util_mods = ['BOOLEAN', 'ARRAY', 'MIRROR', 'LATTICE']
-
-        for obj in all_scene_objects:
-            remove_mods = []
-            for mod in obj.modifiers:
-                if mod.type not in util_mods:
-                    continue
-
-                if mod.type == 'BOOLEAN':
-                    if mod.show_viewport and mod.object:
-                        active_util_object_names.add(mod.object.name)
-                    else:
-                        remove_mods.append(mod)
-                        removal_count += 1
-                    continue 
-
-                if mod.type == 'ARRAY':
-                    if mod.offset_object:
-                        active_util_object_names.add(mod.offset_object.name)
-                    continue
-
-                if mod.type == 'LATTICE':
-                    if mod.object:
-                        active_util_object_names.add(mod.object.name)
-                    continue
-
-                if mod.type == 'MIRROR':
-                    if mod.mirror_object:
-                        active_util_object_names.add(mod.mirror_object.name)
-                    continue
-
-            for mod in remove_mods:
-                obj.modifiers.remove(mod)
-        
-        all_util_objects = get_all_util_objects()
-        deleted_objects = []
-
-        for obj in all_util_objects:
-            if obj and obj.name not in active_util_object_names:
-                deleted_objects.append(obj)
-                removal_count += 1
-                
-        bpy.ops.object.delete({'active_object': None, 'object': None, 'selected_objects': deleted_objects}, use_global=False)
-
-        return removal_count
+def get_modifier_references(mod):
+    if mod.type == 'BOOLEAN' and mod.operand_type == 'COLLECTION':
+        return list(mod.collection.all_objects) if mod.collection else []
+
+    return [getattr(mod, attr) for attr in util_references.get(mod.type, ()) if getattr(mod, attr, None)]
+
+
+def is_dead_boolean(mod):
+    if mod.type != 'BOOLEAN':
+        return False
+
+    operand = mod.collection if mod.operand_type == 'COLLECTION' else mod.object
+
+    return not mod.show_viewport or operand is None
+
+
+def find_reachable_objects(util_objects):
+    # Every non-utility object is a root; utilities are only kept alive by a
+    # reachable object's modifiers, constraints or children, so chains of
+    # utilities are resolved in a single pass.
+    util_names = {obj.name for obj in util_objects}
+
+    reachable = set()
+    dead_mods = []
+    stack = [obj for obj in bpy.data.objects if obj.name not in util_names]
+
+    while stack:
+        obj = stack.pop()
+
+        if obj.name in reachable:
+            continue
+
+        reachable.add(obj.name)
+
+        if obj.parent:
+            stack.append(obj.parent)
+
+        for mod in obj.modifiers:
+            if is_dead_boolean(mod):
+                dead_mods.append((obj, mod))
+                continue
+
+            stack.extend(get_modifier_references(mod))
+
+        for constraint in obj.constraints:
+            target = getattr(constraint, 'target', None)
+            if target:
+                stack.append(target)
+
+    return (reachable, dead_mods)
+
+
+def remove_util_objects(objects):
+    orphaned_data = []
+
+    for obj in objects:
+        if obj.type in util_data and obj.data:
+            orphaned_data.append((obj.type, obj.data))
+
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    for data_type, data in orphaned_data:
+        if data.users == 0:
+            getattr(bpy.data, util_data[data_type]).remove(data)
+
+
+def estimate_data_size(data):
+    if isinstance(data, bpy.types.Mesh):
+        return len(data.vertices) * 16 + len(data.edges) * 8 + len(data.loops) * 8 + len(data.polygons) * 12
+
+    if isinstance(data, bpy.types.Lattice):
+        return len(data.points) * 24
+
+    return 0
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return "{0:.1f} {1}".format(size, unit)
+        size /= 1024
+
+    return "{0:.1f} GB".format(size)
 
     
 def register():
@@ -20,7 +20,7 @@
 
 import bpy
 from math import radians
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers
 
 
 class ND_OT_decimate(bpy.types.Operator):
@@ -39,7 +39,7 @@ CTRL — Remove existing modifiers"""
 
     def invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND SD')
+            remove_nd_modifiers(context.selected_objects, 'nd.decimate')
             return {'FINISHED'}
 
         for obj in context.selected_objects:
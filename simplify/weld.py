@@ -19,7 +19,7 @@
 # ---
 
 import bpy
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers
 
 
 class ND_OT_weld(bpy.types.Operator):
@@ -38,7 +38,7 @@ CTRL — Remove existing modifiers"""
 
     def invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND SW')
+            remove_nd_modifiers(context.selected_objects, 'nd.weld')
             return {'FINISHED'}
 
         for obj in context.selected_objects:
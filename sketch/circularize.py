@@ -22,10 +22,11 @@ import bpy
 import bmesh
 from math import radians
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with
+from .. lib.modifiers import new_modifier, remove_nd_modifiers, remove_modifiers
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 mod_bevel = "Bevel — ND CIRC"
@@ -46,10 +47,10 @@ class ND_OT_circularize(bpy.types.Operator):
 
         segment_factor = 1 if self.key_shift else 2
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -57,7 +58,7 @@ class ND_OT_circularize(bpy.types.Operator):
             
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -84,12 +85,12 @@ class ND_OT_circularize(bpy.types.Operator):
                 self.segments = max(2, self.segments - segment_factor)
                 self.dirty = True
 
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
         
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if get_preferences().enable_mouse_values:
@@ -107,7 +108,7 @@ class ND_OT_circularize(bpy.types.Operator):
 
     def invoke(self, context, event):
         if event.ctrl:
-            remove_modifiers_ending_with(context.selected_objects, ' — ND CIRC')
+            remove_nd_modifiers(context.selected_objects, 'nd.circularize')
 
             return {'FINISHED'}
 
@@ -120,9 +121,8 @@ class ND_OT_circularize(bpy.types.Operator):
 
         self.target_object = context.active_object
 
-        mods = context.active_object.modifiers
-        mod_names = list(map(lambda x: x.name, mods))
-        previous_op = all(m in mod_names for m in mod_summon_list)
+        mods = get_nd_modifiers(context.active_object)
+        previous_op = all(m in mods for m in mod_summon_list)
 
         if previous_op:
             self.summon_old_operator(context, mods)
@@ -213,7 +213,7 @@ class ND_OT_circularize(bpy.types.Operator):
             self.bevel.segments = self.segments_prev
 
         if not self.summoned:
-            bpy.ops.object.modifier_remove(modifier=self.bevel.name)
+            remove_modifiers(context.active_object, [self.bevel])
 
         unregister_draw_handler()
 
@@ -20,6 +20,7 @@
 
 import bpy
 import bmesh
+from .. lib.selection import has_selected_verts
 
 
 class ND_OT_clear_vgs(bpy.types.Operator):
@@ -31,9 +32,7 @@ class ND_OT_clear_vgs(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        if context.mode == 'EDIT_MESH':
-            mesh = bmesh.from_edit_mesh(context.active_object.data)
-            return len([vert for vert in mesh.verts if vert.select]) >= 1
+        return has_selected_verts(context)
 
 
     def execute(self, context):
@@ -19,12 +19,12 @@
 # ---
 
 import bpy
-import bmesh
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_hint, draw_property, draw_hint
 from .. lib.viewport import set_3d_cursor
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.preferences import get_preferences
 from .. lib.objects import create_duplicate_liftable_geometry
+from .. lib.selection import get_selection_summary
 
 
 class ND_OT_geo_lift(bpy.types.Operator):
@@ -38,10 +38,10 @@ SHIFT — Do not clean duplicate mesh before extraction"""
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -64,10 +64,10 @@ SHIFT — Do not clean duplicate mesh before extraction"""
         elif get_preferences().enable_experimental_features and pressed(event, {'C'}):
             return {'PASS_THROUGH'}
 
-        elif self.key_confirm_alternative:
+        elif self.key_actions & Action.CONFIRM_ALTERNATIVE:
             return self.finish(context)
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.clean_up(context)
 
             return {'CANCELLED'}
@@ -92,7 +92,7 @@ SHIFT — Do not clean duplicate mesh before extraction"""
             self.selection_type = 2
             self.set_selection_mode(context)
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if self.dirty:
@@ -147,11 +147,7 @@ SHIFT — Do not clean duplicate mesh before extraction"""
 
 
     def has_invalid_selection(self, context):
-        mesh = bmesh.from_edit_mesh(context.active_object.data)
-
-        selected_vertices = len([v for v in mesh.verts if v.select])
-        selected_edges = len([e for e in mesh.edges if e.select])
-        selected_faces = len([f for f in mesh.faces if f.select])
+        selected_vertices, selected_edges, selected_faces = get_selection_summary(context.active_object)[:3]
 
         if self.selection_type == 0:
             return selected_vertices < 1
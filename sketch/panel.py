@@ -29,6 +29,7 @@ from .. lib.preferences import get_preferences
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
 from .. lib.objects import create_duplicate_liftable_geometry
+from .. lib.selection import get_selection_summary
 
 
 class ND_OT_panel(BaseOperator):
@@ -216,10 +217,7 @@ SHIFT — Do not clean duplicate mesh before extraction"""
 
 
     def has_valid_selection(self, context):
-        mesh = bmesh.from_edit_mesh(context.active_object.data)
-        selected_faces = len([f for f in mesh.faces if f.select])
-        
-        return selected_faces > 0
+        return get_selection_summary(context.active_object).faces > 0
 
 
     def finish(self, context):
@@ -27,7 +27,9 @@ from .. lib.objects import add_single_vertex_object, align_object_to_3d_cursor
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream
-from .. lib.modifiers import new_modifier
+from .. lib.modifiers import new_modifier, move_modifier
+from .. lib.modifier_registry import get_nd_modifiers
+from .. lib.recall import get_recall_state, set_recall_state
 
 
 mod_displace = "Radius — ND RCP"
@@ -134,9 +136,8 @@ class ND_OT_recon_poly(BaseOperator):
         self.width_input_stream = new_stream()
 
         if len(context.selected_objects) == 1:
-            mods = context.active_object.modifiers
-            mod_names = list(map(lambda x: x.name, mods))
-            previous_op = all(m in mod_names for m in mod_summon_list)
+            mods = get_nd_modifiers(context.active_object)
+            previous_op = all(m in mods for m in mod_summon_list)
 
             if previous_op:
                 self.summon_old_operator(context, mods)
@@ -194,33 +195,24 @@ class ND_OT_recon_poly(BaseOperator):
 
         self.segments_prev = self.segments = self.screwZ.steps
 
-        computed_inner_radius = self.displace.strength
-        try:
-            computed_inner_radius = float(bpy.data.objects[self.obj.name]["NDRCP_inner_radius"])
-        except:
-            pass
-        self.inner_radius_prev = self.inner_radius = computed_inner_radius
-        
-        computed_width = self.screwX.screw_offset
-        try:
-            computed_width = float(bpy.data.objects[self.obj.name]["NDRCP_width"])
-        except:
-            pass
-        self.width_prev = self.width = computed_width
-        
-        computed_natural_rotation = False
-        try:
-            computed_natural_rotation = bool(bpy.data.objects[self.obj.name]["NDRCP_natural_rotation"])
-        except:
-            pass
-        self.natural_rotation_prev = self.natural_rotation = computed_natural_rotation
-
-        computed_inscribed = get_preferences().recon_poly_inscribed
-        try:
-            computed_inscribed = bool(bpy.data.objects[self.obj.name]["NDRCP_inscribed"])
-        except:
-            pass
-        self.inscribed_prev = self.inscribed = computed_inscribed
+        recall = get_recall_state(
+            self.obj,
+            'recon_poly',
+            inner_radius=self.displace.strength,
+            width=self.screwX.screw_offset,
+            natural_rotation=False,
+            inscribed=get_preferences().recon_poly_inscribed)
+
+        if recall is not None:
+            self.inner_radius_prev = self.inner_radius = recall.inner_radius
+            self.width_prev = self.width = recall.width
+            self.natural_rotation_prev = self.natural_rotation = recall.natural_rotation
+            self.inscribed_prev = self.inscribed = recall.inscribed
+        else:
+            self.inner_radius_prev = self.inner_radius = self.displace.strength
+            self.width_prev = self.width = self.screwX.screw_offset
+            self.natural_rotation_prev = self.natural_rotation = False
+            self.inscribed_prev = self.inscribed = get_preferences().recon_poly_inscribed
 
         self.rotation_snapshot = self.obj.rotation_euler.copy()
         self.rotation_prev = self.obj.rotation_euler.copy()
@@ -278,15 +270,14 @@ class ND_OT_recon_poly(BaseOperator):
         all_mods = self.obj.modifiers.values()
         decimate_index = all_mods.index(self.screwZ) + 1
 
-        while self.obj.modifiers[decimate_index].name != self.decimate.name:
-            bpy.ops.object.modifier_move_up(modifier=self.decimate.name)
+        move_modifier(self.obj, self.decimate.name, decimate_index)
 
 
     def try_remove_decimate_modifier(self, context):
         self.had_decimate_mod = False
 
         try:
-            mod = context.active_object.modifiers[mod_decimate]
+            mod = get_nd_modifiers(context.active_object)[mod_decimate]
             context.active_object.modifiers.remove(mod)
             self.had_decimate_mod = True
         except:
@@ -310,10 +301,13 @@ class ND_OT_recon_poly(BaseOperator):
 
 
     def operate(self, context):
-        bpy.data.objects[self.obj.name]["NDRCP_natural_rotation"] = self.natural_rotation
-        bpy.data.objects[self.obj.name]["NDRCP_inscribed"] = self.inscribed
-        bpy.data.objects[self.obj.name]["NDRCP_width"] = self.width
-        bpy.data.objects[self.obj.name]["NDRCP_inner_radius"] = self.inner_radius
+        set_recall_state(
+            self.obj,
+            'recon_poly',
+            natural_rotation=self.natural_rotation,
+            inscribed=self.inscribed,
+            width=self.width,
+            inner_radius=self.inner_radius)
 
         self.screwX.screw_offset = self.computed_width()
         self.displace.strength = self.computed_inner_radius()
@@ -361,10 +355,13 @@ class ND_OT_recon_poly(BaseOperator):
             self.screwZ.render_steps = self.segments_prev
             self.obj.rotation_euler = self.rotation_prev
 
-            bpy.data.objects[self.obj.name]["NDRCP_natural_rotation"] = self.natural_rotation_prev
-            bpy.data.objects[self.obj.name]["NDRCP_inscribed"] = self.inscribed_prev
-            bpy.data.objects[self.obj.name]["NDRCP_width"] = self.width_prev
-            bpy.data.objects[self.obj.name]["NDRCP_inner_radius"] = self.inner_radius_prev
+            set_recall_state(
+                self.obj,
+                'recon_poly',
+                natural_rotation=self.natural_rotation_prev,
+                inscribed=self.inscribed_prev,
+                width=self.width_prev,
+                inner_radius=self.inner_radius_prev)
             
         unregister_draw_handler()
 
@@ -24,8 +24,9 @@ from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, tog
 from .. lib.math import v3_average, create_rotation_matrix_from_vertex, create_rotation_matrix_from_edge, create_rotation_matrix_from_face, v3_center
 from .. lib.viewport import set_3d_cursor
 from .. lib.preferences import get_preferences
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.objects import create_duplicate_liftable_geometry
+from .. lib.selection import get_selection_summary
 
 
 class ND_OT_view_align(bpy.types.Operator):
@@ -40,10 +41,10 @@ ALT — Skip geometry selection and use the active object"""
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -51,7 +52,7 @@ ALT — Skip geometry selection and use the active object"""
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.clean_up(context)
 
             return {'CANCELLED'}
@@ -88,13 +89,13 @@ ALT — Skip geometry selection and use the active object"""
             self.selection_type = 2
             self.set_selection_mode(context)
 
-        elif self.key_confirm_alternative:
+        elif self.key_actions & Action.CONFIRM_ALTERNATIVE:
             return self.finish(context)
 
         elif self.key_left_click:
             return {'PASS_THROUGH'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if self.dirty:
@@ -180,7 +181,7 @@ ALT — Skip geometry selection and use the active object"""
         world_matrix = context.active_object.matrix_world
 
         if self.selection_type == 0:
-            selected_vertices = len([v for v in mesh.verts if v.select])
+            selected_vertices = get_selection_summary(context.active_object).verts
             if selected_vertices == 3:
                 bpy.ops.mesh.edge_face_add()
                 context.tool_settings.mesh_select_mode = (False, False, True)
@@ -203,11 +204,7 @@ ALT — Skip geometry selection and use the active object"""
 
 
     def has_invalid_selection(self, context):
-        mesh = bmesh.from_edit_mesh(context.active_object.data)
-
-        selected_vertices = len([v for v in mesh.verts if v.select])
-        selected_edges = len([e for e in mesh.edges if e.select])
-        selected_faces = len([f for f in mesh.faces if f.select])
+        selected_vertices, selected_edges, selected_faces = get_selection_summary(context.active_object)[:3]
 
         if self.selection_type == 0:
             return selected_vertices != 1 and selected_vertices != 3
@@ -222,11 +219,7 @@ ALT — Skip geometry selection and use the active object"""
     def determine_selection_type(self, context):
         self.selection_type = 0
 
-        mesh = bmesh.from_edit_mesh(context.active_object.data)
-
-        selected_vertices = len([v for v in mesh.verts if v.select])
-        selected_edges = len([e for e in mesh.edges if e.select])
-        selected_faces = len([f for f in mesh.faces if f.select])
+        selected_vertices, selected_edges, selected_faces = get_selection_summary(context.active_object)[:3]
 
         if selected_vertices >= 1 and selected_faces == 0 and selected_edges == 0:
             return
@@ -20,10 +20,12 @@
 
 import importlib
 from . import cycle
+from . import profile_modifiers
 
 
 registerables = (
     cycle,
+    profile_modifiers,
 )
 
 
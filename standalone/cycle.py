@@ -21,9 +21,10 @@
 import bpy
 import bmesh
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
+from .. lib.events import capture_modifier_keys, pressed, Action
 from .. lib.collections import hide_utils_collection, isolate_in_utils_collection
 from .. lib.preferences import get_preferences
+from .. lib.stack_profiler import profile_modifier_stack, restamp_stack_profile, format_modifier_cost
 
 
 class ND_OT_cycle(bpy.types.Operator):
@@ -37,10 +38,10 @@ SHIFT — Cycle through the modifier stack"""
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -48,7 +49,7 @@ SHIFT — Cycle through the modifier stack"""
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -89,12 +90,12 @@ SHIFT — Cycle through the modifier stack"""
                 self.util_current_index = (self.util_current_index - 1) % self.util_count
                 self.dirty = True
         
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         if get_preferences().enable_mouse_values:
@@ -127,6 +128,7 @@ SHIFT — Cycle through the modifier stack"""
         self.mod_snapshot = [mod.show_viewport for mod in self.target_obj.modifiers]
         
         self.frozen_utils = set(())
+        self.mod_costs = None
 
         self.util_mods = [mod for mod in self.target_obj.modifiers if mod.type == 'BOOLEAN' and mod.object]
         self.util_mod_names = [mod.name for mod in self.util_mods]
@@ -212,6 +214,9 @@ SHIFT — Cycle through the modifier stack"""
         self.target_obj.select_set(True)
         context.view_layer.objects.active = self.target_obj
 
+        if self.mod_costs is None:
+            self.mod_costs = profile_modifier_stack(context, self.target_obj)
+
         self.mod_current_index = -1
 
         for mod in self.target_obj.modifiers:
@@ -228,6 +233,7 @@ SHIFT — Cycle through the modifier stack"""
     def finish(self, context):
         if self.mod_cycle:
             self.revert_mods(context)
+            restamp_stack_profile(context, self.target_obj)
 
         if self.util_count > 0:
             bpy.ops.object.select_all(action='DESELECT')
@@ -249,9 +255,23 @@ SHIFT — Cycle through the modifier stack"""
         self.revert_mods(context)
         self.target_obj.show_wire = self.show_wireframe_prev
 
+        if self.mod_costs is not None:
+            restamp_stack_profile(context, self.target_obj)
+
         unregister_draw_handler()
 
 
+def get_slowest_modifier(costs):
+    enabled = [cost for cost in costs if cost.time is not None]
+
+    if not enabled:
+        return "None"
+
+    slowest = max(enabled, key=lambda cost: cost.time)
+
+    return "{0} ({1:.1f}ms)".format(slowest.name, slowest.time * 1000)
+
+
 def draw_text_callback(self):
     draw_header(self)
 
@@ -264,6 +284,11 @@ def draw_text_callback(self):
                 active=True,
                 mouse_value=True,
                 alt_mode=False)
+
+            draw_hint(
+                self,
+                "Cost: {0}".format("N/A" if self.mod_current_index == -1 else format_modifier_cost(self.mod_costs[self.mod_current_index])),
+                "Slowest: {0}".format(get_slowest_modifier(self.mod_costs)))
         else:
             draw_hint(self, "Whoops", "Looks like there are no modifiers to view.")
     else:
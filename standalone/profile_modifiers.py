@@ -0,0 +1,78 @@
+# ███╗   ██╗██████╗ 
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝ 
+# 
+# “Commons Clause” License Condition v1.0
+# 
+# See LICENSE for license details. If you did not receive a copy of the license,
+# it may be obtained at https://github.com/hugemenace/nd/blob/main/LICENSE.
+# 
+# Software: ND Blender Addon
+# License: MIT
+# Licensor: T.S. & I.J. (HugeMenace)
+# 
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from .. lib.stack_profiler import profile_modifier_stack
+
+
+class ND_OT_profile_modifiers(bpy.types.Operator):
+    bl_idname = "nd.profile_modifiers"
+    bl_label = "Profile Modifiers"
+    bl_description = """Measure the evaluation cost of each modifier on the active object
+SHIFT — Profile all selected objects"""
+    bl_options = {'UNDO'}
+
+
+    @classmethod
+    def poll(cls, context):
+        if context.mode == 'OBJECT':
+            return context.active_object is not None and context.active_object.type == 'MESH'
+
+
+    def execute(self, context):
+        objects = [context.active_object]
+
+        if self.all_selected:
+            objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+        total_time = 0
+        slowest = None
+
+        for obj in objects:
+            for cost in profile_modifier_stack(context, obj):
+                if cost.time is None:
+                    continue
+
+                total_time += cost.time
+
+                if slowest is None or cost.time > slowest[1].time:
+                    slowest = (obj, cost)
+
+        if slowest:
+            obj, cost = slowest
+            self.report({'INFO'}, "Modifier stacks: {0:.1f}ms total, slowest is {1} on {2} ({3:.1f}ms)".format(total_time * 1000, cost.name, obj.name, cost.time * 1000))
+        else:
+            self.report({'INFO'}, "No enabled modifiers to profile")
+
+        return {'FINISHED'}
+
+
+    def invoke(self, context, event):
+        self.all_selected = event.shift
+
+        return self.execute(context)
+
+
+def register():
+    bpy.utils.register_class(ND_OT_profile_modifiers)
+
+
+def unregister():
+    bpy.utils.unregister_class(ND_OT_profile_modifiers)
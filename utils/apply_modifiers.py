@@ -19,7 +19,9 @@
 # ---
 
 import bpy
-import bmesh
+from .. lib.modifiers import apply_modifiers
+from .. lib.objects import clear_edge_bevel_weights
+from .. lib.modifier_registry import get_modifier_tags
 
 
 class ND_OT_apply_modifiers(bpy.types.Operator):
@@ -39,10 +41,12 @@ SHIFT — Hard apply (apply all modifiers)"""
     def execute(self, context):
         bpy.ops.object.make_single_user(object=True, obdata=True, material=False, animation=False, obdata_animation=False)
 
+        stacks = [self.collapse_modifiers(obj) for obj in context.selected_objects]
+        apply_modifiers(context, stacks)
+
         for obj in context.selected_objects:
-            self.collapse_modifiers(obj)
-            self.remove_vertex_groups(obj)
-            self.remove_edge_weights(obj)
+            obj.vertex_groups.clear()
+            clear_edge_bevel_weights(obj.data)
 
         return {'FINISHED'}
 
@@ -57,6 +61,7 @@ SHIFT — Hard apply (apply all modifiers)"""
         safe_mod_types = ['WEIGHTED_NORMAL', 'TRIANGULATE', 'NODES']
         
         mods = [mod for mod in obj.modifiers]
+        tags = get_modifier_tags(obj)
         mods_to_apply = []
         mods_to_remove = []
 
@@ -71,10 +76,12 @@ SHIFT — Hard apply (apply all modifiers)"""
                 if mod.type in safe_mod_types:
                     continue
 
-                if "— ND WNB" in mod.name:
+                tag = tags.get(mod.name)
+
+                if tag and tag.operator == 'nd.weighted_normal_bevel':
                     continue
 
-                if skip_weld and mod.type == 'WELD' and "— ND B" in mod.name:
+                if skip_weld and tag and (tag.operator, tag.role) == ('nd.bevel', 'weld'):
                     skip_weld = False
                     continue
 
@@ -88,35 +95,7 @@ SHIFT — Hard apply (apply all modifiers)"""
                 else:
                     mods_to_apply.append(mod.name)
 
-        for mod_name in mods_to_apply:
-            try:
-                bpy.ops.object.modifier_apply({'object': obj}, modifier=mod_name)
-            except:
-                # If the modifier is disabled, just remove it.
-                bpy.ops.object.modifier_remove({'object': obj}, modifier=mod_name)
-
-        for mod_name in mods_to_remove:
-            bpy.ops.object.modifier_remove({'object': obj}, modifier=mod_name)
-
-
-    def remove_vertex_groups(self, obj):
-        vertex_groups = obj.vertex_groups.values()
-        for vg in vertex_groups:
-            obj.vertex_groups.remove(vg)
-
-
-    def remove_edge_weights(self, obj):
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-
-        bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
-
-        edges = list(bm.edges)
-        for edge in edges:
-            edge[bevel_weight_layer] = 0
-
-        bm.to_mesh(obj.data)
-        bm.free()
+        return (obj, mods_to_apply, mods_to_remove)
 
 
 def register():
@@ -22,6 +22,7 @@ import bpy
 from mathutils import Vector
 from .. lib.objects import set_origin
 from .. lib.modifiers import new_modifier
+from .. lib.modifier_registry import get_nd_modifiers
 
 
 class ND_OT_set_origin(bpy.types.Operator):
@@ -84,7 +85,7 @@ SHIFT — Undo faux origin translation"""
     def revert_faux_origin(self, context):
         location = context.active_object.location.copy()
 
-        mods = [mod for mod in context.active_object.modifiers if mod.type == 'DISPLACE' and mod.name.endswith('— ND FO')]
+        mods = [mod for mod in get_nd_modifiers(context.active_object, 'nd.set_origin').values() if mod.type == 'DISPLACE']
         for mod in mods:
             if mod.direction == 'X':
                 location.x = mod.strength
@@ -19,13 +19,12 @@
 # ---
 
 import bpy
-import bmesh
-from numpy.linalg import norm
 from bpy_extras.view3d_utils import region_2d_to_vector_3d, region_2d_to_origin_3d
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
-from .. lib.events import capture_modifier_keys, pressed
-from .. lib.points import init_points, register_points_handler, unregister_points_handler
-from .. lib.math import v3_average, v3_distance, create_rotation_matrix_from_vertex, create_rotation_matrix_from_edge, create_rotation_matrix_from_face
+from .. lib.events import capture_modifier_keys, pressed, Action
+from .. lib.points import init_points, set_points, register_points_handler, unregister_points_handler
+from .. lib.math import v3_average
+from .. lib.snapping import init_snap_points, update_snap_view, find_snap_points, build_snap_bvh, ray_cast_snap_bvh, get_snap_point
 
 
 class ND_OT_snap_align(bpy.types.Operator):
@@ -38,10 +37,10 @@ class ND_OT_snap_align(bpy.types.Operator):
     def modal(self, context, event):
         capture_modifier_keys(self, event)
 
-        if self.key_toggle_operator_passthrough:
+        if self.key_actions & Action.TOGGLE_OPERATOR_PASSTHROUGH:
             toggle_operator_passthrough(self)
 
-        elif self.key_toggle_pin_overlay:
+        elif self.key_actions & Action.TOGGLE_PIN_OVERLAY:
             toggle_pin_overlay(self, event)
 
         elif self.operator_passthrough:
@@ -49,7 +48,7 @@ class ND_OT_snap_align(bpy.types.Operator):
 
             return {'PASS_THROUGH'}
 
-        elif self.key_cancel:
+        elif self.key_actions & Action.CANCEL:
             self.revert(context)
 
             return {'CANCELLED'}
@@ -59,24 +58,24 @@ class ND_OT_snap_align(bpy.types.Operator):
                 self.capture_points.append(self.snap_point)
 
                 if len(self.capture_points) == 1:
-                    self.guide_line = (self.capture_points[0][0], self.reference_obj.location)
+                    set_points(self, 'guide_line', (self.capture_points[0][0], self.reference_obj.location))
                 else:
-                    self.guide_line = (self.capture_points[0][0], self.capture_points[1][0])
+                    set_points(self, 'guide_line', (self.capture_points[0][0], self.capture_points[1][0]))
 
                 self.dirty = True
 
         elif pressed(event, {'R'}):
             self.capture_points = []
-            self.guide_line = ()
+            set_points(self, 'guide_line', ())
                 
             self.dirty = True
 
-        elif self.key_confirm:
+        elif self.key_actions & Action.CONFIRM:
             self.finish(context)
 
             return {'FINISHED'}
 
-        elif self.key_movement_passthrough:
+        elif self.key_actions & Action.MOVEMENT_PASSTHROUGH:
             return {'PASS_THROUGH'}
 
         elif event.type == 'MOUSEMOVE':
@@ -95,11 +94,10 @@ class ND_OT_snap_align(bpy.types.Operator):
         self.dirty = False
         self.hit_location = None
         self.capture_points = []
-        self.primary_points = []
-        self.secondary_points = []
-        self.tertiary_points = []
         self.snap_point = None
 
+        init_points(self)
+
         a, b = context.selected_objects
         self.reference_obj = a if a.name != context.active_object.name else b
         self.reference_obj_original_location = self.reference_obj.location.copy()
@@ -114,34 +112,8 @@ class ND_OT_snap_align(bpy.types.Operator):
         depsgraph = context.evaluated_depsgraph_get()
         object_eval = context.active_object.evaluated_get(depsgraph)
 
-        bm = bmesh.new()
-        bm.from_mesh(object_eval.data)
-        
-        world_matrix = context.active_object.matrix_world
-
-        vert_points = []
-        for vert in bm.verts:
-            vert_matrix = create_rotation_matrix_from_vertex(world_matrix, vert)
-            vert_points.append((world_matrix @ vert.co, vert_matrix))
-
-        edge_points = []
-        edge_lengths = []
-        for edge in bm.edges:
-            edge_matrix = create_rotation_matrix_from_edge(world_matrix, edge)
-            edge_points.append((world_matrix @ v3_average([v.co for v in edge.verts]), edge_matrix))
-            edge_lengths.append(v3_distance(world_matrix @ edge.verts[0].co, world_matrix @ edge.verts[1].co))
-
-        face_points = []
-        for face in bm.faces:
-            face_matrix = create_rotation_matrix_from_face(world_matrix, face)
-            face_points.append((world_matrix @ face.calc_center_median(), face_matrix))
-
-        average_edge_length = sum(edge_lengths) / len(edge_lengths)
-        self.snap_distance_factor = average_edge_length / 2.0
-
-        self.points_cache = vert_points + edge_points + face_points
-
-        bm.free()
+        init_snap_points(self, object_eval.data, context.active_object.matrix_world)
+        self.snap_bvh = build_snap_bvh(context.active_object, depsgraph)
 
         self.operate(context)
 
@@ -150,7 +122,6 @@ class ND_OT_snap_align(bpy.types.Operator):
         init_overlay(self, event)
         register_draw_handler(self, draw_text_callback)
 
-        init_points(self)
         register_points_handler(self)
 
         context.window_manager.modal_handler_add(self)
@@ -165,16 +136,16 @@ class ND_OT_snap_align(bpy.types.Operator):
 
     
     def operate(self, context):
-        self.tertiary_points = [cap[0] for cap in self.capture_points]
+        set_points(self, 'tertiary_points', [cap[0] for cap in self.capture_points])
 
         if len(self.capture_points) == 2:
-            self.primary_points = []
-            self.secondary_points = []
+            set_points(self, 'primary_points', [])
+            set_points(self, 'secondary_points', [])
 
             self.reference_obj.rotation_euler = self.capture_points[0][1].to_euler()
             mid_point = v3_average([self.capture_points[0][0], self.capture_points[1][0]])
             self.reference_obj.location = mid_point
-            self.tertiary_points.append(mid_point)
+            set_points(self, 'tertiary_points', self.tertiary_points + [mid_point])
 
         elif self.snap_point:
             vect, rotation_matrix = self.snap_point
@@ -187,6 +158,11 @@ class ND_OT_snap_align(bpy.types.Operator):
         elif self.hit_location:
             self.reference_obj.location = self.hit_location
 
+        # The guide line follows the reference object until a second point is
+        # captured, so it must be re-set whenever the object moves.
+        if len(self.capture_points) == 1:
+            set_points(self, 'guide_line', (self.capture_points[0][0], self.reference_obj.location.copy()))
+
         self.dirty = False
 
 
@@ -194,50 +170,40 @@ class ND_OT_snap_align(bpy.types.Operator):
         if len(self.capture_points) == 2:
             return
 
-        self.reference_obj.hide_set(True)
-
         region = context.region
         region_data = context.space_data.region_3d
 
         view_vector = region_2d_to_vector_3d(region, region_data, mouse_coords)
         ray_origin = region_2d_to_origin_3d(region, region_data, mouse_coords)
 
-        ray_target = ray_origin + view_vector
-        ray_direction = ray_target - ray_origin
+        location = ray_cast_snap_bvh(self.snap_bvh, ray_origin, view_vector)
 
-        depsgraph = context.evaluated_depsgraph_get()
+        if location is not None:
+            update_snap_view(self, region_data)
 
-        hit, location, normal, face_index, object, matrix = context.scene.ray_cast(depsgraph, ray_origin, ray_direction)
-        hidden_objects = []
-        while hit and object.name != context.active_object.name:
-            hidden_objects.append(object)
-            object.hide_set(True)
-            hit, location, normal, face_index, object, matrix = context.scene.ray_cast(depsgraph, location + 0.001 * ray_direction, ray_direction)
+            self.hit_location = location
 
-        for obj in hidden_objects:
-            obj.hide_set(False)
+            snap_distance = 0.2 * self.snap_distance_factor
+            secondary_distance = 0.8 * self.snap_distance_factor
 
-        if hit:
-            self.hit_location = location
+            points = find_snap_points(self, location, secondary_distance)
 
-            self.primary_points = []
-            self.secondary_points = []
-            snap_points = []
-            for (vect, rotation_matrix) in self.points_cache:
-                if v3_distance(vect, location) <= (0.2 * self.snap_distance_factor):
-                    snap_points.append((vect, rotation_matrix))
-                elif v3_distance(vect, location) <= (0.8 * self.snap_distance_factor):
-                    self.secondary_points.append(vect)
-            
-            snap_points.sort(key=lambda p: v3_distance(p[0], location))
-            self.snap_point = snap_points[0] if snap_points else None
-            self.primary_points = [self.snap_point[0]] if self.snap_point else []
+            # Ordered by index so that an unchanged neighbourhood compares equal
+            # and its batch is kept.
+            in_range = sorted((index, co) for co, index, distance in points if distance > snap_distance)
+            set_points(self, 'secondary_points', [co for index, co in in_range])
+
+            nearest = min(points, key=lambda point: point[2], default=None)
+            if nearest is not None and nearest[2] <= snap_distance:
+                self.snap_point = get_snap_point(self, nearest[1])
+            else:
+                self.snap_point = None
+
+            set_points(self, 'primary_points', [self.snap_point[0]] if self.snap_point else [])
         else:
             self.hit_location = None
-            self.primary_points = []
-            self.secondary_points = []
-        
-        self.reference_obj.hide_set(False)
+            set_points(self, 'primary_points', [])
+            set_points(self, 'secondary_points', [])
 
         self.dirty = True
         self.operate(context)
@@ -19,7 +19,7 @@
 # ---
 
 import bpy
-from .. lib.preferences import get_preferences
+from .. lib.preferences import get_addon_preferences
 
 
 class ND_OT_toggle_custom_view(bpy.types.Operator):
@@ -34,7 +34,7 @@ class ND_OT_toggle_custom_view(bpy.types.Operator):
         "show_motion_paths", "show_object_origins", "show_object_origins_all", "show_ortho_grid",
         "show_outline_selected", "show_relationship_lines", "show_stats", "show_text"]
 
-        self.prefs = get_preferences()
+        self.prefs = get_addon_preferences()
         self.pref_keys = list(self.prefs.keys())
         self.overlay = bpy.context.space_data.overlay
 